@@ -0,0 +1,207 @@
+"""
+Simulates many 6 Nimmt! games in lockstep with NumPy arrays.
+
+Only players with fixed policies can be simulated this way, since every
+game in the batch makes its decisions with the same array operations:
+
+    - FIRST_CARD plays like DemoPlayer: cards are played in the order they
+      were dealt and stack 0 is picked up when no stack fits
+    - HIGHEST_CARD plays like Player in 4/remote/player_proxy.py: the
+      highest card is played and the stack with the fewest bull points is
+      picked up when no stack fits
+
+Cards are represented by their face value alone and bull points are looked
+up in a table indexed by face.
+"""
+
+import os
+import sys
+
+PATH_TO_PLAYER = '../../3/'
+sys.path.append(os.path.join(os.path.dirname(__file__), PATH_TO_PLAYER))
+
+import numpy as np
+
+from player import Card
+
+FIRST_CARD = 'first-card'
+HIGHEST_CARD = 'highest-card'
+
+POLICIES = [FIRST_CARD, HIGHEST_CARD]
+
+
+class BatchSimulator:
+    """simulates batches of games between players with fixed policies
+
+    mirrors Dealer: the same shuffled decks give the same points
+    """
+
+    CARDS_IN_HAND = 10
+    NUM_STACKS = 4
+    MAX_STACK_LEN = 5
+    LOSING_POINTS = -66
+
+    def __init__(self, policies, initial_deck=None, card_handout_order=None):
+        """creates a BatchSimulator
+
+        :param policies: policy of the player in each seat
+        :type policies: list of str
+
+        :param initial_deck: cards making up a deck
+        :type initial_deck: list of Card or None
+
+        :param card_handout_order: order in which cards are handed to players
+        :type card_handout_order: list of int or None
+        """
+
+        if len(policies) < 2 or len(policies) > 10:
+            raise ValueError('number of players must be in interval [2, 10]')
+
+        if any(policy not in POLICIES for policy in policies):
+            raise ValueError('unknown policy')
+
+        if initial_deck is None:
+            initial_deck = [Card(i, (i % 6) + 2) for i in range(1, 105)]
+
+        if card_handout_order is None:
+            card_handout_order = range(len(policies))
+
+        if sorted(card_handout_order) != list(range(len(policies))):
+            raise ValueError("card handout order must contain "
+                             "one and only one of each player name")
+
+        self._num_players = len(policies)
+        self._highest_card_seats = np.array(
+            [policy == HIGHEST_CARD for policy in policies])
+        self._card_handout_order = list(card_handout_order)
+
+        self._faces = np.array(sorted(card.face for card in initial_deck))
+        self._bulls = np.zeros(self._faces[-1] + 1, dtype=np.int64)
+        for card in initial_deck:
+            self._bulls[card.face] = card.bull
+
+    def simulate_games(self, num_games, rng=None):
+        """simulates complete games
+
+        :param num_games: number of games to simulate
+        :type num_games: int
+
+        :param rng: random generator used to shuffle the decks
+        :type rng: numpy.random.Generator or None
+
+        :returns: final points of every player, one row per game
+        :rtype: numpy.ndarray
+        """
+
+        if rng is None:
+            rng = np.random.default_rng()
+
+        points = np.zeros((num_games, self._num_players), dtype=np.int64)
+        playing = np.arange(num_games)
+
+        while playing.size:
+            decks = rng.permuted(
+                np.tile(self._faces, (playing.size, 1)), axis=1)
+            points[playing] += self.play_rounds(decks)
+
+            is_over = (points[playing] <= self.LOSING_POINTS).any(axis=1)
+            playing = playing[~is_over]
+
+        return points
+
+    def play_rounds(self, decks):
+        """plays a single round of every game
+
+        :param decks: shuffled face values, one row per game
+        :type decks: numpy.ndarray
+
+        :returns: points gained in the round, one row per game
+        :rtype: numpy.ndarray
+        """
+
+        decks = np.asarray(decks)
+        num_games = decks.shape[0]
+        games = np.arange(num_games)
+
+        hands = self._deal_hands(decks)
+
+        stacks_start = self._num_players * self.CARDS_IN_HAND
+        tops = decks[:, stacks_start:stacks_start + self.NUM_STACKS].copy()
+        lengths = np.ones_like(tops)
+        bull_sums = self._bulls[tops]
+
+        points = np.zeros((num_games, self._num_players), dtype=np.int64)
+
+        for turn in range(self.CARDS_IN_HAND):
+            discarded_cards = hands[:, :, turn]
+            placement_order = np.argsort(discarded_cards, axis=1)
+            ordered_cards = np.take_along_axis(
+                discarded_cards, placement_order, axis=1)
+
+            for cards, player_names in zip(ordered_cards.T, placement_order.T):
+                deltas = cards[:, None] - tops
+                is_smaller = deltas > 0
+                has_smaller = is_smaller.any(axis=1)
+
+                closest_smaller = np.where(
+                    is_smaller, deltas, np.iinfo(deltas.dtype).max
+                ).argmin(axis=1)
+
+                picked_stack = np.where(
+                    self._highest_card_seats[player_names],
+                    bull_sums.argmin(axis=1), 0)
+
+                chosen = np.where(has_smaller, closest_smaller, picked_stack)
+                takes_stack = (~has_smaller |
+                               (lengths[games, chosen] == self.MAX_STACK_LEN))
+
+                points[games, player_names] -= np.where(
+                    takes_stack, bull_sums[games, chosen], 0)
+
+                card_bulls = self._bulls[cards]
+                tops[games, chosen] = cards
+                lengths[games, chosen] = np.where(
+                    takes_stack, 1, lengths[games, chosen] + 1)
+                bull_sums[games, chosen] = np.where(
+                    takes_stack, card_bulls,
+                    bull_sums[games, chosen] + card_bulls)
+
+        return points
+
+    def _deal_hands(self, decks):
+        """deals every hand and orders it by the seat's policy
+
+        :param decks: shuffled face values, one row per game
+        :type decks: numpy.ndarray
+
+        :returns: cards in the order they are played, indexed by
+                  [game, player, turn]
+        :rtype: numpy.ndarray
+        """
+
+        hands = np.empty(
+            (decks.shape[0], self._num_players, self.CARDS_IN_HAND),
+            dtype=decks.dtype)
+
+        for i, player_name in enumerate(self._card_handout_order):
+            start = i * self.CARDS_IN_HAND
+            hands[:, player_name] = decks[:, start:start + self.CARDS_IN_HAND]
+
+        highest_first = -np.sort(-hands[:, self._highest_card_seats], axis=2)
+        hands[:, self._highest_card_seats] = highest_first
+
+        return hands
+
+    @staticmethod
+    def get_results(points):
+        """gets index numbers and points for players in increasing order
+
+        :param points: final points of a single game
+        :type points: numpy.ndarray
+
+        :returns: list of (player name, points), as Dealer.get_results
+        :rtype: list of (int, int)
+        """
+
+        return sorted(
+            [(i, int(p)) for i, p in enumerate(points)], key=lambda x: x[1])
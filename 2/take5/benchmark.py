@@ -0,0 +1,337 @@
+"""
+Benchmarks the hot paths of the Dealer.
+
+Every case times many calls and reports calls per second together with
+per-call latency percentiles. Results can be saved as JSON and compared
+against a saved baseline, failing when any case got slower than the
+baseline by more than a threshold.
+
+A BenchmarkResults is a JSON object mapping each case name to
+    {"calls": int, "per_sec": float, "mean": float,
+     "p50": float, "p90": float, "p99": float}
+where latencies are in microseconds.
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+import sys
+import time
+
+PATH_TO_PLAYER = '../../3/'
+sys.path.append(os.path.join(os.path.dirname(__file__), PATH_TO_PLAYER))
+
+from dealer import Dealer
+from player import Card, DemoPlayer
+
+DEFAULT_THRESHOLD = 0.10
+DEFAULT_SCALE = 1.0
+
+PERCENTILES = [50, 90, 99]
+
+
+def start_round(dealer):
+    """sets up a round the way play_round does, without playing it
+
+    :param dealer: dealer to set up
+    :type dealer: Dealer
+    """
+
+    dealer._deck = dealer._initial_deck[:]
+    dealer._random.shuffle(dealer._deck)
+
+    for player_name in dealer._card_handout_order:
+        dealer.players[player_name].set_hand(dealer.deal_hand())
+
+    dealer._stacks = dealer.get_new_stacks()
+
+
+def new_dealer(num_players, seed=0):
+    """creates a seeded dealer with demo players
+
+    :param num_players: number of players
+    :type num_players: int
+
+    :param seed: seed for the dealer
+    :type seed: int
+
+    :returns: dealer
+    :rtype: Dealer
+    """
+
+    return Dealer([DemoPlayer() for _ in range(num_players)], seed=seed)
+
+
+def bench_simulate_game(num_players):
+    """creates a case timing complete games
+
+    :param num_players: number of players in each game
+    :type num_players: int
+
+    :returns: case timing one game per call
+    :rtype: func: int -> list of float
+    """
+
+    def case(num_calls):
+        timings = []
+        for seed in range(num_calls):
+            dealer = new_dealer(num_players, seed)
+
+            start = time.perf_counter()
+            dealer.simulate_game()
+            timings.append(time.perf_counter() - start)
+
+        return timings
+
+    return case
+
+
+def bench_play_turn(num_calls):
+    """times play_turn with five players"""
+
+    timings = []
+    dealer = new_dealer(5)
+
+    while len(timings) < num_calls:
+        start_round(dealer)
+
+        while dealer.players_have_cards(dealer.players):
+            start = time.perf_counter()
+            dealer.play_turn()
+            timings.append(time.perf_counter() - start)
+
+    return timings[:num_calls]
+
+
+def bench_add_all_cards_to_stacks(num_calls):
+    """times add_all_cards_to_stacks with five players"""
+
+    timings = []
+    dealer = new_dealer(5)
+
+    while len(timings) < num_calls:
+        start_round(dealer)
+
+        while dealer.players_have_cards(dealer.players):
+            discarded_cards = dealer.get_discarded_cards()
+
+            start = time.perf_counter()
+            dealer.add_all_cards_to_stacks(discarded_cards)
+            timings.append(time.perf_counter() - start)
+
+    return timings[:num_calls]
+
+
+def bench_get_closest_smaller_card(num_calls):
+    """times get_closest_smaller_card against freshly dealt boards"""
+
+    cards_per_board = 100
+    rand = random.Random(0)
+    dealer = new_dealer(2)
+    get_closest_smaller_card = dealer.get_closest_smaller_card
+
+    timings = []
+    while len(timings) < num_calls:
+        start_round(dealer)
+        board = dealer._stacks
+        cards = [Card(rand.randint(1, 104), 2)
+                 for _ in range(cards_per_board)]
+
+        for card in cards:
+            start = time.perf_counter()
+            get_closest_smaller_card(card, board)
+            timings.append(time.perf_counter() - start)
+
+    return timings[:num_calls]
+
+
+def bench_deal_hand(num_calls):
+    """times dealing hands from a full deck"""
+
+    dealer = new_dealer(10)
+    hands_per_deck = len(dealer._initial_deck) // 10
+
+    timings = []
+    while len(timings) < num_calls:
+        dealer._deck = dealer._initial_deck[:]
+
+        for _ in range(hands_per_deck):
+            start = time.perf_counter()
+            dealer.deal_hand()
+            timings.append(time.perf_counter() - start)
+
+    return timings[:num_calls]
+
+
+CASES = [
+    ('simulate_game_2_players', bench_simulate_game(2), 200),
+    ('simulate_game_5_players', bench_simulate_game(5), 200),
+    ('simulate_game_10_players', bench_simulate_game(10), 100),
+    ('play_turn', bench_play_turn, 5000),
+    ('add_all_cards_to_stacks', bench_add_all_cards_to_stacks, 5000),
+    ('get_closest_smaller_card', bench_get_closest_smaller_card, 50000),
+    ('deal_hand', bench_deal_hand, 20000),
+]
+
+
+def percentile(sorted_values, pct):
+    """gets a percentile of sorted values by the nearest-rank method
+
+    :param sorted_values: values in increasing order
+    :type sorted_values: list of float
+
+    :param pct: percentile in the interval [0, 100]
+    :type pct: float
+
+    :returns: value at the percentile
+    :rtype: float
+    """
+
+    if not sorted_values:
+        raise ValueError('no values')
+
+    rank = max(math.ceil(pct * len(sorted_values) / 100), 1)
+    return sorted_values[rank - 1]
+
+
+def summarize(timings):
+    """summarizes the timings of a case
+
+    :param timings: seconds taken by each call
+    :type timings: list of float
+
+    :returns: summary of a single case, as in BenchmarkResults
+    :rtype: dict
+    """
+
+    sorted_timings = sorted(timings)
+    total = sum(timings)
+    micros = 1e6
+
+    summary = {
+        'calls': len(timings),
+        'per_sec': len(timings) / total if total else float('inf'),
+        'mean': total / len(timings) * micros,
+    }
+
+    for pct in PERCENTILES:
+        summary['p{}'.format(pct)] = percentile(sorted_timings, pct) * micros
+
+    return summary
+
+
+def run_benchmarks(scale=DEFAULT_SCALE, names=None):
+    """runs the benchmark cases
+
+    :param scale: multiplier for the number of calls of every case
+    :type scale: float
+
+    :param names: names of the cases to run, all cases if None
+    :type names: list of str or None
+
+    :returns: results of every case that was run
+    :rtype: BenchmarkResults
+    """
+
+    results = {}
+
+    for name, case, num_calls in CASES:
+        if names is not None and name not in names:
+            continue
+
+        results[name] = summarize(case(max(int(num_calls * scale), 1)))
+
+    return results
+
+
+def find_regressions(results, baseline, threshold=DEFAULT_THRESHOLD):
+    """finds cases whose median latency regressed against a baseline
+
+    cases missing from either results are ignored
+
+    :param results: current results
+    :type results: BenchmarkResults
+
+    :param baseline: saved results to compare against
+    :type baseline: BenchmarkResults
+
+    :param threshold: allowed relative slowdown, 0.1 allows 10% slower
+    :type threshold: float
+
+    :returns: (case name, baseline p50, current p50) for every regression
+    :rtype: list of (str, float, float)
+    """
+
+    regressions = []
+
+    for name, summary in sorted(results.items()):
+        if name not in baseline:
+            continue
+
+        baseline_p50 = baseline[name]['p50']
+        if summary['p50'] > baseline_p50 * (1 + threshold):
+            regressions.append((name, baseline_p50, summary['p50']))
+
+    return regressions
+
+
+def format_results(results):
+    """formats results as a printable table
+
+    :param results: results to format
+    :type results: BenchmarkResults
+
+    :returns: table with a header line and one line per case
+    :rtype: str
+    """
+
+    fmt = '{:<26} {:>8} {:>12} {:>10} {:>10} {:>10}'
+    lines = [fmt.format('case', 'calls', 'per sec', 'p50 us', 'p90 us',
+                        'p99 us')]
+
+    for name, s in results.items():
+        lines.append(fmt.format(
+            name, s['calls'], '{:.1f}'.format(s['per_sec']),
+            '{:.2f}'.format(s['p50']), '{:.2f}'.format(s['p90']),
+            '{:.2f}'.format(s['p99'])))
+
+    return '\n'.join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='benchmarks the hot paths of the dealer')
+    parser.add_argument('--scale', type=float, default=DEFAULT_SCALE,
+                        help='multiplier for the number of calls per case')
+    parser.add_argument('--case', action='append', dest='cases',
+                        help='case to run, may be repeated')
+    parser.add_argument('--save', help='file to save the results to')
+    parser.add_argument('--baseline', help='results file to compare against')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='allowed relative slowdown of the median')
+    args = parser.parse_args()
+
+    results = run_benchmarks(args.scale, args.cases)
+    print(format_results(results))
+
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+        regressions = find_regressions(results, baseline, args.threshold)
+        for name, baseline_p50, p50 in regressions:
+            print('REGRESSION {}: p50 {:.2f}us -> {:.2f}us'.format(
+                name, baseline_p50, p50))
+
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,234 @@
+from bisect import bisect_left, insort
+from collections.abc import Sequence
+
+
+class StackView(Sequence):
+    """read-only view of a single stack on a StackBoard
+
+    behaves like the list of Card players have always been given: cards are
+    ordered top to bottom, so view[0] is the top card
+    """
+
+    __slots__ = ('_board', '_index')
+
+    def __init__(self, board, index):
+        """creates a StackView
+
+        :param board: board holding the stack
+        :type board: StackBoard
+
+        :param index: index of the stack on the board
+        :type index: int
+        """
+
+        self._board = board
+        self._index = index
+
+    def __getitem__(self, i):
+        cards = self._board._cards[self._index]
+
+        if isinstance(i, slice):
+            return cards[::-1][i]
+
+        return cards[-1 - i]
+
+    def __len__(self):
+        return self._board._lengths[self._index]
+
+    def __iter__(self):
+        return reversed(self._board._cards[self._index])
+
+    def __eq__(self, other):
+        if isinstance(other, (list, StackView)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self):
+        return repr(list(self))
+
+
+class StackBoard(Sequence):
+    """the stacks of a game, updated incrementally as cards are placed
+
+    keeps the top face, length and bull total of every stack up to date, so
+    none of them is recomputed from the cards of a stack
+
+    also keeps the top faces in sorted order, so the stack a card would be
+    placed on is found by bisection instead of scanning every stack; keeping
+    that order makes placing a card or picking up a stack take O(number of
+    stacks) time, a few list moves for the four stacks of a game
+
+    indexing the board gives a StackView, so the board can be handed to
+    players wherever a list of list of Card is expected
+
+    :inv: top_faces[i] == self[i][0].face
+    :inv: lengths[i] == len(self[i])
+    :inv: bull_totals[i] == sum(card.bull for card in self[i])
+    """
+
+    def __init__(self, top_cards):
+        """creates a StackBoard with one single-card stack per card
+
+        :param top_cards: first card of each stack
+        :type top_cards: list of Card
+        """
+
+        self._cards = [[card] for card in top_cards]
+        self._top_faces = [card.face for card in top_cards]
+        self._lengths = [1] * len(top_cards)
+        self._bull_totals = [card.bull for card in top_cards]
+        self._views = [StackView(self, i) for i in range(len(top_cards))]
+        self._sorted_tops = sorted(
+            (card.face, i) for i, card in enumerate(top_cards))
+
+    @classmethod
+    def from_stacks(cls, stacks):
+        """creates a StackBoard from stacks of cards
+
+        :param stacks: stacks ordered top to bottom
+        :type stacks: list of list of Card
+
+        :returns: board holding the same stacks
+        :rtype: StackBoard
+        """
+
+        board = cls([stack[0] for stack in stacks])
+
+        for i, stack in enumerate(stacks):
+            board._cards[i] = list(reversed(stack))
+            board._lengths[i] = len(stack)
+            board._bull_totals[i] = sum(card.bull for card in stack)
+
+        return board
+
+    def __getitem__(self, i):
+        return self._views[i]
+
+    def __len__(self):
+        return len(self._views)
+
+    def __eq__(self, other):
+        if isinstance(other, (list, StackBoard)):
+            return (len(self) == len(other) and
+                    all(a == b for a, b in zip(self, other)))
+        return NotImplemented
+
+    def __repr__(self):
+        return repr([list(stack) for stack in self])
+
+    @property
+    def top_faces(self):
+        """face value of the top card of each stack, not to be modified
+
+        :rtype: list of int
+        """
+
+        return self._top_faces
+
+    @property
+    def lengths(self):
+        """number of cards in each stack, not to be modified
+
+        :rtype: list of int
+        """
+
+        return self._lengths
+
+    @property
+    def bull_totals(self):
+        """sum of the bull points in each stack, not to be modified
+
+        :rtype: list of int
+        """
+
+        return self._bull_totals
+
+    def place_card(self, stack_index, card):
+        """places a card on top of a stack in O(number of stacks) time
+
+        :param stack_index: index of the stack to place the card on
+        :type stack_index: int
+
+        :param card: card to place
+        :type card: Card
+        """
+
+        self._cards[stack_index].append(card)
+        self._update_top(stack_index, card.face)
+        self._lengths[stack_index] += 1
+        self._bull_totals[stack_index] += card.bull
+
+    def replace_stack(self, stack_index, card):
+        """picks up a stack and starts a new one with the given card, in
+        O(number of stacks) time
+
+        :param stack_index: index of the stack to pick up
+        :type stack_index: int
+
+        :param card: first card of the new stack
+        :type card: Card
+
+        :returns: sum of the bull points in the picked up stack
+        :rtype: int
+        """
+
+        bull_total = self._bull_totals[stack_index]
+
+        self._cards[stack_index] = [card]
+        self._update_top(stack_index, card.face)
+        self._lengths[stack_index] = 1
+        self._bull_totals[stack_index] = card.bull
+
+        return bull_total
+
+    def find_stack(self, card):
+        """finds the stack whose top card is smaller and closest to a card
+
+        :param card: card to place
+        :type card: Card
+
+        :returns: index of the stack, or None if every top card is larger
+        :rtype: int or None
+        """
+
+        sorted_tops = self._sorted_tops
+        i = bisect_left(sorted_tops, (card.face,))
+
+        if i == 0:
+            return None
+
+        face = sorted_tops[i - 1][0]
+        return sorted_tops[bisect_left(sorted_tops, (face,))][1]
+
+    def find_stacks(self, cards):
+        """finds the stack each of the given cards would be placed on
+
+        :param cards: cards to place, such as a player's hand
+        :type cards: list of Card
+
+        :returns: index of the stack for each card, or None for cards smaller
+                  than every top card
+        :rtype: list of int or None
+        """
+
+        return [self.find_stack(card) for card in cards]
+
+    def _update_top(self, stack_index, face):
+        """replaces the top face of a stack in the sorted index
+
+        the old entry is found by bisection, but removing it and inserting
+        the new one shift the list, so this takes O(number of stacks) time
+
+        :param stack_index: index of the stack
+        :type stack_index: int
+
+        :param face: face value of the new top card
+        :type face: int
+        """
+
+        sorted_tops = self._sorted_tops
+        old_entry = (self._top_faces[stack_index], stack_index)
+        del sorted_tops[bisect_left(sorted_tops, old_entry)]
+        insort(sorted_tops, (face, stack_index))
+
+        self._top_faces[stack_index] = face
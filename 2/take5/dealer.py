@@ -6,7 +6,10 @@ import sys
 PATH_TO_PLAYER = '../../3/'
 sys.path.append(os.path.join(os.path.dirname(__file__), PATH_TO_PLAYER))
 
-from player import Card
+from board import StackBoard
+from scoreboard import Scoreboard
+from profiling import PICK_CARD, PICK_STACK
+from rules import STANDARD_RULES
 
 
 class Dealer:
@@ -15,7 +18,8 @@ class Dealer:
     :inv: _initial_deck is immutable
     """
 
-    def __init__(self, players, initial_deck=None, card_handout_order=None):
+    def __init__(self, players, initial_deck=None, card_handout_order=None,
+                 seed=None, recorder=None, profiler=None, rules=None):
         """creates a Dealer
 
         :param players: players to play the game.
@@ -26,31 +30,40 @@ class Dealer:
 
         :param card_handout_order: order in which cards are handed to players
         :type card_handout_order: list of int or None
-        """
 
-        expected_deck_len = 104
+        :param seed: seed for shuffling the deck, random if None
+        :type seed: int or None
 
-        if len(players) < 2 or len(players) > 10:
-            raise ValueError('number of players must be in interval [2, 10]')
+        :param recorder: recorder to log shuffles and decisions to
+        :type recorder: GameRecorder or None
 
-        self.players = players
+        :param profiler: profiler to report the time of each phase to
+        :type profiler: DealerProfiler or None
 
-        if initial_deck is None:
-            self._initial_deck = [Card(i, (i % 6) + 2) for i in range(1, 105)]
-        else:
-            if len(initial_deck) != expected_deck_len:
-                raise ValueError('Incorrect deck size')
+        :param rules: rules of the game, the standard rules if None
+        :type rules: Rules or None
+        """
 
-            faces = set(card.face for card in initial_deck)
-            if len(faces) != len(initial_deck):
-                raise ValueError('Contains two cards with the same face value')
+        if rules is None:
+            rules = STANDARD_RULES
 
-            if faces != set(range(1, 105)):
-                raise ValueError('Must have only one of every face value')
+        rules.validate_players(len(players))
 
-            if any(card.bull < 2 or card.bull > 7 for card in initial_deck):
-                raise ValueError('Deck bull values must be in interval [2,7]')
+        if recorder is not None and rules != STANDARD_RULES:
+            raise ValueError('game logs only support the standard rules')
 
+        self.players = players
+
+        self._rules = rules
+        self._hand_size = rules.hand_size
+        self._num_stacks = rules.num_stacks
+        self._stack_depth = rules.stack_depth
+        self._losing_points = rules.losing_points
+
+        if initial_deck is None:
+            self._initial_deck = rules.new_deck()
+        else:
+            rules.validate_deck(initial_deck)
             self._initial_deck = initial_deck
 
         if card_handout_order is None:
@@ -67,7 +80,31 @@ class Dealer:
             self._card_handout_order = card_handout_order
 
         self._deck = None
-        self._stacks = None
+        self._board = None
+        self._scoreboard = Scoreboard(p.get_points() for p in self.players)
+        self._random = random.Random(seed)
+
+        self._recorder = recorder
+        if recorder is not None:
+            recorder.start_game(self._initial_deck, self._card_handout_order)
+
+        self._profiler = profiler
+
+    @property
+    def _stacks(self):
+        """the stacks of the current round
+
+        :rtype: StackBoard or None
+        """
+
+        return self._board
+
+    @_stacks.setter
+    def _stacks(self, stacks):
+        if stacks is None or isinstance(stacks, StackBoard):
+            self._board = stacks
+        else:
+            self._board = StackBoard.from_stacks(stacks)
 
     def simulate_game(self):
         """simulates one complete game
@@ -76,22 +113,39 @@ class Dealer:
         :rtype: BasePlayer
         """
 
+        profiler = self._profiler
+        if profiler is not None:
+            start = profiler.clock()
+
         while not self.is_game_over():
             self.play_round()
 
+        if profiler is not None:
+            profiler.record_game(profiler.clock() - start)
+
         return self.get_results()
 
     def play_round(self):
         """plays a single round"""
 
+        profiler = self._profiler
+        if profiler is not None:
+            start = profiler.clock()
+
         self._deck = self._initial_deck[:]
-        random.shuffle(self._deck)
+        self._random.shuffle(self._deck)
+
+        if self._recorder is not None:
+            self._recorder.record_shuffle(self._deck)
 
         for player_name in self._card_handout_order:
             self.players[player_name].set_hand(self.deal_hand())
 
         self._stacks = self.get_new_stacks()
 
+        if profiler is not None:
+            profiler.record_deal(profiler.clock() - start)
+
         while self.players_have_cards(self.players):
             self.play_turn()
 
@@ -114,6 +168,10 @@ class Dealer:
         """plays a single turn"""
 
         discarded_cards = self.get_discarded_cards()
+
+        if self._recorder is not None:
+            self._recorder.record_discards(discarded_cards)
+
         self.add_all_cards_to_stacks(discarded_cards)
 
     def add_all_cards_to_stacks(self, discarded_cards):
@@ -123,26 +181,41 @@ class Dealer:
         :type discarded_cards: list of Card
         """
 
+        profiler = self._profiler
+        if profiler is not None:
+            start = profiler.clock()
+            pick_stack_start = profiler.get_total(PICK_STACK)
+
         ordered_player_names = self.get_card_placement_order(discarded_cards)
-        all_opponent_points = self.get_opponent_points(self.players)
         remaining_cards = {i: c for i, c in enumerate(discarded_cards)}
 
         for player_name in ordered_player_names:
             card = discarded_cards[player_name]
             player = self.players[player_name]
 
-            opponent_points = all_opponent_points[player_name]
+            opponent_points = self._scoreboard.get_opponent_points(
+                player_name)
             del remaining_cards[player_name]
 
-            self.add_card_to_stacks(
-                player, card, opponent_points, remaining_cards.values())
+            points_lost = self.add_card_to_stacks(
+                player, card, opponent_points, remaining_cards.values(),
+                player_name)
+
+            if points_lost:
+                self._scoreboard.remove_points(player_name, points_lost)
+
+        if profiler is not None:
+            pick_stack_time = profiler.get_total(PICK_STACK) - pick_stack_start
+            profiler.record_placement(
+                profiler.clock() - start - pick_stack_time)
 
     def add_card_to_stacks(
-            self, player, card, opponent_points, remaining_cards):
+            self, player, card, opponent_points, remaining_cards,
+            player_name=None):
         """places a player's card on the stacks and adjust points
 
         places card on stacks with closest smaller top card
-        if this stack has 5 cards, the player loses the sum of the bull points
+        if this stack is full, the player loses the sum of the bull points
 
         if no top cards are smaller, player chooses a stack to place on
         the player loses the sum of the bull points in this stack
@@ -158,26 +231,48 @@ class Dealer:
 
         :param remaining_cards: discarded cards yet to be played
         :type remaining_cards: list of Card
+
+        :param player_name: seat of the player, reported to the profiler;
+                            looked up from the player if None
+        :type player_name: int or None
+
+        :returns: number of points the player lost
+        :rtype: int
         """
 
+        board = self._stacks
         closest_smaller_card_stack = self.get_closest_smaller_card(
-            card, self._stacks)
+            card, board)
 
         if closest_smaller_card_stack is None:
+            profiler = self._profiler
+            if profiler is not None:
+                start = profiler.clock()
+
             chosen_stack_index = player.pick_stack(
-                self._stacks, opponent_points, remaining_cards)
+                board, opponent_points, remaining_cards)
+
+            if profiler is not None:
+                if player_name is None:
+                    player_name = self.players.index(player)
+
+                profiler.record_decision(
+                    PICK_STACK, player_name, profiler.clock() - start)
+
+            if self._recorder is not None:
+                self._recorder.record_choice(chosen_stack_index)
+
+            points_lost = board.replace_stack(chosen_stack_index, card)
 
-            chosen_stack = self._stacks[chosen_stack_index]
-            player.remove_points(sum(c.bull for c in chosen_stack))
-            self._stacks[chosen_stack_index] = [card]
+        elif board.lengths[closest_smaller_card_stack] == self._stack_depth:
+            points_lost = board.replace_stack(closest_smaller_card_stack, card)
 
         else:
-            chosen_stack = self._stacks[closest_smaller_card_stack]
-            if len(chosen_stack) == 5:
-                player.remove_points(sum(c.bull for c in chosen_stack))
-                self._stacks[closest_smaller_card_stack] = [card]
-            else:
-                self._stacks[closest_smaller_card_stack].insert(0, card)
+            board.place_card(closest_smaller_card_stack, card)
+            return 0
+
+        player.remove_points(points_lost)
+        return points_lost
 
     @staticmethod
     def get_closest_smaller_card(card, stacks):
@@ -187,12 +282,15 @@ class Dealer:
         :type card: Card
 
         :param stacks: stacks to choose from
-        :type stacks: list of list of Card
+        :type stacks: StackBoard or list of list of Card
 
         :returns: index of stack if any cards are smaller else None
         :rtype: int or None
         """
 
+        if isinstance(stacks, StackBoard):
+            return stacks.find_stack(card)
+
         first_of_stacks = [s[0] for s in stacks]
         closest_smaller_card_stack = None
         closest_smaller_card_delta = float('inf')
@@ -236,16 +334,17 @@ class Dealer:
         :rtype: bool
         """
 
-        return any(player.get_points() <= -66 for player in self.players)
+        losing_points = self._losing_points
+        return any(p.get_points() <= losing_points for p in self.players)
 
     def deal_hand(self):
-        """gets the first 10 cards of the deck
+        """gets the first cards of the deck, as many as a hand holds
 
         :returns: hand to set to a player
         :rtype: list of Card
         """
 
-        cards_in_hand = 10
+        cards_in_hand = self._hand_size
 
         if self._deck is None or len(self._deck) < cards_in_hand:
             raise ValueError('invalid deck')
@@ -258,16 +357,16 @@ class Dealer:
     def get_new_stacks(self):
         """creates new stacks
 
-        :returns: 4 new stacks with 1 card in each
-        :rtype: list of list of Card
+        :returns: new stacks with 1 card in each
+        :rtype: StackBoard
         """
 
-        num_stacks = 4
+        num_stacks = self._num_stacks
 
         stack_cards = self._deck[:num_stacks]
         self._deck = self._deck[num_stacks:]
 
-        return [[c] for c in stack_cards]
+        return StackBoard(stack_cards)
 
     @staticmethod
     def get_card_placement_order(cards):
@@ -289,13 +388,21 @@ class Dealer:
         :rtype: list of Card
         """
 
-        all_opponent_points = self.get_opponent_points(self.players)
+        profiler = self._profiler
 
         discarded_cards = []
         for i, player in enumerate(self.players):
-            opponent_points = all_opponent_points[i]
+            opponent_points = self._scoreboard.get_opponent_points(i)
+
+            if profiler is not None:
+                start = profiler.clock()
 
             card = player.pick_card(self._stacks, opponent_points)
+
+            if profiler is not None:
+                profiler.record_decision(
+                    PICK_CARD, i, profiler.clock() - start)
+
             discarded_cards.append(card)
 
         return discarded_cards
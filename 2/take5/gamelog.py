@@ -0,0 +1,207 @@
+"""
+Records 6 Nimmt! games in a compact binary log and replays them.
+
+A GameLog is bytes laid out as:
+
+    header:  b'T5LG', version, number of players N, N bytes of card handout
+             order, 2-byte big-endian deck length D, D bytes of bull points
+             for the faces 1 ... D
+    records: one of
+             - b'R' followed by the D faces of the shuffled deck
+             - b'T' followed by the N faces discarded in a turn, in player
+               order
+             - b'C' followed by the index of the stack a player picked up
+
+A replay rebuilds the points of every player from the log alone, without
+calling any player.
+"""
+
+MAGIC = b'T5LG'
+VERSION = 1
+
+ROUND = ord('R')
+TURN = ord('T')
+CHOICE = ord('C')
+
+CARDS_IN_HAND = 10
+NUM_STACKS = 4
+MAX_STACK_LEN = 5
+
+
+class GameRecorder:
+    """records the shuffles and decisions of a game as a GameLog"""
+
+    def __init__(self):
+        """creates a GameRecorder"""
+
+        self._log = bytearray()
+
+    def start_game(self, initial_deck, card_handout_order):
+        """records the header of a game
+
+        :param initial_deck: cards making up a deck
+        :type initial_deck: list of Card
+
+        :param card_handout_order: order in which cards are handed to players
+        :type card_handout_order: list of int
+        """
+
+        bulls = bytearray(len(initial_deck))
+        for card in initial_deck:
+            bulls[card.face - 1] = card.bull
+
+        self._log = bytearray(MAGIC)
+        self._log.append(VERSION)
+        self._log.append(len(card_handout_order))
+        self._log.extend(card_handout_order)
+        self._log.extend(len(initial_deck).to_bytes(2, 'big'))
+        self._log.extend(bulls)
+
+    def record_shuffle(self, deck):
+        """records the shuffled deck of a new round
+
+        :param deck: shuffled deck
+        :type deck: list of Card
+        """
+
+        self._log.append(ROUND)
+        self._log.extend(card.face for card in deck)
+
+    def record_discards(self, cards):
+        """records the cards discarded in a turn
+
+        :param cards: discarded cards, ordered the same as players
+        :type cards: list of Card
+        """
+
+        self._log.append(TURN)
+        self._log.extend(card.face for card in cards)
+
+    def record_choice(self, stack_index):
+        """records the stack a player chose to pick up
+
+        :param stack_index: index of the picked up stack
+        :type stack_index: int
+        """
+
+        self._log.append(CHOICE)
+        self._log.append(stack_index)
+
+    def get_log(self):
+        """gets the log recorded so far
+
+        :returns: log
+        :rtype: GameLog
+        """
+
+        return bytes(self._log)
+
+
+def replay(log, verify=False):
+    """replays a GameLog and rebuilds the final points of every player
+
+    :param log: log to replay
+    :type log: GameLog
+
+    :param verify: whether to check every discarded card was dealt to the
+                   player discarding it and only played once
+    :type verify: bool
+
+    :returns: list of (player name, points), as Dealer.get_results
+    :rtype: list of (int, int)
+
+    :raises: ValueError if the log is malformed or fails verification
+    """
+
+    log = bytes(log)
+
+    if log[:len(MAGIC)] != MAGIC or log[len(MAGIC)] != VERSION:
+        raise ValueError('not a game log')
+
+    pos = len(MAGIC) + 1
+    num_players = log[pos]
+    card_handout_order = log[pos + 1:pos + 1 + num_players]
+    pos += 1 + num_players
+
+    deck_len = int.from_bytes(log[pos:pos + 2], 'big')
+    bulls = b'\x00' + log[pos + 2:pos + 2 + deck_len]
+    pos += 2 + deck_len
+
+    stacks_start = num_players * CARDS_IN_HAND
+    points = [0] * num_players
+    hands = None
+    tops = lengths = bull_totals = None
+
+    log_len = len(log)
+    while pos < log_len:
+        record = log[pos]
+
+        if record == ROUND:
+            deck = log[pos + 1:pos + 1 + deck_len]
+            if len(deck) != deck_len:
+                raise ValueError('truncated round record')
+
+            tops = list(deck[stacks_start:stacks_start + NUM_STACKS])
+            lengths = [1] * NUM_STACKS
+            bull_totals = [bulls[face] for face in tops]
+
+            if verify:
+                hands = [None] * num_players
+                for i, player_name in enumerate(card_handout_order):
+                    start = i * CARDS_IN_HAND
+                    hands[player_name] = set(
+                        deck[start:start + CARDS_IN_HAND])
+
+            pos += 1 + deck_len
+
+        elif record == TURN:
+            if tops is None:
+                raise ValueError('turn recorded before a round')
+
+            discards = log[pos + 1:pos + 1 + num_players]
+            if len(discards) != num_players:
+                raise ValueError('truncated turn record')
+            pos += 1 + num_players
+
+            if verify:
+                for player_name, face in enumerate(discards):
+                    if face not in hands[player_name]:
+                        raise ValueError('card was not in the hand')
+                    hands[player_name].remove(face)
+
+            for face, player_name in sorted(
+                    zip(discards, range(num_players))):
+                closest_smaller_card_stack = None
+                closest_smaller_card_face = 0
+
+                for i, top_face in enumerate(tops):
+                    if closest_smaller_card_face < top_face < face:
+                        closest_smaller_card_stack = i
+                        closest_smaller_card_face = top_face
+
+                stack = closest_smaller_card_stack
+
+                if stack is None:
+                    if pos + 1 >= log_len or log[pos] != CHOICE:
+                        raise ValueError('missing stack choice')
+                    stack = log[pos + 1]
+                    pos += 2
+
+                    if stack >= NUM_STACKS:
+                        raise ValueError('invalid stack choice')
+
+                elif lengths[stack] != MAX_STACK_LEN:
+                    tops[stack] = face
+                    lengths[stack] += 1
+                    bull_totals[stack] += bulls[face]
+                    continue
+
+                points[player_name] -= bull_totals[stack]
+                tops[stack] = face
+                lengths[stack] = 1
+                bull_totals[stack] = bulls[face]
+
+        else:
+            raise ValueError('unknown record')
+
+    return sorted(enumerate(points), key=lambda x: x[1])
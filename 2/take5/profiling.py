@@ -0,0 +1,190 @@
+"""
+Opt-in profiling of where a Dealer spends its time.
+
+A DealerProfiler passed to a Dealer is told the wall time of every phase of
+play: dealing a round, each player's pick_card, placing a turn's cards on
+the stacks and each player's pick_stack. Placement time excludes the
+pick_stack callbacks made while placing. A Dealer without a profiler skips
+all timing.
+
+A ProfileReport is a dict:
+    {"games": int, "rounds": int, "turns": int, "seconds": float,
+     "phases": {Phase: {"calls": int, "seconds": float}},
+     "players": {int: {Phase: {"calls": int, "seconds": float}}},
+     "slowest": {Phase: {"player": int, "seconds": float,
+                         "round": int, "turn": int} or None}}
+where the player phases and slowest decisions cover pick_card and
+pick_stack, "round" counts from 0 over every game profiled and "turn" is
+the turn within its round.
+"""
+
+import time
+
+DEAL = 'deal'
+PICK_CARD = 'pick_card'
+PLACEMENT = 'placement'
+PICK_STACK = 'pick_stack'
+
+PHASES = [DEAL, PICK_CARD, PLACEMENT, PICK_STACK]
+DECISIONS = [PICK_CARD, PICK_STACK]
+
+
+class DealerProfiler:
+    """accumulates phase timings of one or more games"""
+
+    clock = staticmethod(time.perf_counter)
+
+    def __init__(self):
+        """creates a DealerProfiler"""
+
+        self.num_games = 0
+        self.seconds = 0.0
+        self._rounds = 0
+        self._turns = 0
+        self._turn_in_round = 0
+
+        self._calls = {phase: 0 for phase in PHASES}
+        self._totals = {phase: 0.0 for phase in PHASES}
+        self._player_calls = {phase: {} for phase in DECISIONS}
+        self._player_totals = {phase: {} for phase in DECISIONS}
+        self._slowest = {phase: None for phase in DECISIONS}
+
+    def get_total(self, phase):
+        """gets the seconds spent in a phase so far
+
+        :param phase: phase to look up
+        :type phase: Phase
+
+        :returns: seconds spent in the phase
+        :rtype: float
+        """
+
+        return self._totals[phase]
+
+    def record_game(self, seconds):
+        """records a finished game
+
+        :param seconds: wall time of the whole game
+        :type seconds: float
+        """
+
+        self.num_games += 1
+        self.seconds += seconds
+
+    def record_deal(self, seconds):
+        """records dealing the hands and stacks of a new round
+
+        :param seconds: wall time spent dealing
+        :type seconds: float
+        """
+
+        if self._calls[DEAL]:
+            self._rounds += 1
+
+        self._turn_in_round = 0
+        self._calls[DEAL] += 1
+        self._totals[DEAL] += seconds
+
+    def record_placement(self, seconds):
+        """records placing the cards of a turn, ending the turn
+
+        :param seconds: wall time spent placing, without pick_stack callbacks
+        :type seconds: float
+        """
+
+        self._turns += 1
+        self._turn_in_round += 1
+        self._calls[PLACEMENT] += 1
+        self._totals[PLACEMENT] += seconds
+
+    def record_decision(self, phase, player_name, seconds):
+        """records a pick_card or pick_stack call of a player
+
+        :param phase: PICK_CARD or PICK_STACK
+        :type phase: Phase
+
+        :param player_name: index of the player who decided
+        :type player_name: int
+
+        :param seconds: wall time of the call
+        :type seconds: float
+        """
+
+        self._calls[phase] += 1
+        self._totals[phase] += seconds
+
+        player_calls = self._player_calls[phase]
+        player_calls[player_name] = player_calls.get(player_name, 0) + 1
+
+        player_totals = self._player_totals[phase]
+        player_totals[player_name] = (
+            player_totals.get(player_name, 0.0) + seconds)
+
+        slowest = self._slowest[phase]
+        if slowest is None or seconds > slowest['seconds']:
+            self._slowest[phase] = {
+                'player': player_name,
+                'seconds': seconds,
+                'round': self._rounds,
+                'turn': self._turn_in_round,
+            }
+
+    def get_report(self):
+        """gets the timings recorded so far
+
+        :returns: report of every phase, player and slowest decision
+        :rtype: ProfileReport
+        """
+
+        players = {}
+        for phase in DECISIONS:
+            for name, calls in self._player_calls[phase].items():
+                players.setdefault(name, {})[phase] = {
+                    'calls': calls,
+                    'seconds': self._player_totals[phase][name],
+                }
+
+        return {
+            'games': self.num_games,
+            'rounds': self._calls[DEAL],
+            'turns': self._turns,
+            'seconds': self.seconds,
+            'phases': {
+                phase: {'calls': self._calls[phase],
+                        'seconds': self._totals[phase]}
+                for phase in PHASES
+            },
+            'players': players,
+            'slowest': {
+                phase: None if slowest is None else dict(slowest)
+                for phase, slowest in self._slowest.items()
+            },
+        }
+
+    def format_report(self):
+        """formats the phase timings as a printable table
+
+        :returns: table with a header line and one line per phase
+        :rtype: str
+        """
+
+        report = self.get_report()
+        fmt = '{:<12} {:>10} {:>12} {:>8}'
+        lines = [fmt.format('phase', 'calls', 'seconds', 'share')]
+
+        for phase, timing in report['phases'].items():
+            share = timing['seconds'] / report['seconds'] if report[
+                'seconds'] else 0.0
+            lines.append(fmt.format(
+                phase, timing['calls'], '{:.6f}'.format(timing['seconds']),
+                '{:.1%}'.format(share)))
+
+        for phase, slowest in report['slowest'].items():
+            if slowest is not None:
+                lines.append('slowest {}: player {} took {:.6f}s in round {} '
+                             'turn {}'.format(phase, slowest['player'],
+                                              slowest['seconds'],
+                                              slowest['round'],
+                                              slowest['turn']))
+
+        return '\n'.join(lines)
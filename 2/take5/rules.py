@@ -0,0 +1,159 @@
+"""
+Rule variants of 6 Nimmt!.
+
+A Rules object fixes every number the Dealer plays by and precomputes the
+default deck of its variant once, so games under different rules can be
+played side by side in one process.
+"""
+
+import os
+import sys
+
+PATH_TO_PLAYER = '../../3/'
+sys.path.append(os.path.join(os.path.dirname(__file__), PATH_TO_PLAYER))
+
+from player import Card
+
+
+class Rules:
+    """numbers a game of 6 Nimmt! is played by
+
+    the default deck has one card for every face in 1 ... deck_size, with
+    bull points cycling through min_bull ... max_bull by face
+
+    :inv: all attributes are immutable
+    """
+
+    __slots__ = ('deck_size', 'hand_size', 'stack_depth', 'num_stacks',
+                 'min_bull', 'max_bull', 'losing_points', 'max_players',
+                 'faces', 'deck_template')
+
+    def __init__(self, deck_size=104, hand_size=10, stack_depth=5,
+                 num_stacks=4, min_bull=2, max_bull=7, losing_points=-66):
+        """creates Rules
+
+        :param deck_size: number of cards in the deck
+        :type deck_size: int
+
+        :param hand_size: number of cards dealt to each player every round
+        :type hand_size: int
+
+        :param stack_depth: number of cards a stack holds before the next
+                            card placed on it takes the stack
+        :type stack_depth: int
+
+        :param num_stacks: number of stacks
+        :type num_stacks: int
+
+        :param min_bull: smallest bull value of a card
+        :type min_bull: int
+
+        :param max_bull: largest bull value of a card
+        :type max_bull: int
+
+        :param losing_points: points at or below which a player loses
+        :type losing_points: int
+        """
+
+        if min(hand_size, stack_depth, num_stacks) < 1:
+            raise ValueError('hand size, stack depth and number of stacks '
+                             'must be positive')
+
+        if min_bull < 0 or min_bull > max_bull:
+            raise ValueError('bull range must be non-negative and ordered')
+
+        max_players = (deck_size - num_stacks) // hand_size
+        if max_players < 2:
+            raise ValueError('deck must be large enough for two players')
+
+        self.deck_size = deck_size
+        self.hand_size = hand_size
+        self.stack_depth = stack_depth
+        self.num_stacks = num_stacks
+        self.min_bull = min_bull
+        self.max_bull = max_bull
+        self.losing_points = losing_points
+        self.max_players = max_players
+
+        num_bulls = max_bull - min_bull + 1
+
+        self.faces = frozenset(range(1, deck_size + 1))
+        self.deck_template = tuple(
+            Card(i, (i % num_bulls) + min_bull) for i in range(1, deck_size + 1))
+
+    def _key(self):
+        return (self.deck_size, self.hand_size, self.stack_depth,
+                self.num_stacks, self.min_bull, self.max_bull,
+                self.losing_points)
+
+    def __eq__(self, other):
+        if isinstance(other, Rules):
+            return self._key() == other._key()
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(self._key())
+
+    def __repr__(self):
+        return ('Rules(deck_size={}, hand_size={}, stack_depth={}, '
+                'num_stacks={}, min_bull={}, max_bull={}, '
+                'losing_points={})'.format(*self._key()))
+
+    def new_deck(self):
+        """gets a fresh copy of the default deck
+
+        :returns: one card for every face, ordered by face
+        :rtype: list of Card
+        """
+
+        return list(self.deck_template)
+
+    def validate_players(self, num_players):
+        """checks that a game can be dealt to a number of players
+
+        :param num_players: number of players
+        :type num_players: int
+        """
+
+        if num_players < 2 or num_players > self.max_players:
+            raise ValueError('number of players must be in interval '
+                             '[2, {}]'.format(self.max_players))
+
+    def validate_deck(self, deck):
+        """checks that a deck holds exactly the faces and bulls of the rules
+
+        :param deck: cards making up a deck
+        :type deck: list of Card
+        """
+
+        if len(deck) != self.deck_size:
+            raise ValueError('Incorrect deck size')
+
+        faces = set(card.face for card in deck)
+        if len(faces) != len(deck):
+            raise ValueError('Contains two cards with the same face value')
+
+        if faces != self.faces:
+            raise ValueError('Must have only one of every face value')
+
+        if any(card.bull < self.min_bull or card.bull > self.max_bull
+               for card in deck):
+            raise ValueError('Deck bull values must be in interval '
+                             '[{},{}]'.format(self.min_bull, self.max_bull))
+
+
+STANDARD_RULES = Rules()
+
+# the variants of 3/take5/1.patch through 4.patch
+SIX_DEEP_RULES = Rules(stack_depth=6)
+LARGE_DECK_RULES = Rules(deck_size=209)
+SHORT_HAND_RULES = Rules(hand_size=9)
+HIGH_BULL_RULES = Rules(min_bull=3)
+
+VARIANTS = {
+    'standard': STANDARD_RULES,
+    'six-deep': SIX_DEEP_RULES,
+    'large-deck': LARGE_DECK_RULES,
+    'short-hand': SHORT_HAND_RULES,
+    'high-bull': HIGH_BULL_RULES,
+}
@@ -1,6 +1,6 @@
 virtualenv lvs-vignesh-venv
 source lvs-vignesh-venv/bin/activate # something here w/ python3
-pip install pytest
-py.test test_dealer.py
+pip install pytest numpy
+py.test test_dealer.py test_rules.py test_board.py test_scoreboard.py test_gamelog.py test_profiling.py test_tournament.py test_batch.py test_benchmark.py
 deactivate
 rm -r ./lvs-vignesh-venv
@@ -0,0 +1,111 @@
+from collections.abc import Sequence
+
+
+class OpponentPoints(Sequence):
+    """read-only view of the points of every player but one
+
+    reads the scoreboard's points directly, so it never needs rebuilding and
+    always shows the current points
+    """
+
+    __slots__ = ('_points', '_player_name')
+
+    def __init__(self, points, player_name):
+        """creates an OpponentPoints view
+
+        :param points: points of every player, owned by a Scoreboard
+        :type points: list of int
+
+        :param player_name: index of the player whose points are left out
+        :type player_name: int
+        """
+
+        self._points = points
+        self._player_name = player_name
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return list(self)[i]
+
+        num_opponents = len(self._points) - 1
+        if i < 0:
+            i += num_opponents
+
+        if not 0 <= i < num_opponents:
+            raise IndexError('opponent index out of range')
+
+        return self._points[i if i < self._player_name else i + 1]
+
+    def __len__(self):
+        return len(self._points) - 1
+
+    def __iter__(self):
+        points = self._points
+        player_name = self._player_name
+
+        for i in range(len(points)):
+            if i != player_name:
+                yield points[i]
+
+    def __eq__(self, other):
+        if isinstance(other, (list, OpponentPoints)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self):
+        return repr(list(self))
+
+
+class Scoreboard:
+    """points of every player in a game
+
+    hands out one OpponentPoints view per player, created once, so passing
+    opponent points to players costs nothing per turn
+    """
+
+    def __init__(self, points):
+        """creates a Scoreboard
+
+        :param points: current points of each player
+        :type points: iterable of int
+        """
+
+        self._points = list(points)
+        self._opponent_points = [
+            OpponentPoints(self._points, i) for i in range(len(self._points))]
+
+    @property
+    def points(self):
+        """points of each player, not to be modified
+
+        :rtype: list of int
+        """
+
+        return self._points
+
+    def get_opponent_points(self, player_name):
+        """gets the points of all opponents of a player
+
+        :param player_name: index of the player
+        :type player_name: int
+
+        :returns: read-only view of the points of the player's opponents
+        :rtype: OpponentPoints
+        """
+
+        return self._opponent_points[player_name]
+
+    def remove_points(self, player_name, num_points):
+        """removes points from a player
+
+        :param player_name: index of the player
+        :type player_name: int
+
+        :param num_points: non-negative number of points to remove
+        :type num_points: int
+        """
+
+        if num_points < 0:
+            raise ValueError("num_points must be greater than or equal to 0")
+
+        self._points[player_name] -= num_points
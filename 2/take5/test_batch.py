@@ -0,0 +1,106 @@
+import os
+import random
+import sys
+
+PATH_TO_PLAYER = '../../3/'
+PATH_TO_PROXY = '../../4/remote/'
+sys.path.append(os.path.join(os.path.dirname(__file__), PATH_TO_PLAYER))
+sys.path.append(os.path.join(os.path.dirname(__file__), PATH_TO_PROXY))
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from batch import BatchSimulator, FIRST_CARD, HIGHEST_CARD
+from dealer import Dealer
+from player import DemoPlayer
+from player_proxy import Player as HighestCardPlayer
+
+POLICY_TO_PLAYER = {
+    FIRST_CARD: DemoPlayer,
+    HIGHEST_CARD: HighestCardPlayer,
+}
+
+
+def play_dealer_rounds(policies, seeds, card_handout_order=None):
+    """plays one round with the Dealer for each seed
+
+    :returns: shuffled decks of faces and the points of each round
+    :rtype: (list of list of int, list of list of int)
+    """
+
+    decks = []
+    all_points = []
+
+    for seed in seeds:
+        players = [POLICY_TO_PLAYER[policy]() for policy in policies]
+        dealer = Dealer(
+            players, card_handout_order=card_handout_order, seed=seed)
+
+        dealer.play_round()
+        all_points.append([p.get_points() for p in players])
+
+        deck = dealer._initial_deck[:]
+        random.Random(seed).shuffle(deck)
+        decks.append([card.face for card in deck])
+
+    return decks, all_points
+
+
+def test_batch_simulator_creation():
+    """tests that the batch simulator does not accept invalid input"""
+
+    with pytest.raises(ValueError):
+        BatchSimulator([FIRST_CARD])
+
+    with pytest.raises(ValueError):
+        BatchSimulator([FIRST_CARD] * 11)
+
+    with pytest.raises(ValueError):
+        BatchSimulator([FIRST_CARD, 'unknown'])
+
+    with pytest.raises(ValueError):
+        BatchSimulator([FIRST_CARD, FIRST_CARD], card_handout_order=[0, 0])
+
+
+def test_play_rounds_matches_dealer():
+    """tests that batched rounds give the same points as the Dealer
+
+    cases:
+        - only first-card players
+        - only highest-card players
+        - mixed players with a custom card handout order
+        - the maximum number of players
+    """
+
+    cases = [
+        ([FIRST_CARD] * 4, None),
+        ([HIGHEST_CARD] * 3, None),
+        ([HIGHEST_CARD, FIRST_CARD, HIGHEST_CARD, FIRST_CARD], [2, 0, 3, 1]),
+        ([FIRST_CARD, HIGHEST_CARD] * 5, None),
+    ]
+
+    for policies, card_handout_order in cases:
+        decks, expected_points = play_dealer_rounds(
+            policies, range(50), card_handout_order)
+
+        simulator = BatchSimulator(
+            policies, card_handout_order=card_handout_order)
+        points = simulator.play_rounds(np.array(decks))
+
+        assert points.tolist() == expected_points
+
+
+def test_simulate_games():
+    """tests that every simulated game is played until a player loses"""
+
+    simulator = BatchSimulator([FIRST_CARD, HIGHEST_CARD, HIGHEST_CARD])
+    points = simulator.simulate_games(200, np.random.default_rng(0))
+
+    assert points.shape == (200, 3)
+    assert (points.min(axis=1) <= BatchSimulator.LOSING_POINTS).all()
+    assert (points <= 0).all()
+
+    results = simulator.get_results(points[0])
+    assert [name for name, _ in results] == np.argsort(
+        points[0], kind='stable').tolist()
@@ -0,0 +1,62 @@
+import pytest
+
+from benchmark import (
+    CASES, find_regressions, percentile, run_benchmarks, summarize)
+
+
+def test_percentile():
+    """tests nearest-rank percentiles"""
+
+    values = list(range(101))
+
+    assert percentile(values, 0) == 0
+    assert percentile(values, 50) == 50
+    assert percentile(values, 99) == 99
+    assert percentile([7], 90) == 7
+    assert percentile([1, 2, 3, 4], 50) == 2
+    assert percentile([1, 2, 3, 4], 51) == 3
+
+    with pytest.raises(ValueError):
+        percentile([], 50)
+
+
+def test_summarize():
+    """tests summarizing timings in microseconds"""
+
+    summary = summarize([0.001, 0.002, 0.003, 0.004])
+
+    assert summary['calls'] == 4
+    assert summary['per_sec'] == pytest.approx(400)
+    assert summary['mean'] == pytest.approx(2500)
+    assert summary['p50'] == pytest.approx(2000)
+    assert summary['p99'] == pytest.approx(4000)
+
+
+def test_find_regressions():
+    """tests comparing results against a baseline
+
+    cases:
+        - slower within the threshold
+        - slower beyond the threshold
+        - case missing from the baseline
+    """
+
+    baseline = {'a': {'p50': 10.0}, 'b': {'p50': 10.0}}
+    results = {'a': {'p50': 10.5}, 'b': {'p50': 12.0}, 'c': {'p50': 99.0}}
+
+    assert find_regressions(results, baseline, 0.1) == [('b', 10.0, 12.0)]
+    assert find_regressions(results, baseline, 0.5) == []
+
+
+def test_run_benchmarks():
+    """tests that every case runs and reports every statistic"""
+
+    results = run_benchmarks(scale=0.001)
+
+    assert list(results) == [name for name, _, _ in CASES]
+    for summary in results.values():
+        assert summary['calls'] >= 1
+        assert summary['p50'] <= summary['p90'] <= summary['p99']
+
+    results = run_benchmarks(scale=0.001, names=['deal_hand'])
+    assert list(results) == ['deal_hand']
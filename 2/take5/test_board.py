@@ -0,0 +1,100 @@
+import os
+import sys
+
+PATH_TO_PLAYER = '../../3/'
+sys.path.append(os.path.join(os.path.dirname(__file__), PATH_TO_PLAYER))
+
+from board import StackBoard
+from player import Card
+
+
+def test_from_stacks():
+    """tests that a board built from stacks keeps its summaries"""
+
+    stacks = [
+        [Card(28, 3), Card(17, 5)],
+        [Card(4, 2)],
+    ]
+    board = StackBoard.from_stacks(stacks)
+
+    assert board == stacks
+    assert board.top_faces == [28, 4]
+    assert board.lengths == [2, 1]
+    assert board.bull_totals == [8, 2]
+
+
+def test_stack_views():
+    """tests that stacks read like lists ordered top to bottom"""
+
+    board = StackBoard([Card(10, 1), Card(20, 2)])
+    board.place_card(0, Card(11, 3))
+    board.place_card(0, Card(12, 4))
+
+    stack = board[0]
+    assert len(stack) == 3
+    assert stack[0] == Card(12, 4)
+    assert stack[-1] == Card(10, 1)
+    assert stack[1:] == [Card(11, 3), Card(10, 1)]
+    assert list(stack) == [Card(12, 4), Card(11, 3), Card(10, 1)]
+    assert sum(card.bull for card in stack) == board.bull_totals[0]
+    assert [s[0] for s in board] == [Card(12, 4), Card(20, 2)]
+
+
+def test_place_card():
+    """tests that placing a card updates the summaries"""
+
+    board = StackBoard([Card(10, 1), Card(20, 2)])
+    board.place_card(1, Card(25, 5))
+
+    assert board == [[Card(10, 1)], [Card(25, 5), Card(20, 2)]]
+    assert board.top_faces == [10, 25]
+    assert board.lengths == [1, 2]
+    assert board.bull_totals == [1, 7]
+
+
+def test_replace_stack():
+    """tests that replacing a stack returns its bull points
+
+    cases:
+        - views handed out before the replacement see the new stack
+    """
+
+    board = StackBoard([Card(10, 1), Card(20, 2)])
+    board.place_card(1, Card(25, 5))
+    view = board[1]
+
+    assert board.replace_stack(1, Card(3, 7)) == 7
+    assert board == [[Card(10, 1)], [Card(3, 7)]]
+    assert view == [Card(3, 7)]
+    assert board.top_faces == [10, 3]
+    assert board.lengths == [1, 1]
+    assert board.bull_totals == [1, 7]
+
+
+def test_find_stack():
+    """tests finding the stack a card is placed on
+
+    cases:
+        - every top card is larger
+        - closest smaller top card is chosen
+        - index follows placements and replacements
+        - every card of a hand at once
+    """
+
+    board = StackBoard([Card(40, 1), Card(10, 1), Card(30, 1), Card(20, 1)])
+
+    assert board.find_stack(Card(5, 1)) is None
+    assert board.find_stack(Card(11, 1)) == 1
+    assert board.find_stack(Card(29, 1)) == 3
+    assert board.find_stack(Card(104, 1)) == 0
+
+    board.place_card(1, Card(35, 1))
+    assert board.find_stack(Card(11, 1)) is None
+    assert board.find_stack(Card(36, 1)) == 1
+
+    board.replace_stack(0, Card(2, 1))
+    assert board.find_stack(Card(5, 1)) == 0
+    assert board.find_stack(Card(104, 1)) == 1
+
+    hand = [Card(1, 1), Card(25, 1), Card(33, 1), Card(50, 1)]
+    assert board.find_stacks(hand) == [None, 3, 2, 1]
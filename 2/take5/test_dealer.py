@@ -238,3 +238,13 @@ def test_simulate_game():
 
     assert winning_player_points <= min_winning_score
     assert all(p.get_points() <= 0 for p in dealer.players)
+
+
+def test_scoreboard_follows_points():
+    """tests that the dealer's scoreboard matches the players' points"""
+
+    players = [MockPlayer() for _ in range(5)]
+    dealer = Dealer(players)
+    dealer.simulate_game()
+
+    assert dealer._scoreboard.points == [p.get_points() for p in players]
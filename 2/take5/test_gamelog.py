@@ -0,0 +1,95 @@
+import os
+import sys
+
+PATH_TO_PLAYER = '../../3/'
+sys.path.append(os.path.join(os.path.dirname(__file__), PATH_TO_PLAYER))
+
+import pytest
+
+from dealer import Dealer
+from gamelog import GameRecorder, replay
+from player import BasePlayer, Card, DemoPlayer
+
+
+class LastStackPlayer(BasePlayer):
+    def pick_card(self, stacks, opponent_points):
+        return self._hand.pop()
+
+    def pick_stack(self, stacks, opponent_points, remaining_cards):
+        return len(stacks) - 1
+
+
+def record_game(seed, card_handout_order=None):
+    """plays a recorded game
+
+    :returns: log and results of the game
+    :rtype: (GameLog, list of (int, int))
+    """
+
+    players = [DemoPlayer(), LastStackPlayer(), DemoPlayer()]
+    recorder = GameRecorder()
+    dealer = Dealer(players, card_handout_order=card_handout_order,
+                    seed=seed, recorder=recorder)
+
+    results = dealer.simulate_game()
+    return recorder.get_log(), results
+
+
+def test_seeded_games_repeat():
+    """tests that dealers with the same seed play the same game"""
+
+    assert record_game(5) == record_game(5)
+    assert record_game(5)[0] != record_game(6)[0]
+
+
+def test_replay():
+    """tests that replaying a log gives the results of the game
+
+    cases:
+        - default card handout order
+        - custom card handout order
+        - with verification
+    """
+
+    for seed in range(20):
+        log, results = record_game(seed)
+        assert replay(log) == results
+        assert replay(log, verify=True) == results
+
+    log, results = record_game(1, card_handout_order=[2, 0, 1])
+    assert replay(log, verify=True) == results
+
+
+def test_replay_invalid():
+    """tests that malformed or inconsistent logs are rejected
+
+    cases:
+        - not a log
+        - unknown record
+        - missing stack choice
+        - discarded card not in the hand
+    """
+
+    log, _ = record_game(3)
+
+    with pytest.raises(ValueError):
+        replay(b'not a log')
+
+    with pytest.raises(ValueError):
+        replay(log + b'X')
+
+    deck = [Card(i, 2) for i in range(1, 105)]
+    recorder = GameRecorder()
+    recorder.start_game(deck, [0, 1])
+    recorder.record_shuffle(deck)
+
+    # stacks start with faces 21 to 24, player 0 was dealt faces 1 to 10
+    recorder.record_discards([Card(1, 2), Card(30, 2)])
+    with pytest.raises(ValueError):
+        replay(recorder.get_log())
+
+    recorder.record_choice(0)
+    assert replay(recorder.get_log()) == [(0, -2), (1, 0)]
+
+    with pytest.raises(ValueError):
+        replay(recorder.get_log(), verify=True)
@@ -0,0 +1,106 @@
+import os
+import sys
+import time
+
+PATH_TO_PLAYER = '../../3/'
+sys.path.append(os.path.join(os.path.dirname(__file__), PATH_TO_PLAYER))
+
+from dealer import Dealer
+from player import Card, DemoPlayer
+from profiling import (
+    DEAL, PICK_CARD, PICK_STACK, PLACEMENT, PHASES, DealerProfiler)
+
+
+class SlowPlayer(DemoPlayer):
+    """demo player whose fifth card of every round takes a while"""
+
+    def pick_card(self, stacks, opponent_points):
+        if len(self._hand) == 6:
+            time.sleep(0.002)
+
+        return super().pick_card(stacks, opponent_points)
+
+
+class CountingPlayer(DemoPlayer):
+    """demo player counting its pick_stack calls"""
+
+    def __init__(self):
+        super().__init__()
+        self.num_pick_stack = 0
+
+    def pick_stack(self, stacks, opponent_points, remaining_cards):
+        self.num_pick_stack += 1
+        return super().pick_stack(stacks, opponent_points, remaining_cards)
+
+
+def test_profiled_game_matches_unprofiled():
+    """tests that profiling does not change the outcome of a game"""
+
+    results = Dealer([DemoPlayer() for _ in range(4)], seed=3).simulate_game()
+
+    profiler = DealerProfiler()
+    profiled_results = Dealer([DemoPlayer() for _ in range(4)], seed=3,
+                              profiler=profiler).simulate_game()
+
+    assert profiled_results == results
+
+
+def test_report_counts():
+    """tests the call counts of every phase and player"""
+
+    players = [CountingPlayer(), CountingPlayer(), SlowPlayer()]
+    profiler = DealerProfiler()
+    Dealer(players, seed=1, profiler=profiler).simulate_game()
+
+    report = profiler.get_report()
+    rounds = report['rounds']
+    phases = report['phases']
+
+    assert report['games'] == 1
+    assert report['turns'] == rounds * 10
+    assert phases[DEAL]['calls'] == rounds
+    assert phases[PLACEMENT]['calls'] == rounds * 10
+    assert phases[PICK_CARD]['calls'] == rounds * 10 * len(players)
+
+    for name in range(len(players)):
+        assert report['players'][name][PICK_CARD]['calls'] == rounds * 10
+
+    for name in range(2):
+        pick_stack_calls = players[name].num_pick_stack
+        if pick_stack_calls:
+            assert report['players'][name][PICK_STACK][
+                'calls'] == pick_stack_calls
+
+    phase_seconds = sum(phases[phase]['seconds'] for phase in PHASES)
+    assert phase_seconds <= report['seconds']
+
+
+def test_slowest_decision():
+    """tests that the slowest pick_card is attributed to its player and turn"""
+
+    profiler = DealerProfiler()
+    Dealer([DemoPlayer(), SlowPlayer()], seed=2,
+           profiler=profiler).simulate_game()
+
+    slowest = profiler.get_report()['slowest'][PICK_CARD]
+
+    assert slowest['player'] == 1
+    assert slowest['turn'] == 4
+    assert slowest['seconds'] >= 0.002
+    assert 'slowest pick_card: player 1' in profiler.format_report()
+
+
+def test_decision_seat():
+    """tests that a pick_stack is attributed to the seat it was made for,
+    even when the same player sits in two seats"""
+
+    profiler = DealerProfiler()
+    player = CountingPlayer()
+    d = Dealer([player, player], seed=0, profiler=profiler)
+    d._stacks = [[Card(10, 3)], [Card(50, 1)], [Card(90, 1)], [Card(95, 1)]]
+
+    d.add_card_to_stacks(player, Card(2, 4), [0], [], player_name=1)
+
+    players = profiler.get_report()['players']
+    assert list(players) == [1]
+    assert players[1][PICK_STACK]['calls'] == player.num_pick_stack == 1
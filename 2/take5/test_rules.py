@@ -0,0 +1,93 @@
+import os
+import sys
+
+PATH_TO_PLAYER = '../../3/'
+sys.path.append(os.path.join(os.path.dirname(__file__), PATH_TO_PLAYER))
+
+import pytest
+
+from dealer import Dealer
+from gamelog import GameRecorder
+from player import Card, DemoPlayer
+from rules import (
+    HIGH_BULL_RULES, LARGE_DECK_RULES, SHORT_HAND_RULES, SIX_DEEP_RULES,
+    STANDARD_RULES, VARIANTS, Rules)
+
+
+def test_rules_creation():
+    """tests that rules do not accept unplayable numbers"""
+
+    with pytest.raises(ValueError):
+        Rules(hand_size=0)
+
+    with pytest.raises(ValueError):
+        Rules(min_bull=5, max_bull=4)
+
+    with pytest.raises(ValueError):
+        Rules(deck_size=20)
+
+    assert Rules() == STANDARD_RULES
+    assert Rules(stack_depth=6) == SIX_DEEP_RULES
+    assert len(set(VARIANTS.values())) == len(VARIANTS)
+
+
+def test_tables():
+    """tests the precomputed deck and player limits"""
+
+    assert STANDARD_RULES.new_deck() == [
+        Card(i, (i % 6) + 2) for i in range(1, 105)]
+    assert HIGH_BULL_RULES.new_deck() == [
+        Card(i, (i % 5) + 3) for i in range(1, 105)]
+    assert len(LARGE_DECK_RULES.new_deck()) == 209
+
+    assert STANDARD_RULES.max_players == 10
+    assert SHORT_HAND_RULES.max_players == 11
+    assert LARGE_DECK_RULES.max_players == 20
+
+
+def test_dealer_rules():
+    """tests that the dealer plays by its rules
+
+    cases:
+        - player counts are checked against the rules
+        - game logs are only recorded under the standard rules
+        - decks are checked against the rules
+        - hands, stacks and stack depth follow the rules
+    """
+
+    with pytest.raises(ValueError):
+        Dealer([DemoPlayer() for _ in range(11)])
+
+    Dealer([DemoPlayer() for _ in range(11)], rules=SHORT_HAND_RULES)
+
+    with pytest.raises(ValueError):
+        Dealer([DemoPlayer(), DemoPlayer()], recorder=GameRecorder(),
+               rules=SIX_DEEP_RULES)
+
+    with pytest.raises(ValueError):
+        Dealer([DemoPlayer(), DemoPlayer()], STANDARD_RULES.new_deck(),
+               rules=HIGH_BULL_RULES)
+
+    rules = Rules(hand_size=7, num_stacks=3, stack_depth=2)
+    d = Dealer([DemoPlayer(), DemoPlayer()], rules=rules, seed=0)
+    d._deck = d._initial_deck[:]
+
+    assert len(d.deal_hand()) == 7
+    assert len(d.get_new_stacks()) == 3
+
+    d._stacks = [[Card(10, 3), Card(5, 2)], [Card(50, 1)], [Card(90, 1)]]
+    player = DemoPlayer()
+    d.add_card_to_stacks(player, Card(20, 4), [0], [])
+
+    assert player.get_points() == -5
+    assert d._stacks[0] == [Card(20, 4)]
+
+
+def test_variants_side_by_side():
+    """tests playing games of every variant in one process"""
+
+    for rules in VARIANTS.values():
+        players = [DemoPlayer() for _ in range(rules.max_players)]
+        results = Dealer(players, seed=5, rules=rules).simulate_game()
+
+        assert results[0][1] <= rules.losing_points
@@ -0,0 +1,49 @@
+import pytest
+
+from scoreboard import OpponentPoints, Scoreboard
+
+
+def test_opponent_points():
+    """tests that opponent views leave out their own player
+
+    cases:
+        - indexing, negative indexing and slicing
+        - views follow removed points
+    """
+
+    scoreboard = Scoreboard([-1, -2, -3])
+
+    assert [list(scoreboard.get_opponent_points(i)) for i in range(3)] == [
+        [-2, -3], [-1, -3], [-1, -2]]
+
+    view = scoreboard.get_opponent_points(1)
+    assert len(view) == 2
+    assert view[0] == -1
+    assert view[-1] == -3
+    assert view[:1] == [-1]
+
+    with pytest.raises(IndexError):
+        view[2]
+
+    scoreboard.remove_points(2, 10)
+    assert view == [-1, -13]
+    assert scoreboard.points == [-1, -2, -13]
+
+
+def test_opponent_points_are_shared():
+    """tests that the same view is handed out every time"""
+
+    scoreboard = Scoreboard([0, 0])
+
+    assert (scoreboard.get_opponent_points(0) is
+            scoreboard.get_opponent_points(0))
+    assert isinstance(scoreboard.get_opponent_points(1), OpponentPoints)
+
+
+def test_remove_points():
+    """tests that negative points cannot be removed"""
+
+    scoreboard = Scoreboard([0, 0])
+
+    with pytest.raises(ValueError):
+        scoreboard.remove_points(0, -1)
@@ -0,0 +1,95 @@
+import os
+import sys
+
+PATH_TO_PLAYER = '../../3/'
+sys.path.append(os.path.join(os.path.dirname(__file__), PATH_TO_PLAYER))
+
+import pytest
+
+from player import DemoPlayer
+from rules import LARGE_DECK_RULES
+from tournament import (
+    TournamentResults, expand_seats, get_game_seeds, parse_seat_spec,
+    run_tournament, split_games)
+
+
+def test_expand_seats():
+    """tests expanding seat counts into one strategy per seat"""
+
+    assert expand_seats([(DemoPlayer, 2), (int, 1)]) == [
+        DemoPlayer, DemoPlayer, int]
+
+    with pytest.raises(ValueError):
+        expand_seats([(DemoPlayer, 1)])
+
+    with pytest.raises(ValueError):
+        expand_seats([(DemoPlayer, 11)])
+
+
+def test_add_game():
+    """tests aggregating game results
+
+    cases:
+        - single winner and loser
+        - tied seats all win
+    """
+
+    results = TournamentResults(['a', 'b', 'c'])
+    results.add_game([(2, -70), (0, -10), (1, -3)])
+    results.add_game([(0, -66), (1, -5), (2, -5)])
+
+    assert results.num_games == 2
+    assert results.wins == [0, 2, 1]
+    assert results.losses == [1, 0, 1]
+    assert results.points == [-76, -8, -75]
+
+
+def test_split_games():
+    """tests splitting games into tasks"""
+
+    assert split_games(10, 3) == [4, 3, 3]
+    assert split_games(2, 8) == [1, 1]
+    assert sum(split_games(1001, 16)) == 1001
+
+
+def test_parse_seat_spec():
+    """tests parsing seat specifications"""
+
+    assert parse_seat_spec('player:DemoPlayer=3') == (DemoPlayer, 3)
+    assert parse_seat_spec('player:DemoPlayer') == (DemoPlayer, 1)
+
+    with pytest.raises(ValueError):
+        parse_seat_spec('DemoPlayer=3')
+
+
+def test_run_tournament():
+    """tests running a tournament in process and across processes"""
+
+    for processes in [1, 2]:
+        results = run_tournament([(DemoPlayer, 3)], 20, processes)
+
+        assert results.num_games == 20
+        assert sum(results.losses) >= 20
+        assert all(points < 0 for points in results.points)
+
+
+def test_seeded_tournament():
+    """tests that seeded tournaments are reproducible across processes"""
+
+    assert get_game_seeds(3, None) == [None, None, None]
+    assert get_game_seeds(3, 10) == [10, 11, 12]
+
+    inline = run_tournament([(DemoPlayer, 4)], 30, 1, seed=7)
+    pooled = run_tournament([(DemoPlayer, 4)], 30, 3, seed=7)
+
+    assert inline.get_table() == pooled.get_table()
+
+
+def test_tournament_rules():
+    """tests that a tournament plays by its rules"""
+
+    with pytest.raises(ValueError):
+        run_tournament([(DemoPlayer, 12)], 1, 1)
+
+    results = run_tournament([(DemoPlayer, 12)], 4, 2, rules=LARGE_DECK_RULES)
+    assert results.num_games == 4
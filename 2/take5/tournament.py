@@ -0,0 +1,301 @@
+"""
+Runs tournaments of many 6 Nimmt! games spread across a pool of processes.
+
+A SeatSpec is a string "module:ClassName=count", for example
+"player:DemoPlayer=3" for three seats played by DemoPlayer. The count
+defaults to 1 when omitted.
+"""
+
+import argparse
+import importlib
+import multiprocessing
+import os
+import random
+import sys
+
+PATH_TO_PLAYER = '../../3/'
+sys.path.append(os.path.join(os.path.dirname(__file__), PATH_TO_PLAYER))
+
+from dealer import Dealer
+from rules import STANDARD_RULES, VARIANTS
+
+MAX_GAMES_PER_TASK = 500
+TASKS_PER_PROCESS = 8
+
+
+class TournamentResults:
+    """aggregate win/loss/points tables for the seats of a tournament
+
+    a seat wins a game if no other seat finished with more points and
+    loses a game if no other seat finished with fewer points, so ties count
+    for every tied seat
+    """
+
+    def __init__(self, seat_names):
+        """creates TournamentResults
+
+        :param seat_names: name of the strategy playing in each seat
+        :type seat_names: list of str
+        """
+
+        self.seat_names = seat_names
+        self.num_games = 0
+        self.wins = [0] * len(seat_names)
+        self.losses = [0] * len(seat_names)
+        self.points = [0] * len(seat_names)
+
+    def add_game(self, results):
+        """adds the results of a single game to the tables
+
+        :param results: results of a game as given by Dealer.get_results
+        :type results: list of (int, int)
+        """
+
+        best_points = max(points for _, points in results)
+        worst_points = min(points for _, points in results)
+
+        for seat, points in results:
+            self.points[seat] += points
+
+            if points == best_points:
+                self.wins[seat] += 1
+
+            if points == worst_points:
+                self.losses[seat] += 1
+
+        self.num_games += 1
+
+    def get_table(self):
+        """gets one row of aggregate results per seat
+
+        :returns: (seat, strategy, wins, losses, total points, mean points)
+        :rtype: list of (int, str, int, int, int, float)
+        """
+
+        return [
+            (seat, name, self.wins[seat], self.losses[seat],
+             self.points[seat], self.points[seat] / max(self.num_games, 1))
+            for seat, name in enumerate(self.seat_names)
+        ]
+
+    def format_table(self):
+        """formats the aggregate results as a printable table
+
+        :returns: table with a header line and one line per seat
+        :rtype: str
+        """
+
+        fmt = '{:>4} {:<24} {:>8} {:>8} {:>12} {:>10}'
+        lines = [fmt.format(
+            'seat', 'strategy', 'wins', 'losses', 'points', 'mean')]
+
+        for seat, name, wins, losses, points, mean in self.get_table():
+            lines.append(fmt.format(
+                seat, name, wins, losses, points, '{:.2f}'.format(mean)))
+
+        return '\n'.join(lines)
+
+
+def expand_seats(seats, max_seats=STANDARD_RULES.max_players):
+    """expands (strategy class, count) pairs into one class per seat
+
+    :param seats: strategy classes and the number of seats each plays
+    :type seats: list of (class BasePlayer, int)
+
+    :param max_seats: largest number of seats a game can be dealt to
+    :type max_seats: int
+
+    :returns: strategy class for every seat
+    :rtype: list of class BasePlayer
+    """
+
+    strategies = [
+        strategy for strategy, count in seats for _ in range(count)]
+
+    if len(strategies) < 2 or len(strategies) > max_seats:
+        raise ValueError(
+            'number of seats must be in interval [2, {}]'.format(max_seats))
+
+    return strategies
+
+
+def play_games(strategies, game_seeds, rules=None):
+    """plays games with fresh players and returns every game's results
+
+    :param strategies: strategy class for every seat
+    :type strategies: list of class BasePlayer
+
+    :param game_seeds: dealer seed for each game to play
+    :type game_seeds: list of (int or None)
+
+    :param rules: rules of every game, the standard rules if None
+    :type rules: Rules or None
+
+    :returns: results of each game as given by Dealer.get_results
+    :rtype: list of list of (int, int)
+    """
+
+    all_results = []
+    for seed in game_seeds:
+        players = [strategy() for strategy in strategies]
+        dealer = Dealer(players, seed=seed, rules=rules)
+        all_results.append(dealer.simulate_game())
+
+    return all_results
+
+
+def _play_task(task):
+    """plays one task's worth of games inside a worker process"""
+
+    strategies, game_seeds, rules = task
+    return play_games(strategies, game_seeds, rules)
+
+
+def _seed_worker():
+    """reseeds the global random state of a freshly forked worker
+
+    forked workers inherit the parent's random state and would otherwise
+    make identical random choices in strategies that use it
+    """
+
+    random.seed()
+
+
+def get_game_seeds(num_games, seed):
+    """gets the dealer seed of every game in a tournament
+
+    :param num_games: number of games
+    :type num_games: int
+
+    :param seed: seed of the tournament, or None for unseeded games
+    :type seed: int or None
+
+    :returns: seed for each game
+    :rtype: list of (int or None)
+    """
+
+    if seed is None:
+        return [None] * num_games
+
+    return [seed + i for i in range(num_games)]
+
+
+def split_games(num_games, num_tasks):
+    """splits a number of games into roughly equal task sizes
+
+    :param num_games: total number of games
+    :type num_games: int
+
+    :param num_tasks: number of tasks to split into
+    :type num_tasks: int
+
+    :returns: number of games for each task
+    :rtype: list of int
+    """
+
+    num_tasks = max(1, min(num_tasks, num_games))
+    base, extra = divmod(num_games, num_tasks)
+
+    return [base + (1 if i < extra else 0) for i in range(num_tasks)]
+
+
+def run_tournament(seats, num_games, processes=None, seed=None, rules=None):
+    """plays a tournament and aggregates the results of every game
+
+    games are played in batches by a pool of worker processes and their
+    results are added to the tables as soon as each batch finishes
+
+    :param seats: strategy classes and the number of seats each plays
+    :type seats: list of (class BasePlayer, int)
+
+    :param num_games: number of games to play
+    :type num_games: int
+
+    :param processes: number of worker processes, defaults to the CPU count
+    :type processes: int or None
+
+    :param seed: seed making the tournament's deals reproducible, game i is
+                 dealt with seed + i
+    :type seed: int or None
+
+    :param rules: rules of every game, the standard rules if None
+    :type rules: Rules or None
+
+    :returns: aggregate results
+    :rtype: TournamentResults
+    """
+
+    strategies = expand_seats(
+        seats, (rules or STANDARD_RULES).max_players)
+    results = TournamentResults([s.__name__ for s in strategies])
+
+    if num_games < 1:
+        return results
+
+    processes = processes or os.cpu_count() or 1
+    game_seeds = get_game_seeds(num_games, seed)
+
+    if processes == 1:
+        for game_results in play_games(strategies, game_seeds, rules):
+            results.add_game(game_results)
+        return results
+
+    num_tasks = max(processes * TASKS_PER_PROCESS,
+                    -(-num_games // MAX_GAMES_PER_TASK))
+
+    tasks = []
+    start = 0
+    for task_games in split_games(num_games, num_tasks):
+        tasks.append(
+            (strategies, game_seeds[start:start + task_games], rules))
+        start += task_games
+
+    with multiprocessing.Pool(processes, initializer=_seed_worker) as pool:
+        for batch in pool.imap_unordered(_play_task, tasks):
+            for game_results in batch:
+                results.add_game(game_results)
+
+    return results
+
+
+def parse_seat_spec(seat_spec):
+    """parses a SeatSpec into a strategy class and a seat count
+
+    :param seat_spec: seat specification
+    :type seat_spec: SeatSpec
+
+    :returns: strategy class and number of seats
+    :rtype: (class BasePlayer, int)
+    """
+
+    path, _, count = seat_spec.partition('=')
+    module_name, _, class_name = path.partition(':')
+
+    if not module_name or not class_name:
+        raise ValueError('seat must be given as module:ClassName=count')
+
+    strategy = getattr(importlib.import_module(module_name), class_name)
+    return strategy, int(count) if count else 1
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='plays a tournament of 6 Nimmt! games')
+    parser.add_argument('seats', nargs='+', metavar='module:Class=count')
+    parser.add_argument('-n', '--games', type=int, default=1000)
+    parser.add_argument('-p', '--processes', type=int, default=None)
+    parser.add_argument('-s', '--seed', type=int, default=None)
+    parser.add_argument('-r', '--rules', choices=sorted(VARIANTS),
+                        default='standard')
+    args = parser.parse_args()
+
+    seats = [parse_seat_spec(seat_spec) for seat_spec in args.seats]
+    results = run_tournament(seats, args.games, args.processes, args.seed,
+                             VARIANTS[args.rules])
+
+    print('games played: {}'.format(results.num_games))
+    print(results.format_table())
+
+
+if __name__ == '__main__':
+    main()
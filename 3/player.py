@@ -5,6 +5,12 @@ Implementers should inhereit from the BasePlayer class and override the
 following methods:
     - pick_card
     - pick_stack
+
+Strategies can only rely on stacks being a list of list of Card, as sent
+by player_proxy. The in-process Dealer passes a StackBoard
+(2/take5/board.py) instead, which reads like one and also answers
+find_stack(card) and find_stacks(hand) with the index of the stack each
+card would be placed on; a strategy may use these when they are present.
 """
 
 from collections import namedtuple
@@ -0,0 +1,322 @@
+"""
+A player that searches for its card with rollouts instead of a fixed rule.
+
+For every card in its hand, the player repeatedly samples cards for its
+opponents from the cards it has not seen this round and plays out the next
+few turns. Each card is scored by the average bull points the player picked
+up in those rollouts. Averages are kept in a bounded transposition table so
+positions that come up again start from their earlier rollouts, and search
+stops once the per-decision time budget is spent.
+"""
+
+import os
+import sys
+
+PATH_TO_DEALER = '../2/take5/'
+sys.path.append(os.path.join(os.path.dirname(__file__), PATH_TO_DEALER))
+
+import random
+import time
+from collections import OrderedDict
+
+from player import BasePlayer
+from rules import STANDARD_RULES
+
+
+class TranspositionTable:
+    """bounded table of rollout totals, evicting least recently used entries
+
+    a Position is a hashable description of a board, the hand, a card to
+    play from it and the number of opponents
+    """
+
+    def __init__(self, max_size):
+        """creates a TranspositionTable
+
+        :param max_size: maximum number of positions kept
+        :type max_size: int
+        """
+
+        self._max_size = max_size
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, position):
+        """gets the rollout totals of a position, adding it if it is new
+
+        :param position: position to look up
+        :type position: Position
+
+        :returns: [total bull points picked up, number of rollouts]
+        :rtype: list of int
+        """
+
+        entries = self._entries
+
+        try:
+            entry = entries[position]
+            entries.move_to_end(position)
+        except KeyError:
+            entry = entries[position] = [0, 0]
+            if len(entries) > self._max_size:
+                entries.popitem(last=False)
+
+        return entry
+
+
+class SearchPlayer(BasePlayer):
+    """player that picks cards by sampling rollouts within a time budget"""
+
+    DEFAULT_TIME_BUDGET = 0.05
+    DEFAULT_TABLE_SIZE = 20000
+    DEFAULT_ROLLOUT_TURNS = 3
+    DEFAULT_NUM_OPPONENTS = 3
+
+    def __init__(self, time_budget=DEFAULT_TIME_BUDGET,
+                 table_size=DEFAULT_TABLE_SIZE,
+                 rollout_turns=DEFAULT_ROLLOUT_TURNS,
+                 num_opponents=DEFAULT_NUM_OPPONENTS,
+                 deck=None, seed=None, rules=None):
+        """creates a SearchPlayer
+
+        :param time_budget: seconds to spend searching for each card
+        :type time_budget: float
+
+        :param table_size: maximum number of positions remembered
+        :type table_size: int
+
+        :param rollout_turns: number of turns each rollout plays out
+        :type rollout_turns: int
+
+        :param num_opponents: number of opponents assumed when the opponent
+                              points are not given
+        :type num_opponents: int
+
+        :param deck: cards the game is played with, defaults to the deck
+                     of the rules
+        :type deck: list of Card or None
+
+        :param seed: seed for sampling opponent cards
+        :type seed: int or None
+
+        :param rules: rules of the game, the standard rules if None
+        :type rules: Rules or None
+        """
+
+        super().__init__()
+
+        if rules is None:
+            rules = STANDARD_RULES
+
+        if deck is None:
+            deck = rules.new_deck()
+
+        self._time_budget = time_budget
+        self._rollout_turns = rollout_turns
+        self._stack_depth = rules.stack_depth
+        self._num_opponents = num_opponents
+        self._table = TranspositionTable(table_size)
+        self._random = random.Random(seed)
+
+        self._bulls = {card.face: card.bull for card in deck}
+        self._seen = set()
+
+    def set_hand(self, new_hand):
+        """sets the hand of the player and forgets the cards seen last round
+
+        :param new_hand: new hand for the player
+        :type new_hand: list of Card
+        """
+
+        super().set_hand(new_hand)
+        self._seen = set(card.face for card in new_hand)
+        self._bulls.update((card.face, card.bull) for card in new_hand)
+
+    def pick_card(self, stacks, opponent_points):
+        """picks the card with the fewest expected bull points
+
+        :param stacks: current state of the stacks in the game
+        :type stacks: list of list of Card
+
+        :param opponent_points: number of points each opponent has
+        :type opponent_points: list of int or None
+
+        :returns: card to play from the player's hand
+        :rtype: Card
+        """
+
+        for stack in stacks:
+            for card in stack:
+                if card.face not in self._seen:
+                    self._seen.add(card.face)
+                    self._bulls[card.face] = card.bull
+
+        if len(self._hand) == 1:
+            return self._hand.pop()
+
+        if opponent_points is None:
+            num_opponents = self._num_opponents
+        else:
+            num_opponents = len(opponent_points)
+
+        unseen = [face for face in self._bulls if face not in self._seen]
+        board = self._summarize(stacks)
+        scores = self._search(board, unseen, num_opponents)
+
+        best_index = min(range(len(self._hand)),
+                         key=lambda i: (scores[i], self._hand[i].face))
+
+        return self._hand.pop(best_index)
+
+    def pick_stack(self, stacks, opponent_points, remaining_cards):
+        """chooses the stack with the fewest bull points
+
+        :param stacks: current state of the stacks in the game
+        :type stacks: list of list of Card
+
+        :param opponent_points: number of points each opponent has
+        :type opponent_points: list of int or None
+
+        :param remaining_cards: cards yet to be played in the turn
+        :type remaining_cards: list of Card or None
+
+        :returns: index of the stack to pick up
+        :rtype: int
+        """
+
+        _, _, bull_totals = self._summarize(stacks)
+        return min(range(len(bull_totals)), key=bull_totals.__getitem__)
+
+    def get_table(self):
+        """gets the transposition table
+
+        :returns: transposition table
+        :rtype: TranspositionTable
+        """
+
+        return self._table
+
+    def _search(self, board, unseen, num_opponents):
+        """runs rollouts for every card in the hand until the budget is spent
+
+        every card gets at least one rollout
+
+        :param board: summary of the stacks
+        :type board: (tuple of int, tuple of int, tuple of int)
+
+        :param unseen: faces of cards not seen this round
+        :type unseen: list of int
+
+        :param num_opponents: number of opponents
+        :type num_opponents: int
+
+        :returns: average bull points picked up for each card in the hand
+        :rtype: list of float
+        """
+
+        deadline = time.perf_counter() + self._time_budget
+        hand_key = tuple(sorted(card.face for card in self._hand))
+        num_opponents = min(num_opponents, len(unseen))
+
+        entries = [
+            self._table.get((board, hand_key, card.face, num_opponents))
+            for card in self._hand
+        ]
+
+        while True:
+            for i, card in enumerate(self._hand):
+                entries[i][0] += self._rollout(
+                    board, card.face, unseen, num_opponents)
+                entries[i][1] += 1
+
+            if time.perf_counter() >= deadline:
+                break
+
+        return [total / count for total, count in entries]
+
+    def _rollout(self, board, face, unseen, num_opponents):
+        """plays out the next turns once with sampled opponent cards
+
+        the first turn plays the given card, later turns play random cards
+        from the rest of the hand
+
+        :param board: summary of the stacks
+        :type board: (tuple of int, tuple of int, tuple of int)
+
+        :param face: face of the card to evaluate
+        :type face: int
+
+        :param unseen: faces of cards not seen this round
+        :type unseen: list of int
+
+        :param num_opponents: number of opponents
+        :type num_opponents: int
+
+        :returns: bull points picked up by the player
+        :rtype: int
+        """
+
+        tops, lengths, bull_totals = (list(summary) for summary in board)
+        bulls = self._bulls
+        rand = self._random
+
+        rest_of_hand = [c.face for c in self._hand if c.face != face]
+        rand.shuffle(rest_of_hand)
+
+        num_turns = min(self._rollout_turns, len(rest_of_hand) + 1,
+                        len(unseen) // max(num_opponents, 1))
+        opponent_faces = rand.sample(unseen, num_turns * num_opponents)
+
+        penalty = 0
+        for turn in range(max(num_turns, 1)):
+            played = opponent_faces[
+                turn * num_opponents:(turn + 1) * num_opponents]
+            own_face = face if turn == 0 else rest_of_hand[turn - 1]
+
+            for card_face in sorted(played + [own_face]):
+                stack = None
+                closest_face = 0
+
+                for i, top_face in enumerate(tops):
+                    if closest_face < top_face < card_face:
+                        stack = i
+                        closest_face = top_face
+
+                if stack is not None and lengths[stack] < self._stack_depth:
+                    tops[stack] = card_face
+                    lengths[stack] += 1
+                    bull_totals[stack] += bulls[card_face]
+                    continue
+
+                if stack is None:
+                    stack = bull_totals.index(min(bull_totals))
+
+                if card_face == own_face:
+                    penalty += bull_totals[stack]
+
+                tops[stack] = card_face
+                lengths[stack] = 1
+                bull_totals[stack] = bulls[card_face]
+
+        return penalty
+
+    @staticmethod
+    def _summarize(stacks):
+        """summarizes stacks as their top faces, lengths and bull totals
+
+        :param stacks: stacks ordered top to bottom
+        :type stacks: StackBoard or list of list of Card
+
+        :returns: top faces, lengths and bull totals of the stacks
+        :rtype: (tuple of int, tuple of int, tuple of int)
+        """
+
+        if hasattr(stacks, 'bull_totals'):
+            return (tuple(stacks.top_faces), tuple(stacks.lengths),
+                    tuple(stacks.bull_totals))
+
+        return (tuple(stack[0].face for stack in stacks),
+                tuple(len(stack) for stack in stacks),
+                tuple(sum(card.bull for card in stack) for stack in stacks))
@@ -0,0 +1,100 @@
+import os
+import sys
+
+PATH_TO_DEALER = '../2/take5/'
+sys.path.append(os.path.join(os.path.dirname(__file__), PATH_TO_DEALER))
+
+from dealer import Dealer
+from player import Card, DemoPlayer
+from rules import SIX_DEEP_RULES
+from search_player import SearchPlayer, TranspositionTable
+
+
+def test_transposition_table():
+    """tests that the table keeps the most recently used positions"""
+
+    table = TranspositionTable(2)
+    table.get('a')[0] += 5
+    table.get('b')
+    table.get('a')
+    table.get('c')
+
+    assert len(table) == 2
+    assert table.get('a') == [5, 0]
+    assert table.get('b') == [0, 0]
+
+
+def test_pick_card_avoids_sixth_card():
+    """tests that the player avoids placing the sixth card on a stack
+
+    cases:
+        - the only safe card is played
+        - the played card is removed from the hand
+    """
+
+    player = SearchPlayer(time_budget=0.01, num_opponents=1, seed=0)
+    player.set_hand([Card(50, 5), Card(90, 2)])
+
+    full_stack = [Card(49 - i, 7) for i in range(5)]
+    stacks = [full_stack, [Card(80, 2)], [Card(3, 2)], [Card(2, 2)]]
+
+    assert player.pick_card(stacks, None) == Card(90, 2)
+    assert player.get_num_cards_in_hand() == 1
+    assert len(player.get_table()) == 2
+
+
+def test_hands_do_not_share_positions():
+    """tests that positions with the same board and card but different
+    hands are kept apart"""
+
+    player = SearchPlayer(time_budget=0.001, seed=0)
+    stacks = [[Card(10, 2)], [Card(30, 2)], [Card(60, 2)], [Card(90, 2)]]
+
+    player.set_hand([Card(50, 2), Card(95, 2)])
+    player.pick_card(stacks, [0])
+    player.set_hand([Card(50, 2), Card(20, 2)])
+    player.pick_card(stacks, [0])
+
+    assert len(player.get_table()) == 4
+
+
+def test_stack_depth_of_rules():
+    """tests that a stack takes as many cards as the rules allow
+
+    cases:
+        - standard rules --> the sixth card takes the stack
+        - six-deep rules --> the sixth card is placed safely
+    """
+
+    def pick_card(rules):
+        deep_stack = [Card(49 - i, 7) for i in range(5)]
+        stacks = [deep_stack, [Card(80, 2)], [Card(3, 2)], [Card(2, 2)]]
+
+        player = SearchPlayer(time_budget=0.001, rollout_turns=1, seed=0,
+                              rules=rules)
+        player.set_hand([Card(50, 5), Card(81, 2)])
+
+        return player.pick_card(stacks, [])
+
+    assert pick_card(None) == Card(81, 2)
+    assert pick_card(SIX_DEEP_RULES) == Card(50, 5)
+
+
+def test_pick_stack():
+    """tests that the stack with the fewest bull points is picked"""
+
+    player = SearchPlayer()
+    stacks = [[Card(10, 5)], [Card(20, 2), Card(15, 1)], [Card(30, 4)]]
+
+    assert player.pick_stack(stacks, [0], []) == 1
+
+
+def test_plays_with_dealer():
+    """tests that the player plays complete games against the dealer"""
+
+    players = [SearchPlayer(time_budget=0.001, seed=1), DemoPlayer(),
+               DemoPlayer()]
+    results = Dealer(players, seed=1).simulate_game()
+
+    assert sorted(name for name, _ in results) == [0, 1, 2]
+    assert all(p.get_num_cards_in_hand() == 0 for p in players)
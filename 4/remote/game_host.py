@@ -0,0 +1,997 @@
+"""
+Hosts 6 Nimmt! games for players connecting over TCP.
+
+Players connect with player_proxy.py and are seated in the order they
+connect; every time enough players are waiting, a new game starts. Many
+games run concurrently on one asyncio event loop. Within a turn, every
+seat is sent its take-turn request at once and the replies are gathered
+together, so a turn takes as long as its slowest player rather than the
+sum of all players. choose requests are made one at a time, in the order
+the cards are placed, since each depends on the board the previous card
+left.
+
+Messages and replies are the JSON of the player protocol, as described in
+player_proxy.py, each followed by a newline. A host offering the binary
+codec asks each connection for it before its first request and, if the
+proxy agrees, sends Frames instead. A batching host sends each seat its
+start-round and the round's first take-turn together in one Batch, since
+the first take-turn only needs the freshly dealt stacks.
+
+A resuming host expects every connection to open with a Resume, as
+described in player_proxy.py. A player whose connection drops mid-game
+gets some time to reconnect under the same session; once it has, the
+host sends again any request the player did not answer and the game
+carries on. Once a game ends, each of its players is sent a GameOver
+before its connection is closed. Resuming does not apply to multiplexed
+clients.
+
+A multiplexing host instead treats each connection as a client able to
+play many games at once: once enough clients connect, every game is
+started with one seat per client, and each seat's messages are wrapped in
+an Envelope naming the seat's session.
+"""
+
+import os
+import sys
+
+PATH_TO_PLAYER = '../../3/'
+PATH_TO_DEALER = '../../2/take5/'
+sys.path.append(os.path.join(os.path.dirname(__file__), PATH_TO_PLAYER))
+sys.path.append(os.path.join(os.path.dirname(__file__), PATH_TO_DEALER))
+
+import argparse
+import asyncio
+import json
+
+from dealer import Dealer
+from player import Card
+from player_proxy import (BINARY_CODEC, FRAME_HEADER, GAME_OVER, JSON_CODEC,
+                          MAX_FRAME_SIZE, RESYNC, SUPPORTED_CODECS,
+                          board_checksum, decode_payload, encode_frame)
+
+SERVER = 'localhost'
+PORT = 45678
+
+DEFAULT_PLAYERS_PER_GAME = 4
+DEFAULT_REPLY_TIMEOUT = 5.0
+DEFAULT_RESUME_TIMEOUT = 10.0
+
+
+def deck_to_json(stacks):
+    """converts stacks to a Deck
+
+    :param stacks: stacks ordered top to bottom
+    :type stacks: StackBoard or list of list of Card
+
+    :returns: json representation of the stacks
+    :rtype: Deck
+    """
+
+    return [[[card.face, card.bull] for card in stack] for stack in stacks]
+
+
+def get_board_delta(previous, current):
+    """gets the Delta turning one Deck into another with the same stacks
+
+    a stack that only gained cards on top is sent as pushes, any other
+    changed stack is sent whole
+
+    :param previous: deck the receiver has
+    :type previous: Deck
+
+    :param current: deck to send
+    :type current: Deck
+
+    :returns: changes from the previous deck to the current one
+    :rtype: Delta
+    """
+
+    ops = []
+
+    for i, (old, new) in enumerate(zip(previous, current)):
+        num_added = len(new) - len(old)
+
+        if num_added >= 0 and new[num_added:] == old:
+            for card in reversed(new[:num_added]):
+                ops.append(['push', i, card])
+        else:
+            ops.append(['set', i, new])
+
+    return {'ops': ops, 'crc': board_checksum(current)}
+
+
+class RemotePlayer:
+    """a seat played by a remote player over a stream
+
+    keeps the player's hand and points on the host so the Dealer can
+    inspect them, and asks the remote player for every decision
+
+    cards are asked for with the coroutine take_turn, so a RemotePlayer has
+    no pick_card and is not a BasePlayer; it can only be seated at an
+    AsyncDealer
+    """
+
+    def __init__(self, reader, writer, reply_timeout=DEFAULT_REPLY_TIMEOUT,
+                 deltas=False, resume_timeout=None, binary=False,
+                 batch=False):
+        """creates a RemotePlayer
+
+        :param reader: stream to read replies from
+        :type reader: asyncio.StreamReader
+
+        :param writer: stream to write messages to
+        :type writer: asyncio.StreamWriter
+
+        :param reply_timeout: seconds to wait for a reply, None to wait
+                              forever
+        :type reply_timeout: float or None
+
+        :param deltas: whether to offer the player Deltas instead of Decks
+        :type deltas: bool
+
+        :param resume_timeout: seconds to wait for the player to resume
+                               after its connection drops, None if it may
+                               not resume
+        :type resume_timeout: float or None
+
+        :param binary: whether to offer the player the binary codec
+        :type binary: bool
+
+        :param batch: whether to send start-round and the first take-turn
+                      of a round in one Batch
+        :type batch: bool
+        """
+
+        self._hand = []
+        self._points = 0
+
+        self._reader = reader
+        self._writer = writer
+        self._reply_timeout = reply_timeout
+        self._chosen_stack = None
+
+        self._batch = batch
+        self._batched_card = None
+
+        self._offer_deltas = deltas
+        self._deltas = False
+        self._sent_deck = None
+
+        self.session_id = None
+        self._resume_timeout = resume_timeout
+        self._num_answered = 0
+        self._reply_resent = False
+        self._connection_number = 0
+        self._reconnected = None
+
+        self._offer_binary = binary
+        self._codec = None
+
+    async def request(self, msg):
+        """sends a message and waits for the reply
+
+        :param msg: message to send
+        :type msg: JSON
+
+        :returns: reply of the remote player
+        :rtype: JSON
+
+        :raises: ConnectionError if the player disconnects, ValueError if
+                 the reply is not JSON, asyncio.TimeoutError if the player
+                 takes too long
+        """
+
+        while True:
+            connection_number = self._connection_number
+
+            try:
+                return await self._exchange(msg)
+            except ConnectionError:
+                if self._resume_timeout is None:
+                    raise
+
+            if connection_number == self._connection_number:
+                await self._wait_for_resume()
+
+    async def _exchange(self, msg):
+        """sends a message over the current connection and reads the reply
+
+        after a resume in which the player had already replied, only the
+        reply is read
+
+        :param msg: message to send
+        :type msg: JSON
+
+        :returns: reply of the remote player
+        :rtype: JSON
+        """
+
+        if self._reply_resent:
+            self._reply_resent = False
+        else:
+            if self._codec is None:
+                await self._negotiate_codec()
+
+            await self._write(msg)
+
+        reply = await asyncio.wait_for(self._read(), self._reply_timeout)
+
+        self._num_answered += 1
+        return reply
+
+    async def _negotiate_codec(self):
+        """agrees on the codec of the current connection
+
+        :raises: ValueError if the player replies with an unknown codec
+        """
+
+        self._codec = JSON_CODEC
+
+        if not self._offer_binary:
+            return
+
+        await self._write(['codec', SUPPORTED_CODECS])
+        codec = await asyncio.wait_for(self._read(), self._reply_timeout)
+
+        if codec not in SUPPORTED_CODECS:
+            raise ValueError('player replied with an unknown codec')
+
+        self._codec = codec
+
+    async def _write(self, msg):
+        """writes a message with the codec of the connection
+
+        :param msg: message to write
+        :type msg: JSON
+        """
+
+        if self._codec == BINARY_CODEC:
+            self._writer.write(encode_frame(msg))
+        else:
+            self._writer.write(str.encode(json.dumps(msg) + '\n'))
+
+        await self._writer.drain()
+
+    async def _read(self):
+        """reads a reply with the codec of the connection
+
+        :returns: reply of the remote player
+        :rtype: JSON
+        """
+
+        if self._codec != BINARY_CODEC:
+            line = await self._reader.readline()
+            if not line:
+                raise ConnectionError('player disconnected')
+
+            return json.loads(line.decode('utf-8'))
+
+        try:
+            header = await self._reader.readexactly(FRAME_HEADER.size)
+            [size] = FRAME_HEADER.unpack(header)
+
+            if size > MAX_FRAME_SIZE:
+                raise ValueError('frame of {} bytes is too large'.format(size))
+
+            payload = await self._reader.readexactly(size)
+        except asyncio.IncompleteReadError:
+            raise ConnectionError('player disconnected')
+
+        return decode_payload(payload)
+
+    async def _wait_for_resume(self):
+        """waits for the player to reconnect
+
+        :raises: ConnectionError if the player does not resume in time
+        """
+
+        self._reconnected = asyncio.get_running_loop().create_future()
+
+        try:
+            await asyncio.wait_for(self._reconnected, self._resume_timeout)
+        except asyncio.TimeoutError:
+            raise ConnectionError('player did not resume')
+        finally:
+            self._reconnected = None
+
+    def resume(self, reader, writer, num_replies):
+        """continues the player's session over a new connection
+
+        :param reader: stream to read replies from
+        :type reader: asyncio.StreamReader
+
+        :param writer: stream to write messages to
+        :type writer: asyncio.StreamWriter
+
+        :param num_replies: number of replies the player says it has sent
+        :type num_replies: int
+        """
+
+        self._writer.close()
+
+        self._reader = reader
+        self._writer = writer
+        self._codec = None
+        self._connection_number += 1
+        self._reply_resent = num_replies == self._num_answered + 1
+
+        writer.write(str.encode(
+            json.dumps(['resumed', self._num_answered]) + '\n'))
+
+        if self._reconnected is not None and not self._reconnected.done():
+            self._reconnected.set_result(None)
+
+    async def start_round(self, hand, stacks=None):
+        """deals a new hand to the player
+
+        a batching player is asked for its first card of the round along
+        with the hand, and take_turn answers with that card
+
+        :param hand: hand for the player
+        :type hand: list of Card
+
+        :param stacks: stacks the round starts with, needed for batching
+        :type stacks: StackBoard or None
+        """
+
+        self.set_hand(hand)
+        self._sent_deck = None
+        self._batched_card = None
+
+        msg = ['start-round', [[card.face, card.bull] for card in hand]]
+        if self._offer_deltas:
+            msg.append({'deltas': True})
+
+        if self._batch and stacks is not None:
+            deck = deck_to_json(stacks)
+            replies = await self.request(['batch', [msg, ['take-turn', deck]]])
+
+            if not isinstance(replies, list) or len(replies) != 2:
+                raise ValueError('player did not answer the whole batch')
+
+            reply, self._batched_card = replies
+            self._sent_deck = deck
+        else:
+            reply = await self.request(msg)
+
+        if reply == {'deltas': True} and self._offer_deltas:
+            self._deltas = True
+        elif reply is True:
+            self._deltas = False
+        else:
+            raise ValueError('player did not acknowledge the round')
+
+    async def request_with_deck(self, request_type, stacks):
+        """sends a request about the stacks, as a Delta when possible
+
+        :param request_type: take-turn or choose
+        :type request_type: str
+
+        :param stacks: current state of the stacks in the game
+        :type stacks: StackBoard
+
+        :returns: reply of the remote player and the Deck of the stacks
+        :rtype: (JSON, Deck)
+        """
+
+        deck = deck_to_json(stacks)
+
+        if self._deltas and self._sent_deck is not None:
+            reply = await self.request(
+                [request_type, get_board_delta(self._sent_deck, deck)])
+            if reply != RESYNC:
+                self._sent_deck = deck
+                return reply, deck
+
+        reply = await self.request([request_type, deck])
+        self._sent_deck = deck
+
+        return reply, deck
+
+    async def take_turn(self, stacks):
+        """asks the player for the card to play this turn
+
+        :param stacks: current state of the stacks in the game
+        :type stacks: StackBoard
+
+        :returns: card the player played, removed from its hand
+        :rtype: Card
+        """
+
+        if self._batched_card is not None:
+            reply, self._batched_card = self._batched_card, None
+        else:
+            reply, _ = await self.request_with_deck('take-turn', stacks)
+
+        if not isinstance(reply, list) or len(reply) != 2:
+            raise ValueError('player replied with an invalid card')
+
+        card = Card(*reply)
+        if card not in self._hand:
+            raise ValueError('player played a card not in its hand')
+
+        self._hand.remove(card)
+        return card
+
+    async def choose(self, stacks):
+        """asks the player which stack to pick up and remembers the answer
+        for the Dealer's next pick_stack
+
+        :param stacks: current state of the stacks in the game
+        :type stacks: StackBoard
+        """
+
+        reply, deck = await self.request_with_deck('choose', stacks)
+
+        if reply not in deck:
+            raise ValueError('player chose a stack that does not exist')
+
+        self._chosen_stack = deck.index(reply)
+
+    def pick_stack(self, stacks, opponent_points, remaining_cards):
+        """gets the stack chosen by the last call to choose
+
+        :returns: index of the stack to pick up
+        :rtype: int
+        """
+
+        chosen_stack, self._chosen_stack = self._chosen_stack, None
+
+        if chosen_stack is None:
+            raise ValueError('no stack was chosen')
+
+        return chosen_stack
+
+    def set_hand(self, new_hand):
+        """sets the hand of the player to the new hand
+
+        :param new_hand: new hand for the player
+        :type new_hand: list of Card
+        """
+
+        self._hand = new_hand
+
+    def get_num_cards_in_hand(self):
+        """gets the number of cards in a player's hand
+
+        :returns: number of cards in player hand
+        :rtype: int
+        """
+
+        return len(self._hand)
+
+    def get_points(self):
+        """gets the player's current points
+
+        :returns: current number of points for a player
+        :rtype: int
+        """
+
+        return self._points
+
+    def remove_points(self, num_points):
+        """removes points from the player
+
+        :param num_points: non-negative number of points to remove
+        :type num_points: int
+        """
+
+        if num_points < 0:
+            raise ValueError("num_points must be greater than or equal to 0")
+
+        self._points -= num_points
+
+    async def end_game(self):
+        """tells a resuming player its game is over, so it does not take
+        the closing connection for a dropped one"""
+
+        if self._resume_timeout is None:
+            return
+
+        try:
+            await asyncio.wait_for(
+                self._write([GAME_OVER]), self._reply_timeout)
+        except (OSError, asyncio.TimeoutError):
+            pass
+
+    def close(self):
+        """closes the connection to the player"""
+
+        self._writer.close()
+
+
+class MuxConnection:
+    """a connection carrying the sessions of many seats as Envelopes"""
+
+    def __init__(self, reader, writer, reply_timeout=DEFAULT_REPLY_TIMEOUT):
+        """creates a MuxConnection and starts dispatching its replies
+
+        :param reader: stream to read replies from
+        :type reader: asyncio.StreamReader
+
+        :param writer: stream to write messages to
+        :type writer: asyncio.StreamWriter
+
+        :param reply_timeout: seconds to wait for a reply, None to wait
+                              forever
+        :type reply_timeout: float or None
+        """
+
+        self._reader = reader
+        self._writer = writer
+        self._reply_timeout = reply_timeout
+        self._pending = {}
+        self._error = None
+        self._dispatcher = asyncio.ensure_future(self._dispatch_replies())
+
+    async def _dispatch_replies(self):
+        """hands every reply to the request waiting on its session"""
+
+        try:
+            while True:
+                line = await self._reader.readline()
+                if not line:
+                    raise ConnectionError('client disconnected')
+
+                tag, session_id, reply = json.loads(line.decode('utf-8'))
+                if tag != 'game':
+                    raise ValueError('client replied with an invalid envelope')
+
+                waiter = self._pending.pop(session_id, None)
+                if waiter is not None and not waiter.done():
+                    waiter.set_result(reply)
+        except (ConnectionError, ValueError, TypeError) as error:
+            self._error = ConnectionError(str(error))
+
+            for waiter in self._pending.values():
+                if not waiter.done():
+                    waiter.set_exception(self._error)
+            self._pending.clear()
+
+    async def request(self, session_id, msg):
+        """sends a message of a session and waits for the reply
+
+        :param session_id: session the message belongs to
+        :type session_id: GameId
+
+        :param msg: message to send
+        :type msg: JSON
+
+        :returns: reply of the client for the session
+        :rtype: JSON
+        """
+
+        if self._error is not None:
+            raise self._error
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._pending[session_id] = waiter
+
+        self._writer.write(
+            str.encode(json.dumps(['game', session_id, msg]) + '\n'))
+        await self._writer.drain()
+
+        try:
+            return await asyncio.wait_for(waiter, self._reply_timeout)
+        finally:
+            self._pending.pop(session_id, None)
+
+    def end_session(self, session_id):
+        """tells the client a session is over
+
+        :param session_id: session to end
+        :type session_id: GameId
+        """
+
+        if self._error is None and not self._writer.is_closing():
+            self._writer.write(
+                str.encode(json.dumps(['end-game', session_id]) + '\n'))
+
+    def close(self):
+        """closes the connection to the client"""
+
+        self._dispatcher.cancel()
+        self._writer.close()
+
+
+class MuxSeat(RemotePlayer):
+    """a seat played by one session of a multiplexed client"""
+
+    def __init__(self, connection, session_id, deltas=False):
+        """creates a MuxSeat
+
+        :param connection: connection of the client playing the seat
+        :type connection: MuxConnection
+
+        :param session_id: session of the seat on the connection
+        :type session_id: GameId
+
+        :param deltas: whether to offer the player Deltas instead of Decks
+        :type deltas: bool
+        """
+
+        super().__init__(None, None, deltas=deltas)
+
+        self._connection = connection
+        self._session_id = session_id
+
+    async def request(self, msg):
+        return await self._connection.request(self._session_id, msg)
+
+    def close(self):
+        """ends the seat's session, leaving the connection open"""
+
+        self._connection.end_session(self._session_id)
+
+
+class AsyncDealer(Dealer):
+    """a Dealer whose players are RemotePlayers, asked concurrently"""
+
+    async def simulate_game(self):
+        """simulates one complete game
+
+        :returns: list of (player name, points) in increasing order
+        :rtype: list of (int, int)
+        """
+
+        while not self.is_game_over():
+            await self.play_round()
+
+        return self.get_results()
+
+    async def play_round(self):
+        """plays a single round"""
+
+        self._deck = self._initial_deck[:]
+        self._random.shuffle(self._deck)
+
+        if self._recorder is not None:
+            self._recorder.record_shuffle(self._deck)
+
+        hands = [None] * len(self.players)
+        for player_name in self._card_handout_order:
+            hands[player_name] = self.deal_hand()
+
+        self._stacks = self.get_new_stacks()
+
+        await asyncio.gather(*(
+            player.start_round(hand, self._stacks)
+            for player, hand in zip(self.players, hands)))
+
+        while self.players_have_cards(self.players):
+            await self.play_turn()
+
+    async def get_discarded_cards(self):
+        """gathers discarded cards from every seat concurrently
+
+        :returns: discarded cards from players
+        :rtype: list of Card
+        """
+
+        return await asyncio.gather(*(
+            player.take_turn(self._stacks) for player in self.players))
+
+    async def play_turn(self):
+        """plays a single turn, gathering every seat's card concurrently"""
+
+        discarded_cards = await self.get_discarded_cards()
+
+        if self._recorder is not None:
+            self._recorder.record_discards(discarded_cards)
+
+        await self.place_cards(discarded_cards)
+
+    async def place_cards(self, discarded_cards):
+        """places the given cards on the stacks and removes points if necessary
+
+        asks a player to choose a stack just before its card is placed, so
+        the choice sees the stacks as they are at that point of the turn
+
+        :param discarded_cards: cards to discard, ordered the same as players
+        :type discarded_cards: list of Card
+        """
+
+        ordered_player_names = self.get_card_placement_order(discarded_cards)
+        remaining_cards = {i: c for i, c in enumerate(discarded_cards)}
+
+        for player_name in ordered_player_names:
+            card = discarded_cards[player_name]
+            player = self.players[player_name]
+
+            opponent_points = self._scoreboard.get_opponent_points(
+                player_name)
+            del remaining_cards[player_name]
+
+            if self.get_closest_smaller_card(card, self._stacks) is None:
+                await player.choose(self._stacks)
+
+            points_lost = self.add_card_to_stacks(
+                player, card, opponent_points, remaining_cards.values(),
+                player_name)
+
+            if points_lost:
+                self._scoreboard.remove_points(player_name, points_lost)
+
+
+class GameHost:
+    """seats connecting players into games and plays the games concurrently"""
+
+    def __init__(self, players_per_game=DEFAULT_PLAYERS_PER_GAME,
+                 num_games=None, seed=None,
+                 reply_timeout=DEFAULT_REPLY_TIMEOUT, multiplex=False,
+                 deltas=False, resume_timeout=None, binary=False,
+                 batch=False):
+        """creates a GameHost
+
+        :param players_per_game: number of players seated in each game
+        :type players_per_game: int
+
+        :param num_games: number of games to host, None for no limit
+        :type num_games: int or None
+
+        :param seed: seed making the deals reproducible, game i is dealt
+                     with seed + i
+        :type seed: int or None
+
+        :param reply_timeout: seconds to wait for each reply
+        :type reply_timeout: float or None
+
+        :param multiplex: whether to play every game over the connections of
+                          the first players_per_game clients
+        :type multiplex: bool
+
+        :param deltas: whether to offer players Deltas instead of Decks
+        :type deltas: bool
+
+        :param resume_timeout: seconds a player whose connection drops has
+                               to resume, None for players that do not
+                               resume
+        :type resume_timeout: float or None
+
+        :param binary: whether to offer players the binary codec
+        :type binary: bool
+
+        :param batch: whether to send each round's start-round and first
+                      take-turn in one Batch
+        :type batch: bool
+        """
+
+        if players_per_game < 2 or players_per_game > 10:
+            raise ValueError('number of players must be in interval [2, 10]')
+
+        if multiplex and num_games is None:
+            raise ValueError('a multiplexing host needs a number of games')
+
+        if multiplex and resume_timeout is not None:
+            raise ValueError('multiplexed clients cannot resume')
+
+        if multiplex and binary:
+            raise ValueError('multiplexed clients only speak JSON')
+
+        if multiplex and batch:
+            raise ValueError('multiplexed clients are not sent batches')
+
+        self._players_per_game = players_per_game
+        self._num_games = num_games
+        self._seed = seed
+        self._reply_timeout = reply_timeout
+        self._multiplex = multiplex
+        self._deltas = deltas
+        self._resume_timeout = resume_timeout
+        self._binary = binary
+        self._batch = batch
+        self._sessions = {}
+
+        self._waiting = []
+        self._clients = []
+        self._num_started = 0
+        self._all_finished = None
+        self.results = []
+
+    async def handle_connection(self, reader, writer):
+        """seats a newly connected player, starting a game once the table
+        is full
+
+        :param reader: stream from the player
+        :type reader: asyncio.StreamReader
+
+        :param writer: stream to the player
+        :type writer: asyncio.StreamWriter
+        """
+
+        session_id = None
+
+        if self._resume_timeout is not None:
+            try:
+                session_id, num_replies = await self._read_resume(reader)
+            except (ConnectionError, ValueError, asyncio.TimeoutError):
+                writer.close()
+                return
+
+            player = self._sessions.get(session_id)
+            if player is not None:
+                player.resume(reader, writer, num_replies)
+                return
+
+            if num_replies:
+                writer.write(b'false\n')
+                writer.close()
+                return
+
+        if self._num_games is not None and self._num_started >= self._num_games:
+            writer.close()
+            return
+
+        if session_id is not None:
+            writer.write(b'["resumed", 0]\n')
+
+        if self._multiplex:
+            self._clients.append(
+                MuxConnection(reader, writer, self._reply_timeout))
+
+            if len(self._clients) == self._players_per_game:
+                self._start_multiplexed_games()
+            return
+
+        player = RemotePlayer(reader, writer, self._reply_timeout,
+                              self._deltas, self._resume_timeout,
+                              self._binary, self._batch)
+        self._waiting.append(player)
+
+        if session_id is not None:
+            player.session_id = session_id
+            self._sessions[session_id] = player
+
+        if len(self._waiting) == self._players_per_game:
+            players, self._waiting = self._waiting, []
+            self._start_game(players)
+
+    async def _read_resume(self, reader):
+        """reads the Resume a connection opens with
+
+        :param reader: stream from the player
+        :type reader: asyncio.StreamReader
+
+        :returns: session id and number of replies sent by the player
+        :rtype: (str, int)
+        """
+
+        line = await asyncio.wait_for(reader.readline(), self._reply_timeout)
+        if not line:
+            raise ConnectionError('player disconnected')
+
+        msg = json.loads(line.decode('utf-8'))
+
+        if (not isinstance(msg, list) or len(msg) != 3 or
+                msg[0] != 'resume' or not isinstance(msg[1], str) or
+                not isinstance(msg[2], int)):
+            raise ValueError('connection did not open with a resume')
+
+        return msg[1], msg[2]
+
+    def _start_game(self, players):
+        """starts playing a game with the next seed
+
+        :param players: players of the game
+        :type players: list of RemotePlayer
+        """
+
+        seed = None if self._seed is None else self._seed + self._num_started
+        self._num_started += 1
+
+        asyncio.ensure_future(self.play_game(players, seed))
+
+    def _start_multiplexed_games(self):
+        """starts every game, seating each client once in every game"""
+
+        while self._num_started < self._num_games:
+            game = self._num_started
+            self._start_game([
+                MuxSeat(client, '{}.{}'.format(game, seat), self._deltas)
+                for seat, client in enumerate(self._clients)])
+
+    async def play_game(self, players, seed=None):
+        """plays a game between remote players and closes their connections
+
+        a game whose player disconnects, times out or breaks the protocol
+        is abandoned and recorded with results None
+
+        :param players: players of the game
+        :type players: list of RemotePlayer
+
+        :param seed: seed for the dealer
+        :type seed: int or None
+
+        :returns: results of the game as given by Dealer.get_results
+        :rtype: list of (int, int) or None
+        """
+
+        try:
+            results = await AsyncDealer(players, seed=seed).simulate_game()
+        except (ConnectionError, ValueError, asyncio.TimeoutError):
+            results = None
+        finally:
+            for player in players:
+                self._sessions.pop(player.session_id, None)
+                await player.end_game()
+                player.close()
+
+        self.results.append(results)
+
+        if (self._all_finished is not None and
+                len(self.results) == self._num_games):
+            self._all_finished.set()
+
+        return results
+
+    async def serve(self, server=SERVER, port=PORT, ready=None):
+        """accepts players until the number of games to host have finished
+
+        :param server: address to listen on
+        :type server: str
+
+        :param port: port to listen on, 0 for any free port
+        :type port: int
+
+        :param ready: future set to the listening port once accepting
+        :type ready: asyncio.Future or None
+
+        :returns: results of every game, in the order they finished
+        :rtype: list of (list of (int, int) or None)
+        """
+
+        self._all_finished = asyncio.Event()
+
+        listener = await asyncio.start_server(
+            self.handle_connection, server, port)
+
+        if ready is not None:
+            ready.set_result(listener.sockets[0].getsockname()[1])
+
+        try:
+            await self._all_finished.wait()
+        finally:
+            for client in self._clients:
+                client.close()
+
+            listener.close()
+            await listener.wait_closed()
+
+        return self.results
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='hosts 6 Nimmt! games for TCP players')
+    parser.add_argument('--server', default=SERVER)
+    parser.add_argument('--port', type=int, default=PORT)
+    parser.add_argument('--players', type=int,
+                        default=DEFAULT_PLAYERS_PER_GAME)
+    parser.add_argument('--games', type=int, default=None)
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--timeout', type=float,
+                        default=DEFAULT_REPLY_TIMEOUT)
+    parser.add_argument('--multiplex', action='store_true',
+                        help='play every game over the first clients')
+    parser.add_argument('--deltas', action='store_true',
+                        help='offer players board deltas instead of decks')
+    parser.add_argument('--resume-timeout', type=float, default=None,
+                        help='let players resume dropped connections within '
+                             'this many seconds')
+    parser.add_argument('--binary', action='store_true',
+                        help='offer players the binary codec')
+    parser.add_argument('--batch', action='store_true',
+                        help='send start-round and the first take-turn of '
+                             'every round together')
+    args = parser.parse_args()
+
+    host = GameHost(args.players, args.games, args.seed, args.timeout,
+                    args.multiplex, args.deltas, args.resume_timeout,
+                    args.binary, args.batch)
+
+    for results in asyncio.run(host.serve(args.server, args.port)):
+        print('game abandoned' if results is None else results)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,366 @@
+"""
+Generates load against player proxies and measures their latency.
+
+Each stand-in dealer listens on loopback and is connected to by its own
+player proxy process running player_proxy.run. The dealer replays message
+sequences to the proxy, one connection per sequence, timing every request
+from sending it to receiving the reply. A sequence stops early if the
+proxy replies false or hangs up, as it does for the malformed inputs in
+4/test.
+
+Sequences come from files of concatenated JSON messages such as
+4/test/*-in.json, or are recorded from seeded games of the Dealer, giving
+every seat's start-round, take-turn and choose requests for a whole game.
+
+A LoadResults is a JSON object mapping each request type, and "all", to
+    {"calls": int, "per_sec": float, "p50": float, "p99": float,
+     "p999": float}
+where latencies are in microseconds, so results can be saved and compared
+like those of 2/take5/benchmark.py.
+"""
+
+import os
+import sys
+
+PATH_TO_PLAYER = '../../3/'
+PATH_TO_DEALER = '../../2/take5/'
+sys.path.append(os.path.join(os.path.dirname(__file__), PATH_TO_PLAYER))
+sys.path.append(os.path.join(os.path.dirname(__file__), PATH_TO_DEALER))
+
+import argparse
+import json
+import multiprocessing
+import socket
+import threading
+import time
+
+import player_proxy as proxy
+from benchmark import find_regressions, percentile
+from dealer import Dealer
+from game_host import deck_to_json
+
+DEFAULT_DEALERS = 4
+DEFAULT_GAMES = 20
+DEFAULT_PLAYERS_PER_GAME = 4
+DEFAULT_THRESHOLD = 0.10
+
+LOOPBACK = '127.0.0.1'
+
+
+def load_sequences(paths):
+    """reads message sequences from files of concatenated JSON messages
+
+    a file's messages end at its first invalid JSON
+
+    :param paths: files to read, one sequence per file
+    :type paths: list of str
+
+    :returns: messages of each file
+    :rtype: list of list of JSON
+    """
+
+    decoder = json.JSONDecoder()
+    sequences = []
+
+    for path in paths:
+        with open(path) as f:
+            text = f.read()
+
+        messages = []
+        pos = 0
+
+        while True:
+            while pos < len(text) and text[pos].isspace():
+                pos += 1
+
+            if pos == len(text):
+                break
+
+            try:
+                msg, pos = decoder.raw_decode(text, pos)
+            except ValueError:
+                break
+
+            messages.append(msg)
+
+        if messages:
+            sequences.append(messages)
+
+    return sequences
+
+
+class RecordingPlayer(proxy.Player):
+    """highest-card player writing down the requests a dealer would send"""
+
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def set_hand(self, new_hand):
+        super().set_hand(new_hand)
+        self.messages.append(
+            ['start-round', [[card.face, card.bull] for card in new_hand]])
+
+    def pick_card(self, stacks, opponent_points):
+        self.messages.append(['take-turn', deck_to_json(stacks)])
+        return super().pick_card(stacks, opponent_points)
+
+    def pick_stack(self, stacks, opponent_points, remaining_cards):
+        self.messages.append(['choose', deck_to_json(stacks)])
+        return super().pick_stack(stacks, opponent_points, remaining_cards)
+
+
+def record_sequences(num_games, players_per_game=DEFAULT_PLAYERS_PER_GAME,
+                     seed=0):
+    """records the requests of every seat of seeded games
+
+    :param num_games: number of games to record
+    :type num_games: int
+
+    :param players_per_game: number of seats in each game
+    :type players_per_game: int
+
+    :param seed: seed of the first game, game i is dealt with seed + i
+    :type seed: int
+
+    :returns: requests sent to each seat of each game
+    :rtype: list of list of JSON
+    """
+
+    sequences = []
+
+    for game in range(num_games):
+        players = [RecordingPlayer() for _ in range(players_per_game)]
+        Dealer(players, seed=seed + game).simulate_game()
+        sequences.extend(player.messages for player in players)
+
+    return sequences
+
+
+class StandInDealer(threading.Thread):
+    """replays message sequences to the proxies connecting to it"""
+
+    def __init__(self, sequences):
+        """creates a StandInDealer listening on a free loopback port
+
+        :param sequences: sequences to replay, one connection each
+        :type sequences: list of list of JSON
+        """
+
+        super().__init__(daemon=True)
+
+        self._sequences = sequences
+        self._listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._listener.bind((LOOPBACK, 0))
+        self._listener.listen(1)
+
+        self.port = self._listener.getsockname()[1]
+        self.latencies = {}
+
+    def run(self):
+        try:
+            for sequence in self._sequences:
+                connection, _ = self._listener.accept()
+
+                try:
+                    self._replay(connection, sequence)
+                finally:
+                    connection.close()
+        finally:
+            self._listener.close()
+
+    def _replay(self, connection, sequence):
+        """sends a sequence's messages and times each reply
+
+        :param connection: connection to a proxy
+        :type connection: socket.SocketType
+
+        :param sequence: messages to send
+        :type sequence: list of JSON
+        """
+
+        reader = proxy.MessageReader(connection)
+
+        for msg in sequence:
+            start = time.perf_counter()
+            proxy.send(connection, msg)
+
+            try:
+                reply = reader.read()
+            except (ConnectionError, ValueError):
+                return
+
+            elapsed = time.perf_counter() - start
+            request_type = proxy.get_request_type(msg)
+            self.latencies.setdefault(request_type, []).append(elapsed)
+
+            if reply is False:
+                return
+
+
+def _run_proxy(port, strategy):
+    """plays proxy sessions against a stand-in dealer until it stops
+    listening"""
+
+    player_class = proxy.STRATEGIES[strategy]
+
+    while True:
+        try:
+            proxy.run(LOOPBACK, port, player_class)
+        except OSError:
+            return
+
+
+def summarize(latencies, seconds):
+    """summarizes the latencies of each request type
+
+    :param latencies: seconds taken by each request, by request type
+    :type latencies: dict of str to list of float
+
+    :param seconds: wall time of the whole run
+    :type seconds: float
+
+    :returns: summary of every request type and of all requests
+    :rtype: LoadResults
+    """
+
+    micros = 1e6
+    all_latencies = [t for timings in latencies.values() for t in timings]
+    results = {}
+
+    for request_type, timings in sorted(latencies.items()) + [
+            ('all', all_latencies)]:
+        if not timings:
+            continue
+
+        timings = sorted(timings)
+        results[request_type] = {
+            'calls': len(timings),
+            'per_sec': len(timings) / seconds if seconds else float('inf'),
+            'p50': percentile(timings, 50) * micros,
+            'p99': percentile(timings, 99) * micros,
+            'p999': percentile(timings, 99.9) * micros,
+        }
+
+    return results
+
+
+def run_load(sequences, num_dealers=DEFAULT_DEALERS, strategy='highest-card'):
+    """replays sequences across stand-in dealers, each with its own proxy
+
+    :param sequences: message sequences to replay
+    :type sequences: list of list of JSON
+
+    :param num_dealers: number of dealer and proxy pairs
+    :type num_dealers: int
+
+    :param strategy: name of the proxies' strategy in player_proxy.STRATEGIES
+    :type strategy: str
+
+    :returns: latency of every request type
+    :rtype: LoadResults
+    """
+
+    num_dealers = max(1, min(num_dealers, len(sequences)))
+    dealers = [StandInDealer(sequences[i::num_dealers])
+               for i in range(num_dealers)]
+    proxies = [
+        multiprocessing.Process(
+            target=_run_proxy, args=(dealer.port, strategy), daemon=True)
+        for dealer in dealers
+    ]
+
+    start = time.perf_counter()
+
+    for process in proxies:
+        process.start()
+    for dealer in dealers:
+        dealer.start()
+    for dealer in dealers:
+        dealer.join()
+
+    seconds = time.perf_counter() - start
+
+    for process in proxies:
+        process.join(1)
+        if process.is_alive():
+            process.terminate()
+
+    latencies = {}
+    for dealer in dealers:
+        for request_type, timings in dealer.latencies.items():
+            latencies.setdefault(request_type, []).extend(timings)
+
+    return summarize(latencies, seconds)
+
+
+def format_results(results):
+    """formats results as a printable table
+
+    :param results: results to format
+    :type results: LoadResults
+
+    :returns: table with a header line and one line per request type
+    :rtype: str
+    """
+
+    fmt = '{:<12} {:>8} {:>12} {:>10} {:>10} {:>10}'
+    lines = [fmt.format(
+        'request', 'calls', 'per sec', 'p50 us', 'p99 us', 'p999 us')]
+
+    for request_type, s in results.items():
+        lines.append(fmt.format(
+            request_type, s['calls'], '{:.1f}'.format(s['per_sec']),
+            '{:.1f}'.format(s['p50']), '{:.1f}'.format(s['p99']),
+            '{:.1f}'.format(s['p999'])))
+
+    return '\n'.join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='measures player proxy throughput and latency')
+    parser.add_argument('inputs', nargs='*',
+                        help='files of messages to replay instead of '
+                             'recorded games, such as ../test/*-in.json')
+    parser.add_argument('-d', '--dealers', type=int, default=DEFAULT_DEALERS)
+    parser.add_argument('-g', '--games', type=int, default=DEFAULT_GAMES,
+                        help='number of games to record when no inputs '
+                             'are given')
+    parser.add_argument('-r', '--repeat', type=int, default=1,
+                        help='number of times to replay every sequence')
+    parser.add_argument('--strategy', choices=sorted(proxy.STRATEGIES),
+                        default='highest-card')
+    parser.add_argument('--save', help='file to save the results to')
+    parser.add_argument('--baseline', help='results file to compare against')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='allowed relative slowdown of the median')
+    args = parser.parse_args()
+
+    if args.inputs:
+        sequences = load_sequences(args.inputs)
+    else:
+        sequences = record_sequences(args.games)
+
+    results = run_load(sequences * args.repeat, args.dealers, args.strategy)
+    print(format_results(results))
+
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+        regressions = find_regressions(results, baseline, args.threshold)
+        for request_type, baseline_p50, p50 in regressions:
+            print('REGRESSION {}: p50 {:.1f}us -> {:.1f}us'.format(
+                request_type, baseline_p50, p50))
+
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
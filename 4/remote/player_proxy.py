@@ -17,6 +17,59 @@ DATA DEFINITIONS
 
     A Deck is [Stack, ..., Stack]
 
+    An Options is {"deltas": bool}, optionally sent as a third element of
+    start-round; a proxy that accepts deltas replies with {"deltas": true}
+    instead of true
+
+    A Delta is {"ops": [Op, ..., Op], "crc": Integer}, sent in place of the
+    Deck of take-turn or choose once deltas are accepted, where an Op is
+    one of:
+        - ["push", Integer, JSONCard], placing a card on top of a stack
+        - ["set", Integer, Stack], replacing a stack
+    the ops apply, in order, to the Deck of the previous request of the
+    round, and crc is the board_checksum of the resulting Deck. a proxy
+    that cannot rebuild the Deck replies "resync", and the request is sent
+    again with the full Deck
+
+    A GameId is a JSON string or Integer naming one game of a connection
+
+    An Envelope is one of:
+        - ["game", GameId, JSON], a message of the game with that id,
+          answered with ["game", GameId, JSON]
+        - ["end-game", GameId], ending the game with that id, not answered
+
+    A Batch is ["batch", [JSON, ..., JSON]], a list of messages answered
+    with one list of their replies, in order. the messages are answered
+    one at a time as if they had been sent separately, stopping after the
+    first false reply; an end-game Envelope is answered with null
+
+    A SessionId is a JSON string naming a proxy across its connections
+
+    A GameOver is ["game-over"], sent by a resuming host to every seat once
+    its game has ended, just before closing the connection. it is not
+    answered, and tells a resuming proxy the close that follows is not a
+    dropped connection
+
+    A Codec is "json" or "binary", naming how a connection's messages are
+    framed. every connection starts out sending JSON followed by a newline.
+    a host may send ["codec", [Codec, ..., Codec]], listing the codecs it
+    speaks in order of preference; the proxy replies with the first one it
+    also speaks, and both sides frame every later message of the
+    connection with it. the reply does not count as a reply of the game
+
+    A Frame is a message of the binary codec: a 4-byte big-endian length
+    followed by that many bytes of payload. the first payload byte is a tag:
+        - 0, the rest of the payload is the message as UTF-8 JSON
+        - 1, 2, 3, a start-round with a PackedLCard, or a take-turn or
+          choose with a PackedDeck
+        - 4, 5, the replies true and false
+        - 6, a JSONCard reply as a PackedCard
+        - 7, a Stack reply as a PackedLCard
+    where a PackedCard is a face byte and a bull byte, a PackedLCard is a
+    count byte followed by that many PackedCards and a PackedDeck is a
+    count byte followed by that many PackedLCards. any message without a
+    packed form, such as a Delta, travels as JSON
+
     A JSON is one of:
         - int
         - str
@@ -31,10 +84,23 @@ import sys
 PATH_TO_PLAYER = '../../3/'
 sys.path.append(os.path.join(os.path.dirname(__file__), PATH_TO_PLAYER))
 
+import argparse
+import atexit
+import bisect
 import json
+import re
+import signal
 import socket
+import struct
+import threading
+import time
+import uuid
+import weakref
+import zlib
+from collections import deque
 
 from player import BasePlayer, Card
+from search_player import SearchPlayer
 
 SERVER = 'localhost'
 PORT = 45678
@@ -42,6 +108,51 @@ PORT = 45678
 MIN_FACE, MAX_FACE = 1, 104
 MIN_BULL, MAX_BULL = 2, 7
 
+READ_CHUNK_SIZE = 65536
+
+JSON_CODEC = 'json'
+BINARY_CODEC = 'binary'
+SUPPORTED_CODECS = [BINARY_CODEC, JSON_CODEC]
+
+FRAME_HEADER = struct.Struct('>I')
+MAX_FRAME_SIZE = 1 << 20
+
+TAG_JSON = 0
+TAG_START_ROUND = 1
+TAG_TAKE_TURN = 2
+TAG_CHOOSE = 3
+TAG_TRUE = 4
+TAG_FALSE = 5
+TAG_CARD = 6
+TAG_STACK = 7
+
+REQUEST_TAGS = {
+    'start-round': TAG_START_ROUND,
+    'take-turn': TAG_TAKE_TURN,
+    'choose': TAG_CHOOSE,
+}
+TAG_REQUESTS = {tag: request for request, tag in REQUEST_TAGS.items()}
+
+RESYNC = 'resync'
+GAME_OVER = 'game-over'
+
+DECODE = 'decode'
+VALIDATE = 'validate'
+STRATEGY = 'strategy'
+ENCODE = 'encode'
+STAGES = [DECODE, VALIDATE, STRATEGY, ENCODE]
+
+INVALID_REQUEST = 'invalid'
+
+# upper bounds, in microseconds, of every histogram bucket but the last
+HISTOGRAM_BOUNDS = (10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000,
+                    20000, 50000, 100000, 200000, 500000, 1000000)
+DEFAULT_HISTOGRAM_WINDOW = 1000
+
+DEFAULT_MAX_RETRIES = 5
+DEFAULT_BACKOFF = 0.1
+MAX_BACKOFF = 5.0
+
 
 class Player(BasePlayer):
     def pick_card(self, stacks, opponent_points):
@@ -91,19 +202,29 @@ class TimingValidator:
         'choose': {'take-turn'},
     }
 
+    # a new round may follow these once the player's hand is played out
+    round_end_states = {'take-turn', 'choose'}
+
     def __init__(self):
         self._latest_request = None
 
-    def is_valid_transition(self, next_request):
+    def is_valid_transition(self, next_request, hand_is_empty=False):
         """checks if the next request is will be valid
 
         :param next_request: request to check
         :type next_request: str
 
+        :param hand_is_empty: whether the player has played its whole hand
+        :type hand_is_empty: bool
+
         :returns: whether the request satisfies the timing specification
         :rtype: bool
         """
 
+        if (next_request == 'start-round' and hand_is_empty and
+                self._latest_request in self.round_end_states):
+            return True
+
         return next_request in self.valid_next_states[self._latest_request]
 
     def update(self, request):
@@ -118,40 +239,1344 @@ class TimingValidator:
 
         self._latest_request = request
 
-def run(server, port):
-    """opens a socket and plays a game over the socket
+class BoardDesync(Exception):
+    """raised when a Delta cannot be applied to the mirrored Deck"""
 
-    :param server: server to open the socket on
-    :type server: str
 
-    :param port: port to open the socket on
-    :type port: int
+def board_checksum(deck):
+    """computes the checksum of a Deck sent along with Deltas
+
+    :param deck: deck to check
+    :type deck: Deck
+
+    :returns: CRC-32 of the compact JSON encoding of the deck
+    :rtype: int
+    """
+
+    return zlib.crc32(json.dumps(deck, separators=(',', ':')).encode('utf-8'))
+
+
+class BoardMirror:
+    """the proxy's copy of the Deck it was last sent, for Deltas"""
+
+    def __init__(self):
+        """creates a BoardMirror with deltas turned off"""
+
+        self.deltas = False
+        self._deck = None
+
+    def translate(self, request_type, params):
+        """turns the parameters of a request into those of the plain protocol
+
+        start-round loses its Options, turning deltas on or off for the
+        round, and a Delta given to take-turn or choose becomes a full Deck
+
+        :param request_type: type of the request
+        :type request_type: str
+
+        :param params: parameters of the request
+        :type params: list of JSON
+
+        :returns: parameters with every Delta replaced by a Deck
+        :rtype: list of JSON
+
+        :raises: BoardDesync if a Delta does not rebuild the expected Deck,
+                 ValueError if a Delta or Options is malformed
+        """
+
+        if request_type == 'start-round':
+            self._deck = None
+
+            if len(params) == 2:
+                options = params[1]
+                if not isinstance(options, dict):
+                    raise ValueError('Invalid options')
+
+                self.deltas = options.get('deltas') is True
+                return params[:1]
+
+            self.deltas = False
+            return params
+
+        if not params:
+            return params
+
+        deck = params[0]
+
+        if isinstance(deck, dict) and self.deltas:
+            deck = self._apply(deck)
+        elif isinstance(deck, list):
+            self._deck = deck
+
+        return [deck] + params[1:]
+
+    def _apply(self, delta):
+        """applies a Delta to the mirrored Deck
+
+        :param delta: changes since the previous Deck
+        :type delta: Delta
+
+        :returns: the new Deck
+        :rtype: Deck
+        """
+
+        ops = delta.get('ops')
+        crc = delta.get('crc')
+
+        if not isinstance(ops, list) or not isinstance(crc, int):
+            raise ValueError('Invalid delta')
+
+        if self._deck is None:
+            raise BoardDesync('no deck to apply the delta to')
+
+        deck = list(self._deck)
+
+        for op in ops:
+            if not isinstance(op, list) or len(op) != 3:
+                raise ValueError('Invalid delta')
+
+            kind, index, value = op
+            if not isinstance(index, int) or not 0 <= index < len(deck):
+                raise BoardDesync('delta refers to a missing stack')
+
+            if kind == 'push':
+                deck[index] = [value] + deck[index]
+            elif kind == 'set':
+                deck[index] = value
+            else:
+                raise ValueError('Invalid delta')
+
+        if board_checksum(deck) != crc:
+            raise BoardDesync('checksum mismatch')
+
+        self._deck = deck
+        return deck
+
+
+class GameSessions:
+    """the games played over one connection, each with its own player
+
+    a game's player, validator and board mirror are created by its first
+    message and dropped when the game ends, or when the game breaks the
+    protocol
+    """
+
+    def __init__(self, player_class=Player):
+        """creates GameSessions
+
+        :param player_class: strategy to play every game with
+        :type player_class: class BasePlayer or function
+        """
+
+        self._player_class = player_class
+        self._sessions = {}
+
+    def __len__(self):
+        return len(self._sessions)
+
+    def __contains__(self, game_id):
+        return game_id in self._sessions
+
+    def get_reply(self, envelope):
+        """gets the reply to an enveloped message
+
+        :param envelope: message to reply to
+        :type envelope: Envelope
+
+        :returns: reply envelope, or None if the message is not answered
+        :rtype: Envelope or None
+
+        :raises: ValueError if the envelope is malformed
+        """
+
+        tag, game_id, *rest = envelope
+
+        if not isinstance(game_id, (str, int)) or isinstance(game_id, bool):
+            raise ValueError('Incorrect game id')
+
+        if tag == 'end-game' and not rest:
+            self._sessions.pop(game_id, None)
+            return None
+
+        if tag != 'game' or len(rest) != 1:
+            raise ValueError('Incorrect envelope format')
+
+        session = self._sessions.get(game_id)
+        if session is None:
+            session = self._sessions[game_id] = (
+                self._player_class(), TimingValidator(), BoardMirror())
+
+        try:
+            reply = get_reply(session[0], session[1], rest[0], session[2])
+        except ValueError:
+            reply = False
+
+        if reply is False:
+            del self._sessions[game_id]
+
+        return ['game', game_id, reply]
+
+
+def is_envelope(msg):
+    """determines if a message is addressed to one of several games
+
+    :param msg: message to check
+    :type msg: JSON
+
+    :returns: whether the message is an Envelope
+    :rtype: bool
+    """
+
+    return (isinstance(msg, list) and len(msg) >= 2 and
+            msg[0] in ('game', 'end-game'))
+
+
+def is_batch(msg):
+    """determines if a message is a Batch
+
+    :param msg: message received
+    :type msg: JSON
+
+    :returns: whether the message is a batch
+    :rtype: bool
+    """
+
+    return (isinstance(msg, list) and len(msg) == 2 and
+            msg[0] == 'batch' and isinstance(msg[1], list))
+
+
+def is_game_over(msg):
+    """determines if a message is a GameOver
+
+    :param msg: message received
+    :type msg: JSON
+
+    :returns: whether the message ends the game
+    :rtype: bool
+    """
+
+    return msg == [GAME_OVER]
+
+
+def is_codec_request(msg):
+    """determines if a message asks the proxy to pick a Codec
+
+    :param msg: message received
+    :type msg: JSON
+
+    :returns: whether the message is a codec request
+    :rtype: bool
     """
 
-    sock = socket.create_connection((server, port))
-    player = Player()
-    validator = TimingValidator()
+    return (isinstance(msg, list) and len(msg) == 2 and
+            msg[0] == 'codec' and isinstance(msg[1], list))
+
+
+def choose_codec(offered, supported=None):
+    """picks the codec of a connection
+
+    :param offered: codecs the host speaks, most preferred first
+    :type offered: list of JSON
+
+    :param supported: codecs the proxy speaks, SUPPORTED_CODECS if None
+    :type supported: list of Codec or None
+
+    :returns: first offered codec that is supported, JSON if there is none
+    :rtype: Codec
+    """
+
+    if supported is None:
+        supported = SUPPORTED_CODECS
+
+    for codec in offered:
+        if codec in supported:
+            return codec
+
+    return JSON_CODEC
+
+
+def _pack_card(card):
+    """packs a JSONCard whose face and bull fit in a byte each
+
+    :param card: card to pack
+    :type card: JSON
+
+    :returns: PackedCard, None if the card has no packed form
+    :rtype: list of int or None
+    """
+
+    if type(card) is not list or len(card) != 2:
+        return None
+
+    face, bull = card
+    if (type(face) is not int or type(bull) is not int or
+            not 0 <= face <= 255 or not 0 <= bull <= 255):
+        return None
+
+    return card
+
+
+def _pack_lcard(lcard):
+    """packs an LCard of at most 255 packable cards
+
+    :param lcard: cards to pack
+    :type lcard: JSON
+
+    :returns: PackedLCard, None if the cards have no packed form
+    :rtype: list of int or None
+    """
+
+    if type(lcard) is not list or len(lcard) > 255:
+        return None
+
+    packed = [len(lcard)]
+    for card in lcard:
+        if _pack_card(card) is None:
+            return None
+        packed += card
+
+    return packed
+
+
+def _pack_deck(deck):
+    """packs a Deck of at most 255 packable stacks
+
+    :param deck: stacks to pack
+    :type deck: JSON
+
+    :returns: PackedDeck, None if the stacks have no packed form
+    :rtype: list of int or None
+    """
+
+    if type(deck) is not list or len(deck) > 255:
+        return None
+
+    packed = [len(deck)]
+    for lcard in deck:
+        packed_lcard = _pack_lcard(lcard)
+        if packed_lcard is None:
+            return None
+        packed += packed_lcard
+
+    return packed
+
+
+def encode_payload(msg):
+    """encodes a message as the payload of a Frame
+
+    :param msg: message to encode
+    :type msg: JSON
+
+    :returns: packed form of the message if it has one, else its JSON
+    :rtype: bytes
+    """
+
+    packed = None
+
+    if msg is True:
+        packed = [TAG_TRUE]
+    elif msg is False:
+        packed = [TAG_FALSE]
+    elif type(msg) is list and msg:
+        first = msg[0]
+
+        if type(first) is str:
+            tag = REQUEST_TAGS.get(first)
+            if tag is not None and len(msg) == 2:
+                if tag == TAG_START_ROUND:
+                    body = _pack_lcard(msg[1])
+                else:
+                    body = _pack_deck(msg[1])
+                if body is not None:
+                    packed = [tag] + body
+        elif type(first) is int:
+            if _pack_card(msg) is not None:
+                packed = [TAG_CARD] + msg
+        else:
+            body = _pack_lcard(msg)
+            if body is not None:
+                packed = [TAG_STACK] + body
+
+    if packed is None:
+        return bytes([TAG_JSON]) + json.dumps(msg).encode('utf-8')
+
+    return bytes(packed)
+
+
+def _unpack_lcard(payload, pos):
+    """unpacks the PackedLCard starting at a position of a payload
+
+    :param payload: payload holding the cards
+    :type payload: bytes
+
+    :param pos: position of the count byte
+    :type pos: int
+
+    :returns: cards and the position just after them
+    :rtype: (LCard, int)
+    """
+
+    end = pos + 1 + 2 * payload[pos]
+    if end > len(payload):
+        raise ValueError('frame ends mid-card')
+
+    cards = iter(payload[pos + 1:end])
+    return [[face, bull] for face, bull in zip(cards, cards)], end
+
+
+def decode_payload(payload):
+    """decodes the payload of a Frame
+
+    :param payload: payload to decode
+    :type payload: bytes
+
+    :returns: message of the payload
+    :rtype: JSON
+
+    :raises: ValueError if the payload is malformed
+    """
+
+    if not payload:
+        raise ValueError('empty frame')
+
+    tag = payload[0]
+
+    if tag == TAG_JSON:
+        return json.loads(payload[1:].decode('utf-8'))
 
     try:
+        if tag == TAG_TRUE:
+            msg, end = True, 1
+        elif tag == TAG_FALSE:
+            msg, end = False, 1
+        elif tag == TAG_CARD:
+            msg, end = [payload[1], payload[2]], 3
+        elif tag == TAG_STACK:
+            msg, end = _unpack_lcard(payload, 1)
+        elif tag == TAG_START_ROUND:
+            hand, end = _unpack_lcard(payload, 1)
+            msg = ['start-round', hand]
+        elif tag in TAG_REQUESTS:
+            deck = []
+            end = 2
+            for _ in range(payload[1]):
+                stack, end = _unpack_lcard(payload, end)
+                deck.append(stack)
+            msg = [TAG_REQUESTS[tag], deck]
+        else:
+            raise ValueError('unknown frame tag {}'.format(tag))
+    except IndexError:
+        raise ValueError('frame ends mid-message')
+
+    if end != len(payload):
+        raise ValueError('frame has trailing bytes')
+
+    return msg
+
+
+def encode_frame(msg):
+    """encodes a message as a Frame
+
+    :param msg: message to encode
+    :type msg: JSON
+
+    :returns: length-prefixed payload of the message
+    :rtype: bytes
+    """
+
+    payload = encode_payload(msg)
+    return FRAME_HEADER.pack(len(payload)) + payload
+
+
+class RollingHistogram:
+    """counts the latencies of the most recent samples by bucket
+
+    the buckets are bounded by HISTOGRAM_BOUNDS; the last one holds every
+    latency above a second
+    """
+
+    def __init__(self, window=DEFAULT_HISTOGRAM_WINDOW):
+        """creates a RollingHistogram
+
+        :param window: number of most recent samples counted
+        :type window: int
+        """
+
+        self._buckets = deque(maxlen=window)
+        self.counts = [0] * (len(HISTOGRAM_BOUNDS) + 1)
+        self.num_samples = 0
+
+    def add(self, seconds):
+        """counts a latency, forgetting the oldest once the window is full
+
+        :param seconds: latency to count
+        :type seconds: float
+        """
+
+        bucket = bisect.bisect_left(HISTOGRAM_BOUNDS, seconds * 1e6)
+
+        if len(self._buckets) == self._buckets.maxlen:
+            self.counts[self._buckets[0]] -= 1
+
+        self._buckets.append(bucket)
+        self.counts[bucket] += 1
+        self.num_samples += 1
+
+    def get_percentile(self, pct):
+        """gets the bucket bound below which a percentage of the window lies
+
+        :param pct: percentage in [0, 100]
+        :type pct: float
+
+        :returns: bound in microseconds, inf for the last bucket, None if
+                  nothing was counted
+        :rtype: float or None
+        """
+
+        if not self._buckets:
+            return None
+
+        rank = max(1, -(-len(self._buckets) * pct // 100))
+        seen = 0
+
+        for bucket, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                break
+
+        if bucket == len(HISTOGRAM_BOUNDS):
+            return float('inf')
+
+        return float(HISTOGRAM_BOUNDS[bucket])
+
+
+class RequestStats:
+    """rolling histograms of the time every stage of every request type
+    takes
+
+    a request's stages are decoding it off the wire, validating it against
+    the protocol, the player's decision and encoding the reply onto the
+    wire; decode excludes time spent waiting for the request to arrive
+
+    a StatsReport is a dict:
+        {str: {Stage: {"samples": int, "window": int, "p50": float,
+                       "p90": float, "p99": float, "counts": [int, ...]}}}
+    mapping every request type and stage seen to its histogram, with
+    percentiles in microseconds
+    """
+
+    clock = staticmethod(time.perf_counter)
+
+    def __init__(self, window=DEFAULT_HISTOGRAM_WINDOW):
+        """creates RequestStats
+
+        :param window: number of most recent samples each histogram counts
+        :type window: int
+        """
+
+        self._window = window
+        self._histograms = {}
+        self.decision_seconds = 0.0
+
+    def record(self, request_type, stage, seconds):
+        """records the time a stage of a request took
+
+        :param request_type: type of the request
+        :type request_type: str
+
+        :param stage: stage of the request
+        :type stage: Stage
+
+        :param seconds: time the stage took
+        :type seconds: float
+        """
+
+        key = (request_type, stage)
+        histogram = self._histograms.get(key)
+        if histogram is None:
+            histogram = self._histograms[key] = RollingHistogram(self._window)
+
+        histogram.add(seconds)
+
+    def get_report(self):
+        """gets the histograms recorded so far
+
+        :returns: histogram of every request type and stage
+        :rtype: StatsReport
+        """
+
+        report = {}
+
+        for (request_type, stage), histogram in sorted(
+                self._histograms.items(),
+                key=lambda item: (item[0][0], STAGES.index(item[0][1]))):
+            report.setdefault(request_type, {})[stage] = {
+                'samples': histogram.num_samples,
+                'window': sum(histogram.counts),
+                'p50': histogram.get_percentile(50),
+                'p90': histogram.get_percentile(90),
+                'p99': histogram.get_percentile(99),
+                'counts': list(histogram.counts),
+            }
+
+        return report
+
+    def format_report(self):
+        """formats the histograms as a printable table
+
+        :returns: table with a header line and one line per request type
+                  and stage
+        :rtype: str
+        """
+
+        fmt = '{:<12} {:<9} {:>8} {:>10} {:>10} {:>10}'
+        lines = [fmt.format('request', 'stage', 'samples', 'p50 us',
+                            'p90 us', 'p99 us')]
+
+        for request_type, stages in self.get_report().items():
+            for stage, summary in stages.items():
+                lines.append(fmt.format(
+                    request_type, stage, summary['samples'],
+                    '<={:g}'.format(summary['p50']),
+                    '<={:g}'.format(summary['p90']),
+                    '<={:g}'.format(summary['p99'])))
+
+        return '\n'.join(lines)
+
+    def dump(self, file=None):
+        """writes the table of the histograms
+
+        :param file: file to write to, sys.stderr if None
+        :type file: file or None
+        """
+
+        print(self.format_report(), file=sys.stderr if file is None else file)
+
+    def install(self, signum=signal.SIGUSR1, at_exit=True):
+        """dumps the histograms whenever the process receives a signal, and
+        optionally when it exits
+
+        must be called from the main thread
+
+        :param signum: signal to dump on
+        :type signum: int
+
+        :param at_exit: whether to dump when the process exits
+        :type at_exit: bool
+        """
+
+        signal.signal(signum, lambda *_: self.dump())
+
+        if at_exit:
+            atexit.register(self.dump)
+
+
+class TimedPlayer(BasePlayer):
+    """a player whose decisions are timed and held to a deadline
+
+    a decision under a deadline runs in a worker thread on the player
+    itself. when the deadline passes first, the worker keeps the player to
+    itself until it finishes and its decision is discarded; meanwhile a
+    stand-in highest-card Player holding the hand and points from before
+    the decision makes the default move for that and every later decision.
+    once the worker has finished, the player takes back the stand-in's hand
+    and points, so no two threads ever touch the player at once.
+    start-round is never held to the deadline
+    """
+
+    def __init__(self, player, deadline=None, stats=None):
+        """creates a TimedPlayer
+
+        :param player: player making the decisions
+        :type player: BasePlayer
+
+        :param deadline: seconds a decision may take, None for no limit
+        :type deadline: float or None
+
+        :param stats: stats to add the decision time to
+        :type stats: RequestStats or None
+        """
+
+        super().__init__()
+
+        self.player = player
+        self.deadline = deadline
+        self.num_missed = 0
+
+        self._stats = stats
+        self._late = None
+        self._stand_in = None
+        self._dealt_to_stand_in = False
+
+    def set_hand(self, new_hand):
+        self._decide(lambda player: player.set_hand(new_hand), None)
+
+        if self._stand_in is not None:
+            self._dealt_to_stand_in = True
+
+    def get_num_cards_in_hand(self):
+        return self._get_player().get_num_cards_in_hand()
+
+    def get_points(self):
+        return self._get_player().get_points()
+
+    def remove_points(self, num_points):
+        self._get_player().remove_points(num_points)
+
+    def pick_card(self, stacks, opponent_points):
+        return self._decide(
+            lambda player: player.pick_card(stacks, opponent_points),
+            lambda player: Player.pick_card(player, stacks, opponent_points))
+
+    def pick_stack(self, stacks, opponent_points, remaining_cards):
+        return self._decide(
+            lambda player: player.pick_stack(
+                stacks, opponent_points, remaining_cards),
+            lambda player: Player.pick_stack(
+                player, stacks, opponent_points, remaining_cards))
+
+    def _get_player(self):
+        """gets the player to play with, taking the player back from a late
+        worker that has finished
+
+        :returns: the player, or the stand-in while a late worker runs
+        :rtype: BasePlayer
+        """
+
+        if self._late is None:
+            return self.player
+
+        if self._late.is_alive():
+            return self._stand_in
+
+        stand_in = self._stand_in
+        if self._dealt_to_stand_in:
+            self.player.set_hand(stand_in._hand)
+        else:
+            self.player._hand = stand_in._hand
+        self.player._points = stand_in._points
+
+        self._late = None
+        self._stand_in = None
+        self._dealt_to_stand_in = False
+
+        return self.player
+
+    def _decide(self, decision, default):
+        """makes a decision, within the deadline if it has a default
+
+        :param decision: makes the decision for a player
+        :type decision: function of BasePlayer
+
+        :param default: makes the default move for a player, None to make
+                        the decision without a deadline
+        :type default: function of BasePlayer or None
+
+        :returns: result of the decision or default move
+        :rtype: any
+        """
+
+        start = time.perf_counter()
+
+        try:
+            player = self._get_player()
+
+            if player is self._stand_in and default is not None:
+                self.num_missed += 1
+                return default(player)
+
+            if self.deadline is None or default is None:
+                return decision(player)
+
+            return self._decide_by_deadline(decision, default)
+        finally:
+            if self._stats is not None:
+                self._stats.decision_seconds += time.perf_counter() - start
+
+    def _decide_by_deadline(self, decision, default):
+        """makes a decision in a worker thread, falling back to the default
+        move of a stand-in if it misses the deadline
+
+        :param decision: makes the decision for a player
+        :type decision: function of BasePlayer
+
+        :param default: makes the default move for a player
+        :type default: function of BasePlayer
+
+        :returns: result of the decision or default move
+        :rtype: any
+        """
+
+        player = self.player
+        hand = list(player._hand)
+        points = player._points
+        outcome = []
+
+        def decide():
+            try:
+                outcome.append((True, decision(player)))
+            except Exception as e:
+                outcome.append((False, e))
+
+        worker = threading.Thread(target=decide, daemon=True)
+        worker.start()
+        worker.join(self.deadline)
+
+        if worker.is_alive():
+            self._late = worker
+            self._stand_in = Player()
+            self._stand_in._hand = hand
+            self._stand_in._points = points
+            self.num_missed += 1
+            return default(self._stand_in)
+
+        succeeded, result = outcome[0]
+        if not succeeded:
+            raise result
+
+        return result
+
+
+def get_request_type(msg):
+    """gets the request type a message's stats and latencies are recorded
+    under
+
+    :param msg: message received, possibly an Envelope
+    :type msg: JSON
+
+    :returns: request type of the message
+    :rtype: str
+    """
+
+    if is_envelope(msg) and len(msg) == 3:
+        msg = msg[2]
+
+    if isinstance(msg, list) and msg and isinstance(msg[0], str):
+        return msg[0]
+
+    return INVALID_REQUEST
+
+
+class ProxySession:
+    """the state of a proxy that outlives any one connection to the host
+
+    a Resume is ["resume", SessionId, Integer], sent by a resuming proxy
+    at the start of every connection with the number of replies it has
+    sent so far. the host answers ["resumed", Integer] with the number of
+    those replies it received, or false if it does not know the session;
+    if the host is one reply short, the proxy sends its last reply again,
+    and otherwise the host sends again any request left unanswered
+    """
+
+    def __init__(self, player_class=Player, deadline=None, stats=None):
+        """creates a ProxySession
+
+        :param player_class: strategy to play the game with
+        :type player_class: class BasePlayer
+
+        :param deadline: seconds each decision may take, None for no limit
+        :type deadline: float or None
+
+        :param stats: stats to record the stages of every request in
+        :type stats: RequestStats or None
+        """
+
+        self.session_id = uuid.uuid4().hex
+        self.num_replies = 0
+        self.last_reply = None
+
+        if deadline is not None or stats is not None:
+            make_player = lambda: TimedPlayer(player_class(), deadline, stats)
+        else:
+            make_player = player_class
+
+        self._stats = stats
+        self._player = make_player()
+        self._validator = TimingValidator()
+        self._mirror = BoardMirror()
+        self._sessions = GameSessions(make_player)
+
+    def resume(self, sock):
+        """makes the Resume handshake on a new connection
+
+        :param sock: socket connection
+        :type sock: socket.SocketType
+
+        :returns: whether the host resumed the session
+        :rtype: bool
+        """
+
+        send(sock, ['resume', self.session_id, self.num_replies])
+
+        try:
+            reply = read(sock)
+        except ValueError:
+            return False
+
+        if (not isinstance(reply, list) or len(reply) != 2 or
+                reply[0] != 'resumed' or not isinstance(reply[1], int)):
+            return False
+
+        num_answered = reply[1]
+
+        if self.num_replies and num_answered == self.num_replies - 1:
+            send(sock, self.last_reply)
+        elif num_answered != self.num_replies:
+            return False
+
+        return True
+
+    def play(self, sock):
+        """answers messages until the game ends or the connection drops
+
+        every connection starts out with the JSON codec until the host
+        asks for another
+
+        :param sock: socket connection
+        :type sock: socket.SocketType
+
+        :returns: True once the game has ended
+        :rtype: bool
+
+        :raises: OSError if the connection drops
+        """
+
+        codec = JSON_CODEC
+
         while True:
-            msg = read(sock)
+            try:
+                msg = read_frame(sock) if codec == BINARY_CODEC else read(sock)
+            except ValueError:
+                return True
+
+            if is_game_over(msg):
+                return True
+
+            if is_codec_request(msg):
+                reply = choose_codec(msg[1])
+                if codec == BINARY_CODEC:
+                    send_frame(sock, reply)
+                else:
+                    send(sock, reply)
+                codec = reply
+                continue
+
+            stats = self._stats
+            if stats is not None:
+                request_type = get_request_type(msg)
+                stats.record(
+                    request_type, DECODE, _get_reader(sock).decode_seconds)
+                stats.decision_seconds = 0.0
+                start = stats.clock()
 
             try:
-                reply = get_reply(player, validator, msg)
+                if is_batch(msg):
+                    reply = self.get_batch_reply(msg[1])
+                else:
+                    reply = self.get_reply(msg)
             except ValueError:
-                break
+                return True
+
+            if stats is not None:
+                replied = stats.clock()
+                stats.record(request_type, VALIDATE,
+                             replied - start - stats.decision_seconds)
+                if stats.decision_seconds:
+                    stats.record(
+                        request_type, STRATEGY, stats.decision_seconds)
+
+            if reply is None:
+                continue
+
+            self.num_replies += 1
+            self.last_reply = reply
+            if codec == BINARY_CODEC:
+                send_frame(sock, reply)
+            else:
+                send(sock, reply)
+
+            if stats is not None:
+                stats.record(request_type, ENCODE, stats.clock() - replied)
 
-            send(sock, reply)
+            if reply is False or (
+                    is_batch(msg) and reply and reply[-1] is False):
+                return True
+
+    def get_reply(self, msg):
+        """gets the reply to a plain message or an Envelope
+
+        :param msg: message to reply to
+        :type msg: JSON
+
+        :returns: reply, or None if the message is not answered
+        :rtype: JSON or None
+        """
+
+        if is_envelope(msg):
+            return self._sessions.get_reply(msg)
+
+        return get_reply(self._player, self._validator, msg, self._mirror)
+
+    def get_batch_reply(self, msgs):
+        """gets the replies to the messages of a Batch
+
+        :param msgs: messages to reply to, in order
+        :type msgs: list of JSON
+
+        :returns: reply to each message up to the first false one
+        :rtype: list of JSON
+
+        :raises: ValueError if a message is malformed or is itself a batch
+        """
+
+        replies = []
+
+        for msg in msgs:
+            if is_batch(msg):
+                raise ValueError('batches cannot be nested')
+
+            reply = self.get_reply(msg)
+            replies.append(reply)
 
             if reply is False:
                 break
-    finally:
-        sock.close()
+
+        return replies
+
+
+def run(server, port, player_class=Player, resume=False,
+        max_retries=DEFAULT_MAX_RETRIES, backoff=DEFAULT_BACKOFF,
+        deadline=None, stats=None):
+    """opens a socket and plays games over the socket
+
+    plain messages are played by a single player; Envelopes are played by
+    one player per game id, so one connection can serve many games
+
+    a resuming proxy opens every connection with a Resume and reconnects
+    when the connection drops, waiting backoff, 2 * backoff, ... seconds
+    between attempts
+
+    :param server: server to open the socket on
+    :type server: str
+
+    :param port: port to open the socket on
+    :type port: int
+
+    :param player_class: strategy to play the game with
+    :type player_class: class BasePlayer
+
+    :param resume: whether to reconnect and resume after a dropped
+                   connection
+    :type resume: bool
+
+    :param max_retries: number of reconnects in a row to attempt before
+                        giving up
+    :type max_retries: int
+
+    :param backoff: seconds to wait before the first reconnect
+    :type backoff: float
+
+    :param deadline: seconds each decision may take before the default
+                     move is played instead, None for no limit
+    :type deadline: float or None
+
+    :param stats: stats to record the stages of every request in
+    :type stats: RequestStats or None
+
+    :raises: OSError if no connection can be made
+    """
+
+    session = ProxySession(player_class, deadline, stats)
+    failures = 0
+
+    while True:
+        if failures:
+            time.sleep(min(backoff * 2 ** (failures - 1), MAX_BACKOFF))
+
+        try:
+            sock = socket.create_connection((server, port))
+        except OSError:
+            failures += 1
+            if not resume or failures > max_retries:
+                raise
+            continue
+
+        try:
+            if resume:
+                if not session.resume(sock):
+                    return
+                failures = 0
+
+            if session.play(sock):
+                return
+        except OSError:
+            if not resume:
+                return
+        finally:
+            sock.close()
+
+        failures += 1
+        if failures > max_retries:
+            return
+
+
+class MessageReader:
+    """splits the bytes received on a socket into JSON messages
+
+    bytes are received in large chunks and scanned once: the scanner keeps
+    its place, bracket depth and string state between chunks, and only a
+    complete value is handed to the JSON decoder. bytes after a message stay
+    buffered for the next one.
+
+    a top-level number or literal has no closing delimiter, so it is
+    decoded from the bytes that have arrived once they form a valid value
+
+    decode_seconds is the time the last read took, less the time spent
+    waiting for bytes to arrive
+    """
+
+    _WHITESPACE = re.compile(rb'[ \t\n\r]*')
+    _SCALAR = re.compile(rb'[^ \t\n\r\[\]{}",:]*')
+    _STRUCTURE = re.compile(rb'[\[\]{}"]')
+    _STRING_END = re.compile(rb'["\\]')
+
+    _QUOTE = ord('"')
+    _BACKSLASH = ord('\\')
+    _OPENERS = frozenset(b'[{')
+
+    def __init__(self, sock, chunk_size=READ_CHUNK_SIZE):
+        """creates a MessageReader
+
+        :param sock: socket connection to read from
+        :type sock: socket.SocketType
+
+        :param chunk_size: maximum number of bytes to receive at once
+        :type chunk_size: int
+        """
+
+        self._sock = sock
+        self._chunk_size = chunk_size
+        self._buffer = bytearray()
+        self._reset_scan()
+
+        self.decode_seconds = 0.0
+        self._waited = 0.0
+
+    def _reset_scan(self):
+        """forgets the progress of scanning the current message"""
+
+        self._scanning = False
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+
+    def read(self):
+        """reads the next message
+
+        :returns: JSON message parsed into a python object
+        :rtype: JSON
+
+        :raises: ConnectionError if the socket closes before a whole message
+                 arrives, ValueError if the message is not valid JSON
+        """
+
+        start = time.perf_counter()
+        self._waited = 0.0
+
+        while True:
+            end = self._scan()
+            if end is not None:
+                break
+
+            self._receive('connection closed mid-message')
+
+        msg = bytes(self._buffer[:end])
+        del self._buffer[:end]
+        self._reset_scan()
+
+        msg = json.loads(msg.decode('utf-8'))
+        self.decode_seconds = time.perf_counter() - start - self._waited
+
+        return msg
+
+    def read_frame(self):
+        """reads the next message of the binary codec
+
+        :returns: message of the next Frame
+        :rtype: JSON
+
+        :raises: ConnectionError if the socket closes before a whole frame
+                 arrives, ValueError if the frame is malformed
+        """
+
+        start = time.perf_counter()
+        self._waited = 0.0
+
+        # the newline ending the JSON message that switched codecs may
+        # still be buffered; a frame never starts with whitespace, since
+        # its size is below 2 ** 24
+        while True:
+            self._fill(1)
+            del self._buffer[:self._WHITESPACE.match(self._buffer).end()]
+            if self._buffer:
+                break
+
+        self._fill(FRAME_HEADER.size)
+        [size] = FRAME_HEADER.unpack_from(self._buffer)
+
+        if size > MAX_FRAME_SIZE:
+            raise ValueError('frame of {} bytes is too large'.format(size))
+
+        end = FRAME_HEADER.size + size
+        self._fill(end)
+
+        payload = bytes(self._buffer[FRAME_HEADER.size:end])
+        del self._buffer[:end]
+
+        msg = decode_payload(payload)
+        self.decode_seconds = time.perf_counter() - start - self._waited
+
+        return msg
+
+    def _fill(self, size):
+        """receives until at least a number of bytes are buffered
+
+        :param size: number of bytes needed
+        :type size: int
+        """
+
+        while len(self._buffer) < size:
+            self._receive('connection closed mid-frame')
+
+    def _receive(self, closed_message):
+        """receives the next chunk into the buffer, timing the wait
+
+        :param closed_message: message of the error if the socket closed
+        :type closed_message: str
+        """
+
+        start = time.perf_counter()
+        chunk = self._sock.recv(self._chunk_size)
+        self._waited += time.perf_counter() - start
+
+        if not chunk:
+            raise ConnectionError(closed_message)
+
+        self._buffer += chunk
+
+    def _scan(self):
+        """scans the buffered bytes for the end of the current message
+
+        :returns: end of the message if it has fully arrived, else None
+        :rtype: int or None
+        """
+
+        buf = self._buffer
+
+        if not self._scanning:
+            start = self._WHITESPACE.match(buf).end()
+            del buf[:start]
+
+            if not buf:
+                return None
+
+            if buf[0] not in self._OPENERS and buf[0] != self._QUOTE:
+                return self._scan_scalar()
+
+            self._scanning = True
+
+        pos = self._pos
+        depth = self._depth
+        in_string = self._in_string
+
+        try:
+            while True:
+                if in_string:
+                    match = self._STRING_END.search(buf, pos)
+                    if match is None:
+                        pos = len(buf)
+                        return None
+
+                    if buf[match.start()] == self._BACKSLASH:
+                        if match.end() == len(buf):
+                            pos = match.start()
+                            return None
+                        pos = match.end() + 1
+                        continue
+
+                    pos = match.end()
+                    in_string = False
+
+                    if depth == 0:
+                        return pos
+                else:
+                    match = self._STRUCTURE.search(buf, pos)
+                    if match is None:
+                        pos = len(buf)
+                        return None
+
+                    pos = match.end()
+                    char = buf[match.start()]
+
+                    if char == self._QUOTE:
+                        in_string = True
+                    elif char in self._OPENERS:
+                        depth += 1
+                    else:
+                        depth -= 1
+                        if depth == 0:
+                            return pos
+        finally:
+            self._pos = pos
+            self._depth = depth
+            self._in_string = in_string
+
+    def _scan_scalar(self):
+        """finds the end of a top-level number or literal
+
+        :returns: end of the message if it is valid, None if it may still be
+                  incomplete
+        :rtype: int or None
+        """
+
+        end = self._SCALAR.match(self._buffer).end()
+
+        try:
+            json.loads(self._buffer[:end].decode('utf-8'))
+        except ValueError:
+            if end == len(self._buffer):
+                return None
+            raise
+
+        return end
+
+
+_readers = weakref.WeakKeyDictionary()
+
+
+def _get_reader(sock):
+    """gets the MessageReader buffering a socket's bytes
+
+    :param sock: socket connection
+    :type sock: socket.SocketType
+
+    :returns: reader of the socket
+    :rtype: MessageReader
+    """
+
+    reader = _readers.get(sock)
+    if reader is None:
+        reader = _readers[sock] = MessageReader(sock)
+
+    return reader
 
 
 def read(sock):
     """reads a message from a socket and returns it as JSON
 
+    bytes received after the message are kept for the next read of the
+    same socket
+
     :param sock: socket connection
     :type sock: socket.SocketType
 
@@ -159,12 +1584,20 @@ def read(sock):
     :rtype: JSON
     """
 
-    msg = ''
+    return _get_reader(sock).read()
+
+
+def read_frame(sock):
+    """reads a Frame from a socket and returns its message
+
+    :param sock: socket connection
+    :type sock: socket.SocketType
 
-    while not is_valid_json(msg.strip()):
-        msg += sock.recv(1).decode('utf-8')
+    :returns: message of the frame
+    :rtype: JSON
+    """
 
-    return json.loads(msg.strip())
+    return _get_reader(sock).read_frame()
 
 
 def is_valid_json(msg):
@@ -184,7 +1617,7 @@ def is_valid_json(msg):
         return False
 
 
-def get_reply(player, validator, msg):
+def get_reply(player, validator, msg, mirror=None):
     """gets a player's reply to a message
 
     :param player: player playing the game
@@ -196,6 +1629,9 @@ def get_reply(player, validator, msg):
     :param msg: message
     :type msg: JSON
 
+    :param mirror: mirror of the board for Deltas, None to refuse Deltas
+    :type mirror: BoardMirror or None
+
     :returns: player reply to a message
     :rtype: JSON
     """
@@ -206,6 +1642,13 @@ def get_reply(player, validator, msg):
         'choose': choose
     }
 
+    # start-round may carry Options after the hand
+    request_type_to_num_params = {
+        'start-round': (1, 2),
+        'take-turn': (1,),
+        'choose': (1,)
+    }
+
     if not isinstance(msg, list) or not msg:
         raise ValueError('Incorrect message format')
 
@@ -214,86 +1657,120 @@ def get_reply(player, validator, msg):
     if request_type not in request_type_to_fn:
         raise ValueError('Incorrect message format')
 
-    if not validator.is_valid_transition(request_type):
+    if len(params) not in request_type_to_num_params[request_type]:
+        raise ValueError('Incorrect number of arguments')
+
+    hand_is_empty = player.get_num_cards_in_hand() == 0
+    if not validator.is_valid_transition(request_type, hand_is_empty):
         return False
 
+    if mirror is not None:
+        try:
+            params = mirror.translate(request_type, params)
+        except BoardDesync:
+            return RESYNC
+    elif request_type == 'start-round' and len(params) == 2:
+        params = params[:1]
+
     request_fn = request_type_to_fn[request_type]
     validator.update(request_type)
 
-    return request_fn(player, *params)
+    reply = request_fn(player, *params)
 
+    if request_type == 'start-round' and mirror is not None and mirror.deltas:
+        return {'deltas': True}
 
-def validate_request_input(validators):
-    """validates function input with validators
+    return reply
 
-    :param validators: list of validator functions in argument order
-    :type validators: list of func: JSON -> bool
 
-    :returns: request function with input validation
-    :rtype: func
+class CardDecoder:
+    """validates JSON cards and converts them to Cards in a single pass
 
-    :raises: ValueError if input is invalid
+    every valid Card is created once, when the decoder is built, and shared
+    by everything the decoder returns
     """
 
-    def wrap(fn):
-        def request(player, *args):
-            all_valid_inputs = all(
-                validator(arg) for validator, arg in zip(validators, args))
-            if not all_valid_inputs:
-                raise ValueError('Invalid argument type')
-            return fn(player, *args)
-        return request
-    return wrap
+    def __init__(self, min_face=MIN_FACE, max_face=MAX_FACE,
+                 min_bull=MIN_BULL, max_bull=MAX_BULL):
+        """creates a CardDecoder for cards with faces and bulls in ranges
 
+        :param min_face: smallest valid face
+        :type min_face: int
 
-def is_json_card(maybe_json_card):
-    """check if the input is a valid JSON card
+        :param max_face: largest valid face
+        :type max_face: int
 
-    :param maybe_json_card: input to check
-    :type maybe_json_card: JSON
+        :param min_bull: smallest valid bull
+        :type min_bull: int
 
-    :returns: whether input is a JSONCard
-    :rtype: bool
-    """
+        :param max_bull: largest valid bull
+        :type max_bull: int
+        """
 
-    if isinstance(maybe_json_card, list) and len(maybe_json_card) == 2:
-        [face, bull] = maybe_json_card
+        self._cards = {
+            face: tuple(Card(face, bull) if bull >= min_bull else None
+                        for bull in range(max_bull + 1))
+            for face in range(min_face, max_face + 1)
+        }
 
-        return (isinstance(face, int) and
-                isinstance(bull, int) and
-                MIN_FACE <= face <= MAX_FACE and
-                MIN_BULL <= bull <= MAX_BULL)
+    def decode_lcard(self, lcard):
+        """validates an LCard and converts it to a list of Card
 
-    return False
+        :param lcard: json cards to convert
+        :type lcard: LCard
 
+        :returns: internal representation of Cards
+        :rtype: list of Card
 
-def is_lcard(maybe_lcard):
-    """checks if the input is a valid LCard
+        :raises: ValueError if the input is not an LCard
+        """
 
-    :param maybe_lcard: input to check
-    :type maybe_lcard: JSON
+        if not isinstance(lcard, list):
+            raise ValueError('Invalid argument type')
 
-    :returns: whether input is an LCard
-    :rtype: bool
-    """
+        all_cards = self._cards
+        cards = []
 
-    return isinstance(maybe_lcard, list) and all(map(is_json_card, maybe_lcard))
+        for json_card in lcard:
+            card = None
 
+            if isinstance(json_card, list) and len(json_card) == 2:
+                face, bull = json_card
 
-def is_deck(maybe_deck):
-    """checks if the input is a valid deck
+                if (isinstance(face, int) and isinstance(bull, int) and
+                        bull >= 0):
+                    bulls = all_cards.get(face)
+                    if bulls is not None and bull < len(bulls):
+                        card = bulls[bull]
 
-    :param maybe_deck: input to check
-    :type maybe_deck: JSON
+            if card is None:
+                raise ValueError('Invalid argument type')
 
-    :returns: whether input is an Deck
-    :rtype: bool
-    """
+            cards.append(card)
 
-    return isinstance(maybe_deck, list) and all(map(is_lcard, maybe_deck))
+        return cards
+
+    def decode_deck(self, deck):
+        """validates a Deck and converts it to a list of list of Card
+
+        :param deck: deck to convert
+        :type deck: Deck
+
+        :returns: internal representation of the stacks
+        :rtype: list of list of Card
+
+        :raises: ValueError if the input is not a Deck
+        """
+
+        if not isinstance(deck, list):
+            raise ValueError('Invalid argument type')
+
+        return [self.decode_lcard(stack) for stack in deck]
+
+
+DECODER = CardDecoder()
 
 
-@validate_request_input([is_lcard])
 def start_round(player, hand):
     """starts a round
 
@@ -305,13 +1782,14 @@ def start_round(player, hand):
 
     :returns: True to acknowledge the message
     :rtype: bool
+
+    :raises: ValueError if the hand is not an LCard
     """
 
-    player.set_hand([json_card_to_internal(json_card) for json_card in hand])
+    player.set_hand(DECODER.decode_lcard(hand))
     return True
 
 
-@validate_request_input([is_deck])
 def take_turn(player, deck):
     """takes a turn
 
@@ -323,15 +1801,16 @@ def take_turn(player, deck):
 
     :returns: card the player wishes to play
     :rtype: Card
+
+    :raises: ValueError if the deck is not a Deck
     """
 
-    internal_deck = [lcard_to_internal(stack) for stack in deck]
+    internal_deck = DECODER.decode_deck(deck)
     card = player.pick_card(internal_deck, None)
 
     return json_card_from_internal(card)
 
 
-@validate_request_input([is_deck])
 def choose(player, deck):
     """chooses a stack
 
@@ -343,9 +1822,11 @@ def choose(player, deck):
 
     :returns: stack the player wishes to take
     :rtype: Stack
+
+    :raises: ValueError if the deck is not a Deck
     """
 
-    internal_deck = [lcard_to_internal(stack) for stack in deck]
+    internal_deck = DECODER.decode_deck(deck)
     stack_index = player.pick_stack(internal_deck, None, None)
 
     return deck[stack_index]
@@ -364,31 +1845,17 @@ def send(sock, reply):
     sock.sendall(str.encode(json.dumps(reply) + '\n'))
 
 
-def json_card_to_internal(json_card):
-    """convert a JSONCard to a Card
-
-    :param json_card: json card to convert
-    :type json_card: JSONCard
-
-    :returns: internal representation of Card
-    :rtype: Card
-    """
-
-    [face, bull] = json_card
-    return Card(face, bull)
-
+def send_frame(sock, reply):
+    """sends a reply over the socket as a Frame
 
-def lcard_to_internal(lcard):
-    """convert an LCard to a list of Card
-
-    :param lcard: json cards to convert
-    :type lcard: LCard
+    :param sock: socket connection
+    :type sock: socket.SocketType
 
-    :returns: internal representation of Cards
-    :rtype: list of Card
+    :param reply: reply message
+    :type reply: JSON
     """
 
-    return [json_card_to_internal(json_card) for json_card in lcard]
+    sock.sendall(encode_frame(reply))
 
 
 def json_card_from_internal(card):
@@ -404,5 +1871,34 @@ def json_card_from_internal(card):
     return [card.face, card.bull]
 
 
+STRATEGIES = {
+    'highest-card': Player,
+    'search': SearchPlayer,
+}
+
+
 if __name__ == "__main__":
-    run(SERVER, PORT)
+    parser = argparse.ArgumentParser(description='plays 6 Nimmt! over TCP')
+    parser.add_argument('--server', default=SERVER)
+    parser.add_argument('--port', type=int, default=PORT)
+    parser.add_argument('--strategy', choices=sorted(STRATEGIES),
+                        default='highest-card')
+    parser.add_argument('--resume', action='store_true',
+                        help='reconnect and resume after a dropped connection')
+    parser.add_argument('--max-retries', type=int,
+                        default=DEFAULT_MAX_RETRIES)
+    parser.add_argument('--deadline', type=float, default=None,
+                        help='seconds a decision may take before the '
+                             'highest card or cheapest stack is played')
+    parser.add_argument('--stats', action='store_true',
+                        help='keep latency histograms of every request, '
+                             'printed on SIGUSR1 and at exit')
+    args = parser.parse_args()
+
+    stats = None
+    if args.stats:
+        stats = RequestStats()
+        stats.install()
+
+    run(args.server, args.port, STRATEGIES[args.strategy], args.resume,
+        args.max_retries, deadline=args.deadline, stats=stats)
@@ -2,6 +2,6 @@
 virtualenv -p python3 lvs-vignesh-venv
 . lvs-vignesh-venv/bin/activate
 pip install pytest
-py.test test_player_proxy.py
+py.test test_player_proxy.py test_game_host.py test_loadgen.py
 # deactivate
 # rm -r ./lvs-vignesh-venv
@@ -0,0 +1,433 @@
+import asyncio
+import json
+import os
+import socket
+import sys
+import time
+from threading import Lock, Thread
+
+PATH_TO_PLAYER = '../../3/'
+sys.path.append(os.path.join(os.path.dirname(__file__), PATH_TO_PLAYER))
+
+import pytest
+
+import game_host as host
+import player_proxy as proxy
+from player import Card
+
+
+class LocalPlayer(host.RemotePlayer):
+    """seat answered in process by a proxy Player after a delay"""
+
+    def __init__(self, delay=0.0, deltas=False):
+        super().__init__(None, None, deltas=deltas)
+        self._delay = delay
+        self._player = proxy.Player()
+        self._validator = proxy.TimingValidator()
+        self.mirror = proxy.BoardMirror()
+        self.bytes_sent = 0
+        self.replies = []
+
+    async def request(self, msg):
+        await asyncio.sleep(self._delay)
+        self.bytes_sent += len(json.dumps(msg))
+
+        reply = proxy.get_reply(
+            self._player, self._validator, msg, self.mirror)
+        self.replies.append(reply)
+        return reply
+
+
+def test_play_turn_is_concurrent():
+    """tests that a turn waits for the slowest player, not all of them"""
+
+    delay = 0.05
+    players = [LocalPlayer(delay) for _ in range(5)]
+    dealer = host.AsyncDealer(players, seed=0)
+
+    async def play():
+        dealer._deck = dealer._initial_deck[:]
+        await asyncio.gather(*(
+            player.start_round(dealer.deal_hand()) for player in players))
+        dealer._stacks = dealer.get_new_stacks()
+
+        start = time.perf_counter()
+        await dealer.play_turn()
+        return time.perf_counter() - start
+
+    elapsed = asyncio.run(play())
+
+    assert elapsed < delay * 3
+    assert all(p.get_num_cards_in_hand() == 9 for p in players)
+
+
+def test_async_dealer_matches_dealer():
+    """tests that remote seats play the same game as local players"""
+
+    from dealer import Dealer
+
+    expected = Dealer([proxy.Player() for _ in range(4)],
+                      seed=11).simulate_game()
+    results = asyncio.run(
+        host.AsyncDealer([LocalPlayer() for _ in range(4)],
+                         seed=11).simulate_game())
+
+    assert results == expected
+
+
+def test_get_board_delta():
+    """tests that deltas rebuild the deck they were made from
+
+    cases:
+        - cards pushed on top
+        - stack replaced
+        - unchanged stack
+    """
+
+    previous = [[[10, 2]], [[20, 3], [15, 2]], [[30, 4]]]
+    current = [[[12, 2], [11, 3], [10, 2]], [[25, 5]], [[30, 4]]]
+
+    delta = host.get_board_delta(previous, current)
+    assert delta['ops'] == [
+        ['push', 0, [11, 3]], ['push', 0, [12, 2]], ['set', 1, [[25, 5]]]]
+
+    mirror = proxy.BoardMirror()
+    mirror.translate('start-round', [[], {'deltas': True}])
+    mirror.translate('take-turn', [previous])
+    assert mirror.translate('take-turn', [delta]) == [current]
+
+
+def test_deltas_match_full_decks():
+    """tests that games played with deltas match games without them and
+    send fewer bytes"""
+
+    from dealer import Dealer
+
+    expected = Dealer([proxy.Player() for _ in range(4)],
+                      seed=4).simulate_game()
+
+    plain_players = [LocalPlayer() for _ in range(4)]
+    delta_players = [LocalPlayer(deltas=True) for _ in range(4)]
+
+    for players in [plain_players, delta_players]:
+        results = asyncio.run(
+            host.AsyncDealer(players, seed=4).simulate_game())
+        assert results == expected
+
+    assert {'deltas': True} in delta_players[0].replies
+    assert proxy.RESYNC not in delta_players[0].replies
+    assert (sum(p.bytes_sent for p in delta_players) <
+            sum(p.bytes_sent for p in plain_players))
+
+
+def test_deltas_resync():
+    """tests that a desynchronized mirror is resent the full deck"""
+
+    player = LocalPlayer(deltas=True)
+    dealer = host.AsyncDealer([player, LocalPlayer(deltas=True)], seed=1)
+
+    async def play():
+        await dealer.play_round()
+
+    original_translate = player.mirror.translate
+    turns = []
+
+    def corrupting_translate(request_type, params):
+        params = original_translate(request_type, params)
+        if request_type == 'take-turn':
+            turns.append(params[0])
+            if len(turns) == 3:
+                player.mirror._deck = [[[1, 2]]] * 4
+        return params
+
+    player.mirror.translate = corrupting_translate
+    asyncio.run(play())
+
+    assert player.replies.count(proxy.RESYNC) == 1
+    assert player.get_num_cards_in_hand() == 0
+
+
+def test_remote_player_rejects_bad_replies():
+    """tests that protocol violations abandon the game
+
+    cases:
+        - card not in hand
+        - stack that does not exist
+    """
+
+    class BadPlayer(host.RemotePlayer):
+        def __init__(self, reply):
+            super().__init__(None, None)
+            self._reply = reply
+
+        async def request(self, msg):
+            return self._reply
+
+    player = BadPlayer([104, 7])
+    player.set_hand([Card(1, 3)])
+    with pytest.raises(ValueError):
+        asyncio.run(player.take_turn([[Card(5, 2)]]))
+
+    player = BadPlayer([[9, 9]])
+    with pytest.raises(ValueError):
+        asyncio.run(player.choose([[Card(5, 2)]]))
+
+
+def test_host_games():
+    """integration test hosting concurrent games for proxy clients"""
+
+    num_games = 3
+    players_per_game = 3
+    game_host = host.GameHost(players_per_game, num_games, seed=0)
+
+    async def serve():
+        ready = asyncio.get_running_loop().create_future()
+        serving = asyncio.ensure_future(
+            game_host.serve('localhost', 0, ready))
+        port = await ready
+
+        for _ in range(num_games * players_per_game):
+            client = Thread(target=proxy.run, args=('localhost', port))
+            client.daemon = True
+            client.start()
+
+        return await serving
+
+    results = asyncio.run(asyncio.wait_for(serve(), 30))
+
+    assert len(results) == num_games
+    for game_results in results:
+        assert len(game_results) == players_per_game
+        assert game_results[0][1] <= -66
+
+
+def test_host_multiplexed_games():
+    """integration test playing many games over one connection per client"""
+
+    num_games = 40
+    players_per_game = 3
+    game_host = host.GameHost(
+        players_per_game, num_games, seed=0, multiplex=True)
+
+    async def serve():
+        ready = asyncio.get_running_loop().create_future()
+        serving = asyncio.ensure_future(
+            game_host.serve('localhost', 0, ready))
+        port = await ready
+
+        for _ in range(players_per_game):
+            client = Thread(target=proxy.run, args=('localhost', port))
+            client.daemon = True
+            client.start()
+
+        return await serving
+
+    results = asyncio.run(asyncio.wait_for(serve(), 60))
+
+    assert len(results) == num_games
+    assert all(game_results is not None for game_results in results)
+
+
+def test_host_resumed_games(monkeypatch):
+    """integration test resuming players whose connections keep dropping
+
+    every few replies a proxy's connection is shut down, alternately
+    before the reply is sent and just after
+    """
+
+    num_games = 2
+    players_per_game = 3
+    drop_every = 15
+
+    send = proxy.send
+    lock = Lock()
+    num_sends = [0]
+
+    def flaky_send(sock, reply):
+        with lock:
+            num_sends[0] += 1
+            count = num_sends[0]
+
+        drop = count % drop_every == 0
+        if drop and count % (2 * drop_every):
+            sock.shutdown(socket.SHUT_RDWR)
+
+        send(sock, reply)
+
+        if drop:
+            sock.shutdown(socket.SHUT_RDWR)
+
+    monkeypatch.setattr(proxy, 'send', flaky_send)
+
+    game_host = host.GameHost(
+        players_per_game, num_games, seed=0, resume_timeout=5.0)
+
+    async def serve():
+        ready = asyncio.get_running_loop().create_future()
+        serving = asyncio.ensure_future(
+            game_host.serve('localhost', 0, ready))
+        port = await ready
+
+        for _ in range(num_games * players_per_game):
+            client = Thread(
+                target=proxy.run, args=('localhost', port),
+                kwargs={'resume': True, 'backoff': 0.01})
+            client.daemon = True
+            client.start()
+
+        return await serving
+
+    results = asyncio.run(asyncio.wait_for(serve(), 60))
+
+    assert num_sends[0] > 2 * drop_every
+    assert len(results) == num_games
+    assert all(game_results is not None for game_results in results)
+
+    expected = asyncio.run(host.AsyncDealer(
+        [LocalPlayer() for _ in range(players_per_game)],
+        seed=0).simulate_game())
+    assert expected in results
+
+
+def test_host_resumed_games_end():
+    """tests that resuming proxies return once their game is over rather
+    than reconnecting to a host that has stopped listening"""
+
+    players_per_game = 2
+    game_host = host.GameHost(
+        players_per_game, 1, seed=0, resume_timeout=2.0)
+    errors = []
+
+    def play(port):
+        try:
+            proxy.run('localhost', port, resume=True, backoff=0.05)
+        except Exception as e:
+            errors.append(e)
+
+    async def serve():
+        ready = asyncio.get_running_loop().create_future()
+        serving = asyncio.ensure_future(
+            game_host.serve('localhost', 0, ready))
+        port = await ready
+
+        clients = [Thread(target=play, args=(port,), daemon=True)
+                   for _ in range(players_per_game)]
+        for client in clients:
+            client.start()
+
+        return await serving, clients
+
+    results, clients = asyncio.run(asyncio.wait_for(serve(), 30))
+
+    for client in clients:
+        client.join(5)
+
+    assert results[0] is not None
+    assert not any(client.is_alive() for client in clients)
+    assert errors == []
+
+
+@pytest.mark.parametrize('proxy_codecs', [
+    proxy.SUPPORTED_CODECS, [proxy.JSON_CODEC]])
+def test_host_binary_games(monkeypatch, proxy_codecs):
+    """integration test offering proxies the binary codec, which they
+    take up or fall back to JSON from"""
+
+    num_games = 2
+    players_per_game = 3
+
+    monkeypatch.setattr(proxy, 'SUPPORTED_CODECS', proxy_codecs)
+    game_host = host.GameHost(players_per_game, num_games, seed=0,
+                              binary=True)
+
+    async def serve():
+        ready = asyncio.get_running_loop().create_future()
+        serving = asyncio.ensure_future(
+            game_host.serve('localhost', 0, ready))
+        port = await ready
+
+        for _ in range(num_games * players_per_game):
+            client = Thread(target=proxy.run, args=('localhost', port))
+            client.daemon = True
+            client.start()
+
+        return await serving
+
+    results = asyncio.run(asyncio.wait_for(serve(), 30))
+
+    expected = asyncio.run(host.AsyncDealer(
+        [LocalPlayer() for _ in range(players_per_game)],
+        seed=0).simulate_game())
+    assert expected in results
+    assert all(game_results is not None for game_results in results)
+
+
+class StallingPlayer(proxy.Player):
+    """highest-card player that takes far longer than the host waits"""
+
+    def pick_card(self, stacks, opponent_points):
+        time.sleep(1.0)
+        return super().pick_card(stacks, opponent_points)
+
+
+def test_host_games_with_deadline():
+    """integration test keeping stalling proxies in their seats by playing
+    the default move once their deadline passes"""
+
+    players_per_game = 2
+    game_host = host.GameHost(players_per_game, 1, seed=0, reply_timeout=0.5)
+
+    async def serve():
+        ready = asyncio.get_running_loop().create_future()
+        serving = asyncio.ensure_future(
+            game_host.serve('localhost', 0, ready))
+        port = await ready
+
+        for _ in range(players_per_game):
+            client = Thread(target=proxy.run,
+                            args=('localhost', port, StallingPlayer),
+                            kwargs={'deadline': 0.05})
+            client.daemon = True
+            client.start()
+
+        return await serving
+
+    results = asyncio.run(asyncio.wait_for(serve(), 60))
+
+    expected = asyncio.run(host.AsyncDealer(
+        [LocalPlayer() for _ in range(players_per_game)],
+        seed=0).simulate_game())
+    assert results == [expected]
+
+
+@pytest.mark.parametrize('binary', [False, True])
+def test_host_batched_games(binary):
+    """integration test batching each round's start-round and first
+    take-turn"""
+
+    num_games = 2
+    players_per_game = 3
+    game_host = host.GameHost(players_per_game, num_games, seed=0,
+                              binary=binary, batch=True)
+
+    async def serve():
+        ready = asyncio.get_running_loop().create_future()
+        serving = asyncio.ensure_future(
+            game_host.serve('localhost', 0, ready))
+        port = await ready
+
+        for _ in range(num_games * players_per_game):
+            client = Thread(target=proxy.run, args=('localhost', port))
+            client.daemon = True
+            client.start()
+
+        return await serving
+
+    results = asyncio.run(asyncio.wait_for(serve(), 30))
+
+    expected = [
+        asyncio.run(host.AsyncDealer(
+            [LocalPlayer() for _ in range(players_per_game)],
+            seed=seed).simulate_game())
+        for seed in range(num_games)]
+    assert sorted(results) == sorted(expected)
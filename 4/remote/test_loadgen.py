@@ -0,0 +1,52 @@
+import os
+import sys
+
+PATH_TO_PLAYER = '../../3/'
+sys.path.append(os.path.join(os.path.dirname(__file__), PATH_TO_PLAYER))
+
+import loadgen
+import player_proxy as proxy
+
+PATH_TO_TEST_INPUTS = os.path.join(os.path.dirname(__file__), '../test/')
+
+
+def test_load_sequences():
+    """tests reading message sequences up to the first invalid JSON"""
+
+    paths = [os.path.join(PATH_TO_TEST_INPUTS, '{}-in.json'.format(i))
+             for i in [1, 4, 5]]
+    sequences = loadgen.load_sequences(paths)
+
+    assert [len(sequence) for sequence in sequences] == [3, 2, 6]
+    assert sequences[2][0][0] == 'start-round'
+
+
+def test_record_sequences():
+    """tests that recorded sequences are valid for a proxy"""
+
+    sequences = loadgen.record_sequences(2, players_per_game=3)
+    assert len(sequences) == 6
+
+    for sequence in sequences:
+        player = proxy.Player()
+        validator = proxy.TimingValidator()
+
+        for msg in sequence:
+            assert proxy.get_reply(player, validator, msg) is not False
+
+
+def test_run_load():
+    """tests replaying sequences against proxy processes"""
+
+    sequences = loadgen.record_sequences(2, players_per_game=2)
+    sequences += loadgen.load_sequences(
+        [os.path.join(PATH_TO_TEST_INPUTS, '4-in.json')])
+
+    results = loadgen.run_load(sequences, num_dealers=2)
+
+    expected_calls = sum(len(sequence) for sequence in sequences)
+    assert results['all']['calls'] == expected_calls
+    assert results['start-round']['calls'] >= 5
+
+    for summary in results.values():
+        assert summary['p50'] <= summary['p99'] <= summary['p999']
@@ -1,10 +1,11 @@
+import io
 import json
 import os
+import signal
 import socket
 import sys
-import time
 from queue import Queue
-from threading import Thread
+from threading import Event, Thread
 
 PATH_TO_PLAYER = '../../3/'
 sys.path.append(os.path.join(os.path.dirname(__file__), PATH_TO_PLAYER))
@@ -185,6 +186,66 @@ def test_read():
     server_sock.close()
 
 
+def test_message_reader():
+    """tests reading messages in chunks
+
+    cases:
+        - message split at every byte, including inside escapes
+        - brackets and quotes inside strings
+        - leftover bytes kept for the next message
+        - large message read in few chunks
+        - closed connection and invalid JSON raise errors
+    """
+
+    tricky = ["take-turn", "a\\\"]\u00e9[", {"}": [[1, 2]]}]
+    encoded = json.dumps(tricky).encode('utf-8')
+
+    reader_sock, writer_sock = socket.socketpair()
+    reader = proxy.MessageReader(reader_sock, chunk_size=1)
+
+    for i in range(len(encoded)):
+        writer_sock.sendall(encoded[i:i + 1])
+    assert reader.read() == tricky
+
+    writer_sock.sendall(b' 4\n["choose", []]\n[1][2')
+    assert reader.read() == 4
+    assert reader.read() == ["choose", []]
+    assert reader.read() == [1]
+
+    writer_sock.sendall(b']')
+    assert reader.read() == [2]
+
+    class CountingSocket:
+        def __init__(self, sock):
+            self.sock = sock
+            self.num_recv = 0
+
+        def recv(self, size):
+            self.num_recv += 1
+            return self.sock.recv(size)
+
+    deck = [[[i, 2]] * 5 for i in range(1, 2000)]
+    big_message = (json.dumps(["take-turn", deck]) + '\n').encode('utf-8')
+    counting_sock = CountingSocket(reader_sock)
+
+    sender = Thread(target=writer_sock.sendall, args=(big_message,))
+    sender.start()
+    assert proxy.MessageReader(counting_sock).read() == ["take-turn", deck]
+    sender.join()
+    assert counting_sock.num_recv <= len(big_message) // 1000
+
+    writer_sock.sendall(b'[1,,2]')
+    with pytest.raises(ValueError):
+        proxy.read(reader_sock)
+
+    writer_sock.sendall(b'["start')
+    writer_sock.close()
+    with pytest.raises(ConnectionError):
+        proxy.read(reader_sock)
+
+    reader_sock.close()
+
+
 def test_is_valid_json():
     """tests is_valid_json
 
@@ -296,6 +357,458 @@ def test_get_reply_invalid():
         proxy.get_reply(player, validator,
                         ["this is totally not a request", None])
 
+
+def test_get_reply_next_round():
+    """tests that a new round may start once the hand is played out
+
+    cases:
+        - after the last take-turn
+        - after a choose following the last take-turn
+    """
+
+    validator = proxy.TimingValidator()
+
+    hand = [[7, 7], [4, 4]]
+    deck = [[[4, 4], [5, 5]], [[6, 6], [7, 7]]]
+
+    class PoppingPlayer(TestPlayer):
+        def pick_card(self, stacks, opponent_points):
+            return self._hand.pop()
+
+    player = PoppingPlayer()
+
+    assert proxy.get_reply(player, validator, ["start-round", hand]) is True
+    proxy.get_reply(player, validator, ["take-turn", deck])
+    assert proxy.get_reply(player, validator, ["start-round", hand]) is False
+
+    proxy.get_reply(player, validator, ["take-turn", deck])
+    assert proxy.get_reply(player, validator, ["start-round", hand]) is True
+
+    proxy.get_reply(player, validator, ["take-turn", deck])
+    proxy.get_reply(player, validator, ["take-turn", deck])
+    proxy.get_reply(player, validator, ["choose", deck])
+    assert proxy.get_reply(player, validator, ["start-round", hand]) is True
+
+
+def test_game_sessions():
+    """tests playing several games by game id
+
+    cases:
+        - sessions created lazily and kept apart
+        - end-game evicts a session and gets no reply
+        - a broken game is evicted without touching the others
+        - a request with the wrong number of arguments --> only its game
+          evicted
+        - malformed envelopes
+    """
+
+    sessions = proxy.GameSessions(TestPlayer)
+    hand = [[7, 7], [4, 4], [2, 2]]
+    deck = [[[4, 4], [5, 5]], [[6, 6], [7, 7]]]
+
+    assert proxy.is_envelope(["game", 1, ["start-round", hand]])
+    assert proxy.is_envelope(["end-game", "a"])
+    assert not proxy.is_envelope(["start-round", hand])
+
+    assert sessions.get_reply(["game", 1, ["start-round", hand]]) == [
+        "game", 1, True]
+    assert sessions.get_reply(["game", "b", ["start-round", hand]]) == [
+        "game", "b", True]
+    assert len(sessions) == 2
+
+    assert sessions.get_reply(["game", 1, ["take-turn", deck]]) == [
+        "game", 1, [7, 7]]
+    assert sessions.get_reply(["game", "b", ["choose", deck]]) == [
+        "game", "b", False]
+    assert "b" not in sessions and 1 in sessions
+
+    assert sessions.get_reply(["end-game", 1]) is None
+    assert len(sessions) == 0
+
+    assert sessions.get_reply(["game", 2, ["bad", None]]) == [
+        "game", 2, False]
+    assert len(sessions) == 0
+
+    sessions.get_reply(["game", 3, ["start-round", hand]])
+    sessions.get_reply(["game", 4, ["start-round", hand]])
+    assert sessions.get_reply(["game", 3, ["take-turn"]]) == [
+        "game", 3, False]
+    assert sessions.get_reply(["game", 4, ["take-turn", deck, deck]]) == [
+        "game", 4, False]
+    assert len(sessions) == 0
+
+    for envelope in [["game", 1], ["game", [1], []], ["end-game", 1, 2],
+                     ["game", True, []]]:
+        with pytest.raises(ValueError):
+            sessions.get_reply(envelope)
+
+
+def test_card_decoder():
+    """tests decoding decks in a single validating pass
+
+    cases:
+        - valid decks --> their Cards
+        - invalid decks --> ValueError
+        - decoded cards are shared between decodes
+        - wider face ranges
+    """
+
+    decoder = proxy.CardDecoder()
+
+    assert decoder.decode_deck([]) == []
+    assert decoder.decode_deck([[]]) == [[]]
+    assert decoder.decode_deck(
+        [[[4, 4], [5, 5]], [[6, 6], [7, 7]]]) == [
+            [Card(4, 4), Card(5, 5)], [Card(6, 6), Card(7, 7)]]
+    assert decoder.decode_deck([[[104, 2]], [[1, 7]]]) == [
+        [Card(104, 2)], [Card(1, 7)]]
+
+    invalid_decks = [
+        [[[105, 2]]],
+        [[[0, 2]]],
+        [[[4, 1]]],
+        [[[4, 8]]],
+        [[[4, -1]]],
+        [[[4.0, 4]]],
+        [[[4, "4"]]],
+        [[[4, 4, 4]]],
+        [[(4, 4)]],
+        [[4, 4]],
+        ["stack"],
+        {"deck": []},
+    ]
+
+    for deck in invalid_decks:
+        with pytest.raises(ValueError):
+            decoder.decode_deck(deck)
+
+    first = decoder.decode_lcard([[7, 7], [4, 4]])
+    second = decoder.decode_lcard([[4, 4], [7, 7]])
+    assert first[0] is second[1] and first[1] is second[0]
+
+    wide_decoder = proxy.CardDecoder(max_face=210)
+    assert wide_decoder.decode_lcard([[210, 3]]) == [Card(210, 3)]
+
+
+def test_get_reply_deltas():
+    """tests negotiating and applying board deltas
+
+    cases:
+        - proxies without a mirror refuse deltas
+        - deltas rebuild the deck given to the player
+        - a checksum mismatch asks for a resync and leaves timing untouched
+        - deltas that were not negotiated or are malformed are rejected
+    """
+
+    hand = [[7, 7], [4, 4], [2, 2]]
+    deck = [[[4, 4], [5, 5]], [[6, 6], [8, 7]]]
+    pushed = [[[9, 2], [4, 4], [5, 5]], [[6, 6], [8, 7]]]
+    options = {"deltas": True}
+
+    player = TestPlayer()
+    validator = proxy.TimingValidator()
+    assert proxy.get_reply(
+        player, validator, ["start-round", hand, options]) is True
+
+    player = TestPlayer()
+    validator = proxy.TimingValidator()
+    mirror = proxy.BoardMirror()
+
+    assert proxy.get_reply(
+        player, validator, ["start-round", hand, options], mirror) == options
+
+    push = {"ops": [["push", 0, [9, 2]]], "crc": proxy.board_checksum(pushed)}
+    assert proxy.get_reply(
+        player, validator, ["take-turn", push], mirror) == proxy.RESYNC
+    assert proxy.get_reply(
+        player, validator, ["take-turn", deck], mirror) == [7, 7]
+    assert proxy.get_reply(
+        player, validator, ["choose", push], mirror) == pushed[CHOSEN_INDEX]
+
+    bad_crc = {"ops": [], "crc": proxy.board_checksum(deck)}
+    assert proxy.get_reply(
+        player, validator, ["take-turn", bad_crc], mirror) == proxy.RESYNC
+    assert proxy.get_reply(
+        player, validator, ["take-turn", pushed], mirror) == [7, 7]
+
+    with pytest.raises(ValueError):
+        proxy.get_reply(player, validator,
+                        ["take-turn", {"ops": [["pop", 0, 1]], "crc": 0}],
+                        mirror)
+
+    player = TestPlayer()
+    validator = proxy.TimingValidator()
+    mirror = proxy.BoardMirror()
+
+    assert proxy.get_reply(
+        player, validator, ["start-round", hand], mirror) is True
+    proxy.get_reply(player, validator, ["take-turn", deck], mirror)
+
+    with pytest.raises(ValueError):
+        proxy.get_reply(player, validator, ["take-turn", push], mirror)
+
+
+def test_binary_codec():
+    """tests encode_frame, decode_payload and MessageReader.read_frame
+
+    cases:
+        - requests and replies with packed forms --> round trip, smaller
+        - messages without packed forms --> round trip as JSON
+        - malformed payloads --> ValueError
+        - frames split across chunks --> read whole
+    """
+
+    hand = [[i, 3] for i in range(95, 105)]
+    deck = [[[1, 3]], [[2, 3], [5, 2]], [[3, 3]], [[4, 3], [6, 7], [9, 5]]]
+    packed = [
+        ['start-round', hand],
+        ['take-turn', deck],
+        ['choose', deck],
+        True,
+        False,
+        [104, 7],
+        [[2, 3], [5, 2]],
+    ]
+    unpacked = [
+        ['start-round', hand, {'deltas': True}],
+        ['take-turn', {'ops': [['push', 0, [7, 3]]], 'crc': 12}],
+        ['take-turn', [[[300, 3]]]],
+        ['codec', ['binary', 'json']],
+        ['game', 1, ['take-turn', deck]],
+        [True, 3],
+        [],
+        'resync',
+        {},
+        1,
+    ]
+
+    for msg in packed:
+        payload = proxy.encode_payload(msg)
+        assert payload[0] != proxy.TAG_JSON
+        assert proxy.decode_payload(payload) == msg
+        assert len(payload) * 2 < len(json.dumps(msg))
+
+    for msg in unpacked:
+        payload = proxy.encode_payload(msg)
+        assert payload[0] == proxy.TAG_JSON
+        assert proxy.decode_payload(payload) == msg
+
+    for payload in [b'', b'\x63', b'\x06\x01', b'\x07\x02\x01\x01',
+                    b'\x04\x00', b'\x02\x01', b'\x00[']:
+        with pytest.raises(ValueError):
+            proxy.decode_payload(payload)
+
+    left, right = socket.socketpair()
+    reader = proxy.MessageReader(right, chunk_size=3)
+    frames = b''.join(proxy.encode_frame(msg) for msg in packed + unpacked)
+    left.sendall(frames)
+
+    for msg in packed + unpacked:
+        assert reader.read_frame() == msg
+
+    left.sendall(b'\n' + proxy.encode_frame(True))
+    assert reader.read_frame() is True
+
+    left.sendall(proxy.encode_frame(hand)[:-1])
+    left.close()
+    with pytest.raises(ConnectionError):
+        reader.read_frame()
+    right.close()
+
+    left, right = socket.socketpair()
+    left.sendall(proxy.FRAME_HEADER.pack(proxy.MAX_FRAME_SIZE + 1))
+    with pytest.raises(ValueError):
+        proxy.MessageReader(right).read_frame()
+    left.close()
+    right.close()
+
+
+def test_choose_codec():
+    """tests choose_codec"""
+
+    assert proxy.choose_codec(['binary', 'json']) == 'binary'
+    assert proxy.choose_codec(['json', 'binary']) == 'json'
+    assert proxy.choose_codec(['xml', 'binary']) == 'binary'
+    assert proxy.choose_codec(['xml']) == 'json'
+    assert proxy.choose_codec([['binary']]) == 'json'
+    assert proxy.choose_codec(['binary'], ['json']) == 'json'
+
+
+def test_rolling_histogram():
+    """tests RollingHistogram
+
+    cases:
+        - empty --> no percentiles
+        - latencies land in the bucket of their bound
+        - samples older than the window are forgotten
+        - latencies above every bound --> inf
+    """
+
+    histogram = proxy.RollingHistogram(window=4)
+    assert histogram.get_percentile(50) is None
+
+    for seconds in [5e-6, 15e-6, 15e-6, 150e-6]:
+        histogram.add(seconds)
+
+    assert histogram.get_percentile(25) == 10
+    assert histogram.get_percentile(50) == 20
+    assert histogram.get_percentile(100) == 200
+
+    for seconds in [3, 3, 3]:
+        histogram.add(seconds)
+
+    assert histogram.num_samples == 7
+    assert sum(histogram.counts) == 4
+    assert histogram.get_percentile(25) == 200
+    assert histogram.get_percentile(50) == float('inf')
+
+
+class SlowPlayer(TestPlayer):
+    def __init__(self):
+        super().__init__()
+        self.release = Event()
+        self.release.set()
+        self.fail = False
+        self.num_decisions = 0
+
+    def pick_card(self, stacks, opponent_points):
+        self.release.wait(timeout=5)
+        self.num_decisions += 1
+        return self._hand.pop(CHOSEN_INDEX)
+
+    def pick_stack(self, stacks, opponent_points, remaining_cards):
+        if self.fail:
+            raise ValueError('cannot pick')
+        return super().pick_stack(stacks, opponent_points, remaining_cards)
+
+
+def test_timed_player_deadline():
+    """tests that TimedPlayer plays the default move past its deadline
+
+    cases:
+        - decision in time --> decision adopted
+        - decision blocked --> highest card, slow decision discarded
+        - slow decision still running --> highest card straight away, the
+          player left to the slow decision
+        - decision raises --> raised by the TimedPlayer
+    """
+
+    hand = [Card(1, 2), Card(9, 3), Card(4, 5), Card(7, 2)]
+    stacks = [[Card(2, 2)], [Card(3, 7)]]
+
+    slow = SlowPlayer()
+    player = proxy.TimedPlayer(slow, deadline=1.0)
+    player.set_hand(list(hand))
+
+    assert player.pick_card(stacks, None) == Card(1, 2)
+    assert player.get_num_cards_in_hand() == 3
+    assert slow.num_decisions == 1
+    assert player.num_missed == 0
+
+    slow.release.clear()
+    player.deadline = 0.05
+
+    assert player.pick_card(stacks, None) == Card(9, 3)
+    late = player._late
+    assert player.pick_card(stacks, None) == Card(7, 2)
+    assert player.num_missed == 2
+    assert player.get_num_cards_in_hand() == 1
+    assert slow.num_decisions == 1
+
+    slow.release.set()
+    late.join(timeout=5)
+    assert slow.num_decisions == 2
+    assert slow._hand == [Card(4, 5), Card(7, 2)]
+
+    assert player.pick_card(stacks, None) == Card(4, 5)
+    assert player.num_missed == 2
+    assert player.get_num_cards_in_hand() == 0
+
+    slow.fail = True
+    with pytest.raises(ValueError):
+        player.pick_stack(stacks, None, None)
+
+
+def test_proxy_session_stats():
+    """tests that a session records every stage of the requests it answers
+    and dumps them on a signal"""
+
+    hand = [[i, 3] for i in range(10, 20)]
+    deck = [[[1, 3]], [[2, 3]], [[3, 3]], [[4, 3]]]
+
+    stats = proxy.RequestStats()
+    session = proxy.ProxySession(proxy.Player, stats=stats)
+
+    left, right = socket.socketpair()
+    for msg in [['start-round', hand], ['take-turn', deck],
+                ['take-turn', deck], ['choose', deck], ['choose', deck]]:
+        proxy.send(left, msg)
+    left.shutdown(socket.SHUT_WR)
+
+    assert session.play(right)
+    left.close()
+    right.close()
+
+    report = stats.get_report()
+    assert list(report) == ['choose', 'start-round', 'take-turn']
+    assert list(report['take-turn']) == proxy.STAGES
+    assert report['take-turn']['strategy']['samples'] == 2
+    assert report['choose']['validate']['samples'] == 2
+    assert report['choose']['strategy']['samples'] == 1
+
+    previous = signal.signal(signal.SIGUSR1, signal.SIG_DFL)
+    try:
+        stats.install(at_exit=False)
+        os.kill(os.getpid(), signal.SIGUSR1)
+    finally:
+        signal.signal(signal.SIGUSR1, previous)
+
+    out = io.StringIO()
+    stats.dump(out)
+    assert out.getvalue().splitlines()[0].split()[:2] == ['request', 'stage']
+    assert len(out.getvalue().splitlines()) == 1 + 3 * len(proxy.STAGES)
+
+
+def test_batch_replies():
+    """tests answering a Batch
+
+    cases:
+        - start-round with take-turn --> both replies in order
+        - batch breaking the timing --> replies up to the false one
+        - nested batch --> ValueError
+        - batch sent over a socket --> one reply, game over after false
+    """
+
+    hand = [[i, 3] for i in range(10, 20)]
+    deck = [[[1, 3]], [[2, 3]], [[3, 3]], [[4, 3]]]
+
+    session = proxy.ProxySession()
+    assert session.get_batch_reply(
+        [['start-round', hand], ['take-turn', deck]]) == [True, [19, 3]]
+    assert session.get_batch_reply(
+        [['take-turn', deck], ['start-round', hand], ['take-turn', deck]]
+    ) == [[18, 3], False]
+    assert session.get_batch_reply([]) == []
+
+    with pytest.raises(ValueError):
+        session.get_batch_reply([['batch', []]])
+
+    session = proxy.ProxySession()
+    left, right = socket.socketpair()
+    proxy.send(left, ['batch', [['start-round', hand], ['take-turn', deck],
+                                ['choose', deck]]])
+    proxy.send(left, ['batch', [['take-turn', deck], ['choose', deck],
+                                ['choose', deck], ['take-turn', deck]]])
+
+    assert session.play(right)
+    reader = proxy.MessageReader(left)
+    assert reader.read() == [True, [19, 3], deck[0]]
+    assert reader.read() == [[18, 3], deck[0], False]
+    assert session.num_replies == 2
+    left.close()
+    right.close()
+
+
 def test_start_round():
     """tests start_round
 
@@ -419,30 +932,85 @@ def test_send():
     server_sock.close()
 
 
-def test_validate_request_input():
-    """tests the validate request decorator
+def test_search_player_replies():
+    """tests that the search player answers proxy requests"""
 
-    cases:
-        - doesn't raise on good input
-        - raises on bad input
-        - doesn't affect the output of the function on valid input
-    """
+    player = proxy.SearchPlayer(time_budget=0.001, seed=0)
+    validator = proxy.TimingValidator()
 
-    good_deck = [
+    hand = [[7, 7], [4, 4], [2, 2]]
+    deck = [
         [[4, 4], [5, 5]],
         [[6, 6], [7, 7]]
     ]
 
-    bad_deck = [
-        [[4, 4], [5, 5]],
-        [None]
-    ]
+    assert proxy.get_reply(player, validator, ["start-round", hand]) is True
 
-    player = TestPlayer()
-    inner_fn = lambda player, deck: (player, deck)
-    dummy_fn = proxy.validate_request_input([proxy.is_deck])(inner_fn)
+    card = proxy.get_reply(player, validator, ["take-turn", deck])
+    assert card in hand
+    assert player.get_num_cards_in_hand() == 2
 
-    assert dummy_fn(player, good_deck) == inner_fn(player, good_deck)
+    assert proxy.get_reply(player, validator, ["choose", deck]) in deck
 
-    with pytest.raises(ValueError):
-        dummy_fn(player, bad_deck)
+
+def test_run_resume():
+    """tests that a resuming proxy picks its session up on a new connection
+
+    cases:
+        - host missed the last reply --> reply sent again
+        - host has every reply --> proxy waits for the next request
+        - host does not know the session --> proxy stops
+    """
+
+    listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    listener.bind(('localhost', 0))
+    listener.listen(1)
+    port = listener.getsockname()[1]
+
+    hand = [[i, 3] for i in range(10, 20)]
+    deck = [[[1, 3]], [[2, 3]], [[3, 3]], [[4, 3]]]
+
+    client = Thread(target=proxy.run, args=('localhost', port),
+                    kwargs={'resume': True, 'backoff': 0.01})
+    client.daemon = True
+    client.start()
+
+    connection, _ = listener.accept()
+    reader = proxy.MessageReader(connection)
+    hello = reader.read()
+    assert hello[0] == 'resume' and hello[2] == 0
+    session_id = hello[1]
+
+    proxy.send(connection, ['resumed', 0])
+    proxy.send(connection, ['start-round', hand])
+    assert reader.read() is True
+    proxy.send(connection, ['take-turn', deck])
+    assert reader.read() == [19, 3]
+    connection.close()
+
+    connection, _ = listener.accept()
+    reader = proxy.MessageReader(connection)
+    assert reader.read() == ['resume', session_id, 2]
+    proxy.send(connection, ['resumed', 1])
+    assert reader.read() == [19, 3]
+    proxy.send(connection, ['take-turn', deck])
+    assert reader.read() == [18, 3]
+    connection.close()
+
+    connection, _ = listener.accept()
+    reader = proxy.MessageReader(connection)
+    assert reader.read() == ['resume', session_id, 3]
+    proxy.send(connection, ['resumed', 3])
+    proxy.send(connection, ['take-turn', deck])
+    assert reader.read() == [17, 3]
+    connection.close()
+
+    connection, _ = listener.accept()
+    reader = proxy.MessageReader(connection)
+    assert reader.read() == ['resume', session_id, 4]
+    proxy.send(connection, False)
+    connection.close()
+
+    client.join(5)
+    assert not client.is_alive()
+    listener.close()
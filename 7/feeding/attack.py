@@ -1,5 +1,6 @@
 from feeding.role import Role
 from feeding.situation import Situation
+from feeding.species import RoleView
 
 
 def is_attackable(situation):
@@ -17,14 +18,9 @@ def is_attackable(situation):
     if not attacker.is_carnivore():
         raise ValueError('attacker must be a carnivore')
 
-    mut_defender = defender.copy()
-    mut_defender.apply_traits(Role.defender)
-
-    mut_attacker = attacker.copy()
-    mut_attacker.apply_traits(Role.attacker)
-
     situation = Situation(
-        mut_defender, mut_attacker, left_neighbor, right_neighbor)
+        RoleView(defender, Role.defender), RoleView(attacker, Role.attacker),
+        left_neighbor, right_neighbor)
 
     defender_prevents = defender.prevents_attack(situation, Role.defender)
     attacker_prevents = attacker.prevents_attack(situation, Role.attacker)
@@ -0,0 +1,182 @@
+from collections import namedtuple
+
+import numpy as np
+
+from feeding.compiled import (AMBUSH, BURROWING, CARNIVORE, CLIMBING,
+                              HARD_SHELL, HARD_SHELL_MARGIN, HERDING,
+                              PACK_HUNTING, SYMBIOSIS, WARNING_CALL,
+                              compile_species)
+
+
+"""
+Evaluates is_attackable over many situations at once with NumPy arrays.
+
+The species in one role of N situations are given column by column, one
+array of N values per field of a CompiledSpecies, plus a presence array
+marking which situations have a species in that role. A neighbor that is
+absent, like None in a Situation, neither warns nor gives symbiosis,
+whatever its other columns hold.
+"""
+
+
+class SpeciesColumns(namedtuple(
+        'SpeciesColumns',
+        ['mask', 'body_size', 'population', 'food_supply', 'present'])):
+    """represents the species in one role of many situations
+
+    :attr mask: TraitMask of each species
+    :type mask: numpy.ndarray
+
+    :attr body_size: body size of each species
+    :type body_size: numpy.ndarray
+
+    :attr population: population of each species
+    :type population: numpy.ndarray
+
+    :attr food_supply: food supply of each species
+    :type food_supply: numpy.ndarray
+
+    :attr present: whether each situation has a species in the role
+    :type present: numpy.ndarray
+    """
+
+    def __new__(cls, mask, body_size, population, food_supply, present=None):
+        """creates SpeciesColumns
+
+        :param mask: TraitMask of each species
+        :type mask: array-like of int
+
+        :param body_size: body size of each species
+        :type body_size: array-like of int
+
+        :param population: population of each species
+        :type population: array-like of int
+
+        :param food_supply: food supply of each species
+        :type food_supply: array-like of int
+
+        :param present: whether each situation has a species in the role,
+                        every one if None
+        :type present: array-like of bool or None
+        """
+
+        mask = np.asarray(mask, dtype=np.int64)
+        body_size = np.asarray(body_size, dtype=np.int64)
+        population = np.asarray(population, dtype=np.int64)
+        food_supply = np.asarray(food_supply, dtype=np.int64)
+
+        if present is None:
+            present = np.ones(mask.shape, dtype=bool)
+        else:
+            present = np.asarray(present, dtype=bool)
+
+        columns = [mask, body_size, population, food_supply, present]
+        if any(column.ndim != 1 or column.shape != mask.shape
+               for column in columns):
+            raise ValueError('columns must be 1-d arrays of the same length')
+
+        return super().__new__(cls, *columns)
+
+    @classmethod
+    def from_compiled(cls, compiled_species):
+        """creates SpeciesColumns from compiled species
+
+        :param compiled_species: species of each situation
+        :type compiled_species: list of (CompiledSpecies or None)
+
+        :returns: columns of the species
+        :rtype: SpeciesColumns
+        """
+
+        absent = (0, 0, 0, 0)
+        rows = [absent if species is None else species
+                for species in compiled_species]
+
+        if rows:
+            mask, body_size, population, food_supply = zip(*rows)
+        else:
+            mask = body_size = population = food_supply = ()
+
+        return cls(mask, body_size, population, food_supply,
+                   [species is not None for species in compiled_species])
+
+
+def compile_situations(situations):
+    """compiles situations into the columns of each role
+
+    :param situations: situations to compile
+    :type situations: list of Situation
+
+    :returns: columns of the defenders, attackers, left neighbors and right
+              neighbors
+    :rtype: (SpeciesColumns, SpeciesColumns, SpeciesColumns, SpeciesColumns)
+    """
+
+    compiled = [[compile_species(species) for species in situation]
+                for situation in situations]
+
+    return tuple(
+        SpeciesColumns.from_compiled([row[role] for row in compiled])
+        for role in range(4))
+
+
+def is_attackable(defenders, attackers, left_neighbors, right_neighbors):
+    """determines for each situation if the attacker can attack the
+    defender, as feeding.attack.is_attackable does for one situation
+
+    :param defenders: defender of each situation
+    :type defenders: SpeciesColumns
+
+    :param attackers: attacker of each situation
+    :type attackers: SpeciesColumns
+
+    :param left_neighbors: left neighbor of each defender, if any
+    :type left_neighbors: SpeciesColumns
+
+    :param right_neighbors: right neighbor of each defender, if any
+    :type right_neighbors: SpeciesColumns
+
+    :returns: whether each defender is attackable by its attacker
+    :rtype: numpy.ndarray of bool
+
+    :raises: ValueError if an attacker is missing or not a carnivore
+    """
+
+    num_situations = len(defenders.mask)
+    if any(len(columns.mask) != num_situations
+           for columns in [attackers, left_neighbors, right_neighbors]):
+        raise ValueError('every role must have the same number of situations')
+
+    if not (defenders.present.all() and attackers.present.all()):
+        raise ValueError('every situation needs a defender and an attacker')
+
+    if not (attackers.mask & CARNIVORE).all():
+        raise ValueError('attacker must be a carnivore')
+
+    defender_mask = defenders.mask
+    attacker_mask = attackers.mask
+
+    attacker_body = attackers.body_size + np.where(
+        attacker_mask & PACK_HUNTING, attackers.population, 0)
+
+    neighbor_mask = (np.where(left_neighbors.present, left_neighbors.mask, 0) |
+                     np.where(right_neighbors.present, right_neighbors.mask, 0))
+
+    prevented = (
+        ((defender_mask & BURROWING) != 0) &
+        (defenders.food_supply == defenders.population))
+    prevented |= (
+        ((defender_mask & CLIMBING) != 0) & ((attacker_mask & CLIMBING) == 0))
+    prevented |= (
+        ((defender_mask & HARD_SHELL) != 0) &
+        (attacker_body - HARD_SHELL_MARGIN < defenders.body_size))
+    prevented |= (
+        ((defender_mask & HERDING) != 0) &
+        (attackers.population <= defenders.population))
+    prevented |= (
+        ((defender_mask & SYMBIOSIS) != 0) & right_neighbors.present &
+        (right_neighbors.body_size > defenders.body_size))
+    prevented |= (
+        ((neighbor_mask & WARNING_CALL) != 0) & ((attacker_mask & AMBUSH) == 0))
+
+    return ~prevented
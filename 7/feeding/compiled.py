@@ -0,0 +1,131 @@
+from feeding.trait import (ALL_TRAITS, AmbushTrait, BurrowingTrait,
+                           ClimbingTrait, HardShellTrait, HerdingTrait,
+                           PackHuntingTrait, SymbiosisTrait, WarningCallTrait)
+
+
+"""
+A TraitMask is an int with one bit set for every trait class a species has,
+the bit of ALL_TRAITS[i] being 1 << i.
+
+A CompiledSpecies is (TraitMask, Natural, Natural, Natural), the traits,
+body size, population and food supply of a species: everything that
+decides whether it can be attacked. a species is compiled once and can
+then be evaluated in any number of situations.
+"""
+
+
+TRAIT_BITS = {TraitClass: 1 << i for i, TraitClass in enumerate(ALL_TRAITS)}
+
+AMBUSH = TRAIT_BITS[AmbushTrait]
+BURROWING = TRAIT_BITS[BurrowingTrait]
+CLIMBING = TRAIT_BITS[ClimbingTrait]
+HARD_SHELL = TRAIT_BITS[HardShellTrait]
+HERDING = TRAIT_BITS[HerdingTrait]
+PACK_HUNTING = TRAIT_BITS[PackHuntingTrait]
+SYMBIOSIS = TRAIT_BITS[SymbiosisTrait]
+WARNING_CALL = TRAIT_BITS[WarningCallTrait]
+
+CARNIVORE = sum(TRAIT_BITS[TraitClass] for TraitClass in ALL_TRAITS
+                if TraitClass.is_carnivore)
+
+HARD_SHELL_MARGIN = 4
+
+
+def get_trait_mask(traits):
+    """gets the mask of a list of traits
+
+    :param traits: traits to encode
+    :type traits: list of Trait
+
+    :returns: mask with the bit of every trait's class set
+    :rtype: TraitMask
+    """
+
+    mask = 0
+
+    for trait in traits:
+        try:
+            mask |= TRAIT_BITS[trait.__class__]
+        except KeyError:
+            mask |= next(TRAIT_BITS[TraitClass] for TraitClass in ALL_TRAITS
+                         if isinstance(trait, TraitClass))
+
+    return mask
+
+
+def compile_species(species):
+    """compiles a species for attack evaluation
+
+    :param species: species to compile
+    :type species: Species or None
+
+    :returns: compiled species or None if there is no species
+    :rtype: CompiledSpecies or None
+    """
+
+    if species is None:
+        return None
+
+    return (get_trait_mask(species.traits), species.body_size,
+            species.population, species.food_supply)
+
+
+def compile_situation(situation):
+    """compiles every species of a situation
+
+    :param situation: situation to compile
+    :type situation: Situation
+
+    :returns: compiled defender, attacker, left neighbor and right neighbor
+    :rtype: tuple of (CompiledSpecies or None)
+    """
+
+    return tuple(compile_species(species) for species in situation)
+
+
+def is_attackable(defender, attacker, left_neighbor, right_neighbor):
+    """determines if the attacker can attack the defender, as
+    feeding.attack.is_attackable does for the uncompiled species
+
+    :param defender: defender
+    :type defender: CompiledSpecies
+
+    :param attacker: attacker
+    :type attacker: CompiledSpecies
+
+    :param left_neighbor: left neighbor of the defender
+    :type left_neighbor: CompiledSpecies or None
+
+    :param right_neighbor: right neighbor of the defender
+    :type right_neighbor: CompiledSpecies or None
+
+    :returns: whether defender is attackable by attacker
+    :rtype: bool
+    """
+
+    defender_mask, defender_body, defender_population, defender_food = defender
+    attacker_mask, attacker_body, attacker_population, _ = attacker
+
+    if not attacker_mask & CARNIVORE:
+        raise ValueError('attacker must be a carnivore')
+
+    if attacker_mask & PACK_HUNTING:
+        attacker_body += attacker_population
+
+    neighbor_mask = 0
+    if left_neighbor is not None:
+        neighbor_mask = left_neighbor[0]
+    if right_neighbor is not None:
+        neighbor_mask |= right_neighbor[0]
+
+    return not (
+        (defender_mask & BURROWING and
+         defender_food == defender_population) or
+        (defender_mask & CLIMBING and not attacker_mask & CLIMBING) or
+        (defender_mask & HARD_SHELL and
+         attacker_body - HARD_SHELL_MARGIN < defender_body) or
+        (defender_mask & HERDING and
+         attacker_population <= defender_population) or
+        (defender_mask & SYMBIOSIS and right_neighbor is not None and
+         right_neighbor[1] > defender_body) or
+        (neighbor_mask & WARNING_CALL and not attacker_mask & AMBUSH))
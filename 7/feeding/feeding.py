@@ -1,9 +1,8 @@
 from collections import namedtuple
 
-from feeding.attack import is_attackable
+from feeding.compiled import compile_species, is_attackable
 from feeding.player import BasePlayer
 from feeding.result import CarnivoreResult, FatTissueResult, VegetarianResult
-from feeding.situation import Situation
 from feeding.trait import FatTissueTrait
 
 
@@ -174,18 +173,6 @@ class Player(BasePlayer):
         :rtype: FatTissueResult or None
         """
 
-        def get_fat_tissue_food(species):
-            """gets the food stored on the fat tissue trait
-
-            :param species: species to get fat tissue need for
-            :type species: Species
-
-            :returns: fat food
-            :rtype: int
-            """
-
-            return species.get_trait(FatTissueTrait).get_fat_food()
-
         def get_fat_tissue_need(species):
             """gets the fat tissue need of the species
 
@@ -196,7 +183,7 @@ class Player(BasePlayer):
             :rtype: int
             """
 
-            return species.body_size - get_fat_tissue_food(species)
+            return species.body_size - species.fat_food
 
         selected_species = None
         need = None
@@ -291,12 +278,20 @@ class Player(BasePlayer):
             key=lambda species_opponent: species_opponent[0],
             reverse=True)
 
+        compiled_defenders = [
+            [compile_species(defender)] + [
+                compile_species(neighbor)
+                for neighbor in opponent.get_neighbors(defender)]
+            for defender, opponent in sorted_boards_opponents
+        ]
+
         for attacker in sorted_attacker_boards:
-            for defender, opponent in sorted_boards_opponents:
-                left, right = opponent.get_neighbors(defender)
-                situation = Situation(defender, attacker, left, right)
+            compiled_attacker = compile_species(attacker)
 
-                if is_attackable(situation):
+            for (defender, opponent), (compiled_defender, left, right) in zip(
+                    sorted_boards_opponents, compiled_defenders):
+                if is_attackable(
+                        compiled_defender, compiled_attacker, left, right):
                     attacker_index = self.boards.index(attacker)
                     opponent_index = opponents.index(opponent)
                     defender_index = opponent.boards.index(defender)
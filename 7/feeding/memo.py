@@ -0,0 +1,110 @@
+from collections import OrderedDict
+
+from feeding.attack import is_attackable
+
+
+"""
+A SituationKey is (SpeciesSnapshot, SpeciesSnapshot, SpeciesSnapshot or None,
+SpeciesSnapshot or None), the snapshots of the defender, attacker, left
+neighbor and right neighbor of a situation. situations with equal species
+have equal keys.
+"""
+
+
+def get_situation_key(situation):
+    """gets the key of a situation
+
+    :param situation: situation
+    :type situation: Situation
+
+    :returns: snapshot of every species in the situation
+    :rtype: SituationKey
+    """
+
+    return tuple(None if species is None else species.snapshot()
+                 for species in situation)
+
+
+class AttackCache:
+    """bounded cache of is_attackable results, evicting least recently used
+    entries
+
+    results are kept by the snapshots of a situation's species, and a
+    species keeps its snapshot until it is invalidated, so a species that
+    changed needs invalidate before it is looked up again
+
+    :attr hits: number of lookups answered from the cache
+    :type hits: int
+
+    :attr misses: number of lookups that called is_attackable
+    :type misses: int
+    """
+
+    DEFAULT_MAX_SIZE = 4096
+
+    def __init__(self, max_size=DEFAULT_MAX_SIZE):
+        """creates an AttackCache
+
+        :param max_size: maximum number of situations kept
+        :type max_size: int
+        """
+
+        if max_size < 1:
+            raise ValueError('max_size must be positive')
+
+        self._max_size = max_size
+        self._entries = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def is_attackable(self, situation):
+        """determines if the attacker in a situation can attack a defender,
+        reusing the result for an equal situation if there is one
+
+        :param situation: situation to evaluate
+        :type situation: Situation
+
+        :returns: whether defender is attackable by attacker
+        :rtype: bool
+        """
+
+        entries = self._entries
+        key = get_situation_key(situation)
+
+        try:
+            result = entries[key]
+        except KeyError:
+            self.misses += 1
+            result = entries[key] = is_attackable(situation)
+            if len(entries) > self._max_size:
+                entries.popitem(last=False)
+        else:
+            self.hits += 1
+            entries.move_to_end(key)
+
+        return result
+
+    def invalidate(self, species):
+        """forgets a species' snapshot and every result involving it, for
+        when the species was changed in place
+
+        :param species: species that changed
+        :type species: Species
+        """
+
+        stale = species.snapshot()
+        species.invalidate_snapshot()
+
+        for key in [key for key in self._entries if stale in key]:
+            del self._entries[key]
+
+    def clear(self):
+        """forgets every result and resets the counters"""
+
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
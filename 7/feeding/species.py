@@ -1,4 +1,6 @@
-rom feeding.trait import Trait, FatTissueTrait
+from collections import namedtuple
+
+from feeding.trait import Trait, FatTissueTrait
 
 
 """
@@ -26,6 +28,30 @@ A Natural is a JSON number interpretable as a natural number.
 """
 
 
+class SpeciesSnapshot(namedtuple(
+        'SpeciesSnapshot',
+        ['food_supply', 'body_size', 'population', 'traits', 'fat_food'])):
+    """represents an immutable, hashable copy of a species
+
+    equal species have equal snapshots, whatever the order of their traits
+
+    :attr food_supply: food supply of the species
+    :type food_supply: int
+
+    :attr body_size: body size of the species
+    :type body_size: int
+
+    :attr population: population of the species
+    :type population: int
+
+    :attr traits: sorted JSON names of the species' traits
+    :type traits: tuple of JSONTrait
+
+    :attr fat_food: food stored on the species' fat tissue
+    :type fat_food: int
+    """
+
+
 class Species:
     """represents a species board
 
@@ -41,14 +67,27 @@ class Species:
     :attr food_supply: current food supply of the species
     :type food_supply: int
 
+    :attr fat_food: food stored on the species' fat tissue
+    :type fat_food: int
+
+    the species keeps its last snapshot until it is invalidated, so a
+    species changed after a snapshot was taken needs invalidate_snapshot or
+    AttackCache.invalidate before its snapshot is used again
+
     :inv: MIN_BODY_SIZE <= body_size <= MAX_BODY_SIZE
     :inv: MIN_POPULATION <= population <= MAX_POPULATION
     :inv: MIN_NUM_TRAITS <= len(traits) <= MAX_NUM_TRAITS
     """
 
+    __slots__ = ('food_supply', 'body_size', 'population', 'traits',
+                 'fat_food', '_snapshot')
+
     MIN_FOOD_SUPPLY = 0
     MAX_FOOD_SUPPLY = float('inf')
 
+    MIN_FAT_FOOD = 0
+    MAX_FAT_FOOD = float('inf')
+
     MIN_NUM_TRAITS = 0
     MAX_NUM_TRAITS = 3
 
@@ -58,7 +97,8 @@ class Species:
     MIN_POPULATION = 0
     MAX_POPULATION = 7
 
-    def __init__(self, food_supply=0, body_size=0, population=1, traits=None):
+    def __init__(self, food_supply=0, body_size=0, population=1, traits=None,
+                 fat_food=0):
         """creates a Species
 
         :param food_supply: food supply
@@ -72,8 +112,13 @@ class Species:
 
         :param traits: traits
         :type traits: list of Trait
+
+        :param fat_food: food stored on fat tissue
+        :type fat_food: int
         """
 
+        self._snapshot = None
+
         self._check_within_bounds(
             food_supply, self.MIN_FOOD_SUPPLY, self.MAX_FOOD_SUPPLY,
             'food_supply')
@@ -102,11 +147,16 @@ class Species:
 
             self.traits = traits
 
+        self._check_within_bounds(
+            fat_food, self.MIN_FAT_FOOD, self.MAX_FAT_FOOD, 'fat_food')
+        self.fat_food = fat_food
+
     def __eq__(self, other):
         return (isinstance(other, self.__class__) and
                 self.food_supply == other.food_supply and
                 self.body_size == other.body_size and
                 self.population == other.population and
+                self.fat_food == other.fat_food and
                 sorted(self.traits) == sorted(other.traits))  # based on ids
 
     def __lt__(self, other):
@@ -166,21 +216,14 @@ class Species:
             if not fat_food_name == "fat-food":
                 raise ValueError('invalid key on fat food')
 
-            find_fat_tissue_trait = [
-                trait
-                for trait in traits
-                if isinstance(trait, FatTissueTrait)
-            ]
-
-            if find_fat_tissue_trait:
-                fat_tissue_trait = find_fat_tissue_trait[0]
-            else:
+            if not any(isinstance(trait, FatTissueTrait)
+                       for trait in traits):
                 raise ValueError('no fat tissue trait found on a species'
                                  'passing fat food')
+        else:
+            fat_food = 0
 
-            fat_tissue_trait.add_fat_food(fat_food)
-
-        return cls(food, body, population, traits)
+        return cls(food, body, population, traits, fat_food)
 
     def to_json(self):
         """creates a JSON representation of the species
@@ -196,10 +239,8 @@ class Species:
                    ["population", self.population],
                    ["traits", json_traits]]
 
-        fat_tissue_trait = self.get_trait(FatTissueTrait)
-        if (fat_tissue_trait is not None and
-                fat_tissue_trait.get_fat_food() > 0):
-            species.append(["fat-food", fat_tissue_trait.get_fat_food()])
+        if self.fat_food > 0 and self.has_trait(FatTissueTrait):
+            species.append(["fat-food", self.fat_food])
 
         return species
 
@@ -219,6 +260,27 @@ class Species:
         except StopIteration:
             return None
 
+    def snapshot(self):
+        """gets a snapshot of the species, reusing the last one taken if
+        the species has not changed since
+
+        :returns: snapshot
+        :rtype: SpeciesSnapshot
+        """
+
+        if self._snapshot is None:
+            self._snapshot = SpeciesSnapshot(
+                self.food_supply, self.body_size, self.population,
+                tuple(sorted(trait.json_name for trait in self.traits)),
+                self.fat_food)
+
+        return self._snapshot
+
+    def invalidate_snapshot(self):
+        """forgets the last snapshot taken, for when the species changed"""
+
+        self._snapshot = None
+
     @staticmethod
     def _check_within_bounds(value, min_value, max_value, value_type):
         """checks that a given value is not within the bounds
@@ -270,7 +332,7 @@ class Species:
 
         return (
             self.has_trait(FatTissueTrait) and
-            self.get_trait(FatTissueTrait).get_fat_food() < self.body_size)
+            self.fat_food < self.body_size)
 
     @property
     def max_food_supply(self):
@@ -298,15 +360,23 @@ class Species:
         return any(trait.prevents_attack(situation, role)
                    for trait in self.traits)
 
-    def apply_traits(self, role):
-        """applies trait modifications based on a given role
+    def get_body_size(self, role):
+        """gets the body size of the species in a role, including the body
+        size its traits add
 
         :param role: role of the species in the situation
         :type role: Role
+
+        :returns: effective body size
+        :rtype: int
         """
 
+        body_size = self.body_size
+
         for trait in self.traits:
-            trait.modify(self, role)
+            body_size += trait.get_body_size_bonus(self, role)
+
+        return body_size
 
     def copy(self):
         """makes a copy of itself
@@ -319,5 +389,103 @@ class Species:
         body_size = self.body_size
         population = self.population
         traits = [t for t in self.traits]
+        fat_food = self.fat_food
+
+        return Species(food_supply, body_size, population, traits, fat_food)
+
+
+class RoleView:
+    """represents a species as it takes part in a situation
+
+    the view computes the species' body size in its role once, when it is
+    made, and reads every other stat from the species when asked for it, so
+    it never copies the species; it is meant to last for one evaluation
+
+    :attr species: species seen
+    :type species: Species
+
+    :attr role: role of the species in the situation
+    :type role: Role
+
+    :attr body_size: body size of the species in its role
+    :type body_size: int
+    """
+
+    __slots__ = ('species', 'role', 'body_size')
+
+    def __init__(self, species, role):
+        """creates a RoleView
+
+        :param species: species seen
+        :type species: Species
+
+        :param role: role of the species in the situation
+        :type role: Role
+        """
+
+        self.species = species
+        self.role = role
+        self.body_size = species.get_body_size(role)
+
+    @property
+    def food_supply(self):
+        """food supply of the species
+
+        :returns: food supply
+        :rtype: int
+        """
+
+        return self.species.food_supply
+
+    @property
+    def population(self):
+        """population of the species
+
+        :returns: population
+        :rtype: int
+        """
+
+        return self.species.population
+
+    @property
+    def traits(self):
+        """traits of the species
+
+        :returns: traits
+        :rtype: list of Trait
+        """
+
+        return self.species.traits
+
+    def get_trait(self, TraitClass):
+        """gets the first trait of the species of a class
+
+        :param TraitClass: trait to find
+        :type TraitClass: class Trait
+
+        :returns: first trait found or None if not found
+        :rtype: Trait or None
+        """
+
+        return self.species.get_trait(TraitClass)
+
+    def has_trait(self, TraitClass):
+        """whether the species has the given trait
+
+        :param TraitClass: trait to check
+        :type TraitClass: class inheriting from Trait
+
+        :returns: whether the species has the given trait
+        :rtype: bool
+        """
+
+        return self.species.has_trait(TraitClass)
+
+    def is_carnivore(self):
+        """whether the species is a carnivore
+
+        :returns: whether the species is a carnivore
+        :rtype: bool
+        """
 
-        return Species(food_supply, body_size, population, traits)
+        return self.species.is_carnivore()
@@ -1,9 +1,10 @@
 import pytest
 
 from feeding.attack import is_attackable
+from feeding.role import Role
 from feeding.trait import *
 from feeding.situation import Situation
-from feeding.species import Species
+from feeding.species import RoleView, Species
 
 
 def test_not_carnivore():
@@ -148,3 +149,36 @@ def test_warning_call():
     right_neighbor = Species(traits=[WarningCallTrait()])
     assert not is_attackable(
         Situation(defender, attacker, None, right_neighbor))
+
+
+def test_role_view():
+    """tests that a role view reads the stats of its species in its role"""
+
+    species = Species(1, 2, 3, [PackHuntingTrait(), CarnivoreTrait()])
+    attacker = RoleView(species, Role.attacker)
+    defender = RoleView(species, Role.defender)
+
+    assert (attacker.food_supply, attacker.body_size, attacker.population) \
+        == (1, 5, 3)
+    assert defender.body_size == 2
+    assert attacker.is_carnivore() and attacker.has_trait(PackHuntingTrait)
+
+    species.population = 4
+    assert attacker.population == 4
+    assert RoleView(species, Role.attacker).body_size == 6
+
+
+def test_species_unchanged(monkeypatch):
+    """tests that is_attackable neither copies nor changes the species"""
+
+    def fail(self):
+        raise AssertionError('species copied')
+
+    monkeypatch.setattr(Species, 'copy', fail)
+
+    defender = Species(body_size=4, traits=[HardShellTrait()])
+    attacker = Species(body_size=2, population=6,
+                       traits=[CarnivoreTrait(), PackHuntingTrait()])
+    assert is_attackable(Situation(defender, attacker, None, None))
+
+    assert (attacker.body_size, defender.body_size) == (2, 4)
@@ -0,0 +1,95 @@
+import random
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from feeding import batch, compiled
+from feeding.attack import is_attackable
+from feeding.situation import Situation
+from feeding.species import Species
+from feeding.test.test_compiled import (load_corpus_situations,
+                                        random_situation)
+from feeding.trait import *
+
+
+def test_corpora():
+    """tests that the batch engine matches 5/test"""
+
+    situations, expected = zip(*load_corpus_situations())
+
+    result = batch.is_attackable(*batch.compile_situations(situations))
+
+    assert result.dtype == bool
+    assert result.tolist() == list(expected)
+
+
+def test_random_situations():
+    """tests that the batch engine matches is_attackable on random
+    situations"""
+
+    rand = random.Random(0)
+    situations = [random_situation(rand) for _ in range(5000)]
+
+    result = batch.is_attackable(*batch.compile_situations(situations))
+
+    assert result.tolist() == [is_attackable(situation)
+                               for situation in situations]
+
+
+def test_missing_neighbors():
+    """tests that absent neighbors are ignored whatever their columns hold"""
+
+    defender = compiled.compile_species(
+        Species(body_size=1, traits=[SymbiosisTrait()]))
+    attacker = compiled.compile_species(
+        Species(body_size=1, traits=[CarnivoreTrait()]))
+    warner = (compiled.WARNING_CALL, 7, 1, 0)
+
+    defenders = batch.SpeciesColumns.from_compiled([defender] * 3)
+    attackers = batch.SpeciesColumns.from_compiled([attacker] * 3)
+    lefts = batch.SpeciesColumns(*zip(warner, warner, warner),
+                                 present=[False, False, True])
+    rights = batch.SpeciesColumns(*zip(warner, warner, warner),
+                                  present=[False, True, False])
+
+    result = batch.is_attackable(defenders, attackers, lefts, rights)
+
+    assert result.tolist() == [True, False, False]
+
+
+def test_empty():
+    """tests that no situations give an empty result"""
+
+    result = batch.is_attackable(*batch.compile_situations([]))
+
+    assert result.shape == (0,)
+
+
+def test_not_carnivore():
+    """tests that an error is raised when an attacker is not a carnivore"""
+
+    situations = batch.compile_situations([
+        Situation(Species(), Species(traits=[CarnivoreTrait()]), None, None),
+        Situation(Species(), Species(traits=[AmbushTrait()]), None, None)])
+
+    with pytest.raises(ValueError):
+        batch.is_attackable(*situations)
+
+
+def test_invalid_columns():
+    """tests that errors are raised for mismatched columns and roles"""
+
+    with pytest.raises(ValueError):
+        batch.SpeciesColumns([0, 0], [0, 0], [0], [0, 0])
+
+    defenders, attackers, lefts, rights = batch.compile_situations([
+        Situation(Species(), Species(traits=[CarnivoreTrait()]), None, None)])
+    two = batch.SpeciesColumns.from_compiled([None, None])
+
+    with pytest.raises(ValueError):
+        batch.is_attackable(defenders, attackers, two, rights)
+
+    with pytest.raises(ValueError):
+        batch.is_attackable(defenders, attackers._replace(
+            present=np.zeros(1, dtype=bool)), lefts, rights)
@@ -0,0 +1,149 @@
+import glob
+import json
+import os
+import random
+
+import pytest
+
+from feeding import compiled
+from feeding.attack import is_attackable
+from feeding.feeding import Feeding, get_feeding_result
+from feeding.situation import Situation
+from feeding.species import Species
+from feeding.trait import *
+
+PATH_TO_CORPORA = '../../../5/test/'
+CORPORA = os.path.join(os.path.dirname(__file__), PATH_TO_CORPORA)
+FEEDINGS = os.path.join(os.path.dirname(__file__), 'json')
+
+
+def load_corpus_situations():
+    """loads the xattack inputs of 5/test with their expected outputs
+
+    their situations list the attacker before the defender
+
+    :returns: situation and expected output of every input the Species
+              constructor accepts
+    :rtype: list of (Situation, bool)
+    """
+
+    cases = []
+
+    for in_path in sorted(glob.glob(os.path.join(CORPORA, '*', '*-in.json'))):
+        with open(in_path) as f:
+            json_attacker, json_defender, *json_neighbors = json.load(f)
+
+        with open(in_path.replace('-in.json', '-out.json')) as f:
+            expected = json.load(f)
+
+        try:
+            situation = Situation.from_json(
+                [json_defender, json_attacker] + json_neighbors)
+        except ValueError:
+            continue
+
+        cases.append((situation, expected))
+
+    return cases
+
+
+def random_situation(rand):
+    """makes a random situation with a carnivore attacker
+
+    :param rand: random number generator
+    :type rand: random.Random
+
+    :returns: situation
+    :rtype: Situation
+    """
+
+    def random_species(carnivore=False):
+        traits = rand.sample(ALL_TRAITS, rand.randint(0, 3))
+        if carnivore and CarnivoreTrait not in traits:
+            traits.append(CarnivoreTrait)
+
+        return Species(food_supply=rand.randint(0, 7),
+                       body_size=rand.randint(0, 7),
+                       population=rand.randint(0, 7),
+                       traits=[TraitClass() for TraitClass in traits])
+
+    left = random_species() if rand.random() < 0.7 else None
+    right = random_species() if rand.random() < 0.7 else None
+
+    return Situation(random_species(), random_species(True), left, right)
+
+
+def test_corpora():
+    """tests that the compiled engine matches is_attackable on 5/test"""
+
+    cases = load_corpus_situations()
+    assert len(cases) >= 20
+
+    for situation, expected in cases:
+        assert is_attackable(situation) == expected
+        assert compiled.is_attackable(
+            *compiled.compile_situation(situation)) == expected
+
+
+def test_feeding_fixtures():
+    """tests that the compiled engine, which get_feeding_result uses to pick
+    a carnivore's prey, matches is_attackable on the feeding fixtures"""
+
+    num_pairs = 0
+
+    for in_path in sorted(glob.glob(os.path.join(FEEDINGS, '*-in.json'))):
+        with open(in_path) as f:
+            feeding = Feeding.from_json(json.load(f))
+
+        with open(in_path.replace('-in.json', '-out.json')) as f:
+            assert get_feeding_result(feeding).to_json() == json.load(f)
+
+        attackers = [species for species in feeding.player.boards
+                     if species.is_carnivore()]
+
+        for opponent in feeding.opponents:
+            for defender in opponent.boards:
+                left, right = opponent.get_neighbors(defender)
+
+                for attacker in attackers:
+                    situation = Situation(defender, attacker, left, right)
+                    assert compiled.is_attackable(
+                        *compiled.compile_situation(situation)) == (
+                            is_attackable(situation))
+                    num_pairs += 1
+
+    assert num_pairs > 0
+
+
+def test_random_situations():
+    """tests that the compiled engine matches is_attackable on random
+    situations"""
+
+    rand = random.Random(0)
+
+    for _ in range(5000):
+        situation = random_situation(rand)
+        assert compiled.is_attackable(
+            *compiled.compile_situation(situation)) == is_attackable(situation)
+
+
+def test_not_carnivore():
+    """tests that an error is raised when the attacker is not a carnivore"""
+
+    situation = compiled.compile_situation(
+        Situation(Species(), Species(traits=[AmbushTrait()]), None, None))
+
+    with pytest.raises(ValueError):
+        compiled.is_attackable(*situation)
+
+
+def test_get_trait_mask():
+    """tests get_trait_mask"""
+
+    assert compiled.get_trait_mask([]) == 0
+    assert compiled.get_trait_mask([CarnivoreTrait()]) == compiled.CARNIVORE
+    assert compiled.get_trait_mask(
+        [ClimbingTrait(), HerdingTrait()]) == (
+            compiled.CLIMBING | compiled.HERDING)
+    assert compiled.get_trait_mask([FatTissueTrait()]) == (
+        compiled.TRAIT_BITS[FatTissueTrait])
@@ -252,7 +252,8 @@ def test_fat_tissue_single():
         food_supply=1,
         body_size=2,
         population=2,
-        traits=[FatTissueTrait(fat_food=0)])
+        traits=[FatTissueTrait()],
+        fat_food=0)
 
     my_species = [
         selected_species,
@@ -264,7 +265,7 @@ def test_fat_tissue_single():
 
     me = Player(player_id=1, boards=my_species, food_bag=2)
     expected_tokens = (selected_species.body_size -
-                       selected_species.traits[0].get_fat_food())
+                       selected_species.fat_food)
 
     watering_hole_tokens = 10
     opponents = [
@@ -304,7 +305,8 @@ def test_fat_tissue_full_vegetarian():
         food_supply=1,
         body_size=2,
         population=2,
-        traits=[FatTissueTrait(fat_food=2)])
+        traits=[FatTissueTrait()],
+        fat_food=2)
 
     my_species = [
         selected_species,
@@ -354,7 +356,8 @@ def test_fat_tissue_full_carnivore():
         food_supply=1,
         body_size=2,
         population=4,
-        traits=[FatTissueTrait(fat_food=2), CarnivoreTrait()])
+        traits=[FatTissueTrait(), CarnivoreTrait()],
+        fat_food=2)
 
     my_species = [
         attacking_species,
@@ -415,7 +418,8 @@ def test_hungry_carnivore_over_not_hungry_fat_tissue():
             food_supply=2,
             body_size=2,
             population=2,
-            traits=[FatTissueTrait(fat_food=2)]),
+            traits=[FatTissueTrait()],
+            fat_food=2),
         attacking_species,
     ]
 
@@ -467,7 +471,8 @@ def test_fat_tissue_nonzero_fat():
         food_supply=1,
         body_size=2,
         population=2,
-        traits=[FatTissueTrait(fat_food=1)])
+        traits=[FatTissueTrait()],
+        fat_food=1)
 
     my_species = [
         selected_species,
@@ -479,7 +484,7 @@ def test_fat_tissue_nonzero_fat():
     ]
     me = Player(player_id=1, boards=my_species, food_bag=2)
     expected_tokens = (selected_species.body_size -
-                       selected_species.traits[0].get_fat_food())
+                       selected_species.fat_food)
 
     watering_hole_tokens = 10
     opponents = [
@@ -519,7 +524,8 @@ def test_fat_tissue_max_watering_hole():
         food_supply=1,
         body_size=6,
         population=2,
-        traits=[FatTissueTrait(fat_food=2)])
+        traits=[FatTissueTrait()],
+        fat_food=2)
 
     my_species = [
         selected_species,
@@ -533,7 +539,7 @@ def test_fat_tissue_max_watering_hole():
 
     watering_hole_tokens = 2
     expected_tokens = min((selected_species.body_size -
-                           selected_species.traits[0].get_fat_food()),
+                           selected_species.fat_food),
                           watering_hole_tokens)
 
     opponents = [
@@ -575,14 +581,16 @@ def test_fat_tissue_multiple():
         food_supply=1,
         body_size=2,
         population=2,
-        traits=[FatTissueTrait(fat_food=0)])
+        traits=[FatTissueTrait()],
+        fat_food=0)
 
     my_species = [
         Species(
             food_supply=1,
             body_size=5,
             population=2,
-            traits=[FatTissueTrait(fat_food=4)]),
+            traits=[FatTissueTrait()],
+            fat_food=4),
         selected_species
     ]
 
@@ -590,7 +598,7 @@ def test_fat_tissue_multiple():
 
     watering_hole_tokens = 10
     expected_tokens = (selected_species.body_size -
-                       selected_species.traits[0].get_fat_food())
+                       selected_species.fat_food)
 
     opponents = [
         Player(
@@ -629,14 +637,16 @@ def test_fat_tissue_need_tie():
         food_supply=1,
         body_size=3,
         population=2,
-        traits=[FatTissueTrait(fat_food=1)])
+        traits=[FatTissueTrait()],
+        fat_food=1)
 
     my_species = [
         Species(
             food_supply=1,
             body_size=2,
             population=2,
-            traits=[FatTissueTrait(fat_food=1)]),
+            traits=[FatTissueTrait()],
+            fat_food=1),
         selected_species,
     ]
 
@@ -644,7 +654,7 @@ def test_fat_tissue_need_tie():
 
     watering_hole_tokens = 10
     expected_tokens = (selected_species.body_size -
-                       selected_species.traits[0].get_fat_food())
+                       selected_species.fat_food)
 
     opponents = [
         Player(
@@ -683,14 +693,16 @@ def test_fat_tissue_ordering_tie():
         food_supply=1,
         body_size=2,
         population=2,
-        traits=[FatTissueTrait(fat_food=1)])
+        traits=[FatTissueTrait()],
+        fat_food=1)
 
     my_species = [
         Species(
             food_supply=1,
             body_size=2,
             population=2,
-            traits=[FatTissueTrait(fat_food=1)]),
+            traits=[FatTissueTrait()],
+            fat_food=1),
         selected_species,
     ]
 
@@ -698,7 +710,7 @@ def test_fat_tissue_ordering_tie():
 
     watering_hole_tokens = 10
     expected_tokens = (selected_species.body_size -
-                       selected_species.traits[0].get_fat_food())
+                       selected_species.fat_food)
 
     opponents = [
         Player(
@@ -0,0 +1,132 @@
+import random
+
+import pytest
+
+from feeding.attack import is_attackable
+from feeding.memo import AttackCache, get_situation_key
+from feeding.situation import Situation
+from feeding.species import Species, SpeciesSnapshot
+from feeding.test.test_compiled import random_situation
+from feeding.trait import *
+
+
+def make_situation():
+    """makes a situation where the defender can be attacked
+
+    :returns: situation
+    :rtype: Situation
+    """
+
+    defender = Species(body_size=2, traits=[HardShellTrait()])
+    attacker = Species(body_size=7, traits=[CarnivoreTrait()])
+
+    return Situation(defender, attacker, None, Species())
+
+
+def test_snapshot():
+    """tests that equal species have equal, hashable snapshots"""
+
+    species = Species(1, 2, 3, [HerdingTrait(), FatTissueTrait()], 2)
+    other = Species(1, 2, 3, [FatTissueTrait(), HerdingTrait()], 2)
+
+    assert species.snapshot() == other.snapshot() == SpeciesSnapshot(
+        1, 2, 3, ('fat-tissue', 'herding'), 2)
+    assert hash(species.snapshot()) == hash(other.snapshot())
+    assert species.snapshot() is species.snapshot()
+
+    other.fat_food = 1
+    other.invalidate_snapshot()
+    assert other.snapshot() != species.snapshot()
+
+
+def test_snapshot_invalidation():
+    """tests that a snapshot is kept until it is invalidated"""
+
+    species = Species(traits=[ClimbingTrait()])
+    snapshot = species.snapshot()
+
+    species.population += 1
+    species.traits.append(AmbushTrait())
+    assert species.snapshot() is snapshot
+
+    species.invalidate_snapshot()
+    assert species.snapshot().population == snapshot.population + 1
+    assert species.snapshot().traits == ('ambush', 'climbing')
+
+
+def test_hits_and_misses():
+    """tests that equal situations are answered from the cache"""
+
+    cache = AttackCache()
+
+    assert cache.is_attackable(make_situation()) is True
+    assert cache.is_attackable(make_situation()) is True
+    assert (cache.hits, cache.misses, len(cache)) == (1, 1, 1)
+
+    situation = make_situation()
+    situation.attacker.body_size = 5
+    assert cache.is_attackable(situation) is False
+    assert (cache.hits, cache.misses, len(cache)) == (1, 2, 2)
+
+    cache.clear()
+    assert (cache.hits, cache.misses, len(cache)) == (0, 0, 0)
+
+
+def test_invalidate():
+    """tests that results of a species changed in place are forgotten"""
+
+    cache = AttackCache()
+    situation = make_situation()
+    assert cache.is_attackable(situation) is True
+
+    situation.right_neighbor.traits.append(WarningCallTrait())
+    assert cache.is_attackable(situation) is True
+
+    cache.invalidate(situation.right_neighbor)
+    assert len(cache) == 0
+    assert cache.is_attackable(situation) is False
+
+
+def test_eviction():
+    """tests that the least recently used situation is evicted"""
+
+    cache = AttackCache(max_size=2)
+    situations = [make_situation() for _ in range(3)]
+    for body_size, situation in enumerate(situations):
+        situation.defender.body_size = body_size
+
+    cache.is_attackable(situations[0])
+    cache.is_attackable(situations[1])
+    cache.is_attackable(situations[0])
+    cache.is_attackable(situations[2])
+
+    keys = [get_situation_key(situation) for situation in situations]
+    assert list(cache._entries) == [keys[0], keys[2]]
+
+    with pytest.raises(ValueError):
+        AttackCache(max_size=0)
+
+
+def test_random_situations():
+    """tests that cached results match is_attackable"""
+
+    rand = random.Random(0)
+    situations = [random_situation(rand) for _ in range(500)]
+    cache = AttackCache(max_size=100)
+
+    for situation in situations * 2:
+        assert cache.is_attackable(situation) == is_attackable(situation)
+
+    assert cache.hits + cache.misses == 1000
+
+
+def test_not_carnivore():
+    """tests that an error is raised and nothing is cached when the attacker
+    is not a carnivore"""
+
+    cache = AttackCache()
+
+    with pytest.raises(ValueError):
+        cache.is_attackable(Situation(Species(), Species(), None, None))
+
+    assert len(cache) == 0
@@ -0,0 +1,77 @@
+import sys
+
+import pytest
+
+from feeding.species import Species
+from feeding.trait import *
+
+
+def test_slots():
+    """tests that species and traits keep no instance dictionary"""
+
+    species = Species(traits=[CarnivoreTrait(), FatTissueTrait()])
+
+    assert not hasattr(species, '__dict__')
+    assert not any(hasattr(trait, '__dict__') for trait in species.traits)
+
+    with pytest.raises(AttributeError):
+        species.size = 3
+
+
+def test_size():
+    """tests that a species takes several times less memory than the same
+    attributes kept in an instance dictionary"""
+
+    class DictSpecies:
+        def __init__(self, species):
+            self.food_supply = species.food_supply
+            self.body_size = species.body_size
+            self.population = species.population
+            self.traits = species.traits
+            self.fat_food = species.fat_food
+            self._snapshot = None
+
+    species = Species(1, 2, 3, [CarnivoreTrait(), FatTissueTrait()], 2)
+    plain = DictSpecies(species)
+
+    assert 3 * sys.getsizeof(species) <= (
+        sys.getsizeof(plain) + sys.getsizeof(plain.__dict__))
+
+
+def test_shared_traits():
+    """tests that traits with the default tokens are shared"""
+
+    for TraitClass in ALL_TRAITS:
+        assert TraitClass() is TraitClass()
+        assert Trait.from_json(TraitClass.json_name) is TraitClass()
+
+    trait = CarnivoreTrait(2)
+    assert trait is not CarnivoreTrait()
+    assert trait.tokens == 2 and CarnivoreTrait().tokens == 0
+
+    with pytest.raises(ValueError):
+        Trait.from_json('wings')
+
+
+def test_fat_food():
+    """tests that fat food is kept on the species"""
+
+    json_species = [["food", 1], ["body", 3], ["population", 2],
+                    ["traits", ["fat-tissue"]], ["fat-food", 2]]
+
+    species = Species.from_json(json_species)
+    assert species.fat_food == 2
+    assert species.to_json() == json_species
+    assert species.copy() == species
+
+    other = Species.from_json(json_species[:4])
+    assert other.fat_food == 0
+    assert other != species
+    assert other.traits[0] is species.traits[0]
+
+    with pytest.raises(ValueError):
+        Species.from_json([["food", 1], ["body", 3], ["population", 2],
+                           ["traits", []], ["fat-food", 2]])
+
+    with pytest.raises(ValueError):
+        Species(traits=[FatTissueTrait()], fat_food=-1)
@@ -31,8 +31,15 @@ class Trait:
 
     :attr tokens: number of tokens
     :type tokens: int
+
+    traits with the default number of tokens are shared between species,
+    one instance per trait class, so they must not be changed
     """
 
+    __slots__ = ('tokens',)
+
+    DEFAULT_TOKENS = 0
+
     CARNIVORE_MIN_TOKENS = -8
     CARNIVORE_MAX_TOKENS = 8
 
@@ -41,7 +48,26 @@ class Trait:
 
     is_carnivore = False
 
-    def __init__(self, tokens=0):
+    _shared = {}
+
+    def __new__(cls, tokens=DEFAULT_TOKENS):
+        """gets the shared trait of the class if it has the default number of
+        tokens, or a new trait otherwise
+
+        :param tokens: number of tokens
+        :type tokens: int
+        """
+
+        if tokens != cls.DEFAULT_TOKENS:
+            return super().__new__(cls)
+
+        try:
+            return cls._shared[cls]
+        except KeyError:
+            trait = cls._shared[cls] = super().__new__(cls)
+            return trait
+
+    def __init__(self, tokens=DEFAULT_TOKENS):
         """creates a trait type
 
         :param ttype: type of the trait
@@ -86,10 +112,8 @@ class Trait:
         :rtype: Trait
         """
 
-        trait_name_to_class = {tc.json_name: tc for tc in ALL_TRAITS}
-
         try:
-            TraitClass = trait_name_to_class[json_trait]
+            TraitClass = TRAITS_BY_JSON_NAME[json_trait]
         except KeyError:
             raise ValueError("Unknown JSON trait name")
 
@@ -105,23 +129,23 @@ class Trait:
         return self.json_name
 
     @staticmethod
-    def modify(species, role):
-        """modifies the species
+    def get_body_size_bonus(species, role):
+        """gets the body size the trait adds to its species in a role
 
         to be overwritten by the inheriting class
-        default behavior is to not modify the species
+        default behavior is to add nothing
 
-        :param species: species to modify
+        :param species: species with the trait
         :type species: Species
 
         :param role: role of the species in the situation
         :type role: Role
 
-        :returns: modified species
-        :rtype: Species
+        :returns: body size added
+        :rtype: int
         """
 
-        return species
+        return 0
 
     @staticmethod
     def prevents_attack(situation, role):
@@ -149,6 +173,8 @@ class AmbushTrait(Trait):
     Ambush overcomes a Warning Call during an attack
     """
 
+    __slots__ = ()
+
     json_name = 'ambush'
 
 
@@ -159,6 +185,8 @@ class BurrowingTrait(Trait):
     its population size
     """
 
+    __slots__ = ()
+
     json_name = 'burrowing'
 
     @staticmethod
@@ -174,6 +202,8 @@ class CarnivoreTrait(Trait):
     Carnivore must attack to eat during the feeding stage.
     """
 
+    __slots__ = ()
+
     json_name = 'carnivore'
     is_carnivore = True
 
@@ -185,6 +215,8 @@ class ClimbingTrait(Trait):
     attribute.
     """
 
+    __slots__ = ()
+
     json_name = 'climbing'
 
     @staticmethod
@@ -203,6 +235,8 @@ class CooperationTrait(Trait):
     hole).
     """
 
+    __slots__ = ()
+
     json_name = 'cooperation'
 
 
@@ -210,28 +244,12 @@ class FatTissueTrait(Trait):
     """implements a Fat Tissue trait
 
     Fat Tissue allows a species to store as many food tokens as its body-size
-    count.
+    count. the stored food is kept on the species, as Species.fat_food
     """
 
-    json_name = 'fat-tissue'
-
-    DEFAULT_FAT_FOOD = 0
-
-    def __init__(self, fat_food=DEFAULT_FAT_FOOD):
-        super().__init__()
-        self._fat_food = fat_food
-
-    def __eq__(self, other):
-        return super().__eq__(other) and self._fat_food == other._fat_food
+    __slots__ = ()
 
-    def get_fat_food(self):
-        return self._fat_food
-
-    def add_fat_food(self, tokens):
-        self._fat_food += tokens
-
-    def reset_fat_food(self):
-        self._fat_food = DEFAULT_FAT_FOOD
+    json_name = 'fat-tissue'
 
 
 class FertileTrait(Trait):
@@ -241,6 +259,8 @@ class FertileTrait(Trait):
     are revealed.
     """
 
+    __slots__ = ()
+
     json_name = 'fertile'
 
 
@@ -250,6 +270,8 @@ class ForagingTrait(Trait):
     Foraging enables this species to eat two tokens of food for every feeding.
     """
 
+    __slots__ = ()
+
     json_name = 'foraging'
 
 
@@ -260,6 +282,8 @@ class HardShellTrait(Trait):
     larger than this species in body size.
     """
 
+    __slots__ = ()
+
     json_name = 'hard-shell'
 
     @staticmethod
@@ -276,6 +300,8 @@ class HerdingTrait(Trait):
     or equal in size to this species’ population.
     """
 
+    __slots__ = ()
+
     json_name = 'herding'
 
     @staticmethod
@@ -292,6 +318,8 @@ class HornsTrait(Trait):
     is completed.
     """
 
+    __slots__ = ()
+
     json_name = 'horns'
 
 
@@ -302,6 +330,8 @@ class LongNeckTrait(Trait):
     the food cards are revealed.
     """
 
+    __slots__ = ()
+
     json_name = 'long-neck'
 
 
@@ -312,13 +342,15 @@ class PackHuntingTrait(Trait):
     attacks on other species.
     """
 
+    __slots__ = ()
+
     json_name = 'pack-hunting'
 
     @staticmethod
-    def modify(species, role):
+    def get_body_size_bonus(species, role):
         if role is Role.attacker:
-            species.body_size += species.population
-        return species
+            return species.population
+        return 0
 
 
 class ScavengerTrait(Trait):
@@ -328,6 +360,8 @@ class ScavengerTrait(Trait):
     another species.
     """
 
+    __slots__ = ()
+
     json_name = 'scavenger'
 
 
@@ -338,6 +372,8 @@ class SymbiosisTrait(Trait):
     whose body size is larger than this one’s.
     """
 
+    __slots__ = ()
+
     json_name = 'symbiosis'
 
     @staticmethod
@@ -356,6 +392,8 @@ class WarningCallTrait(Trait):
     species unless the attacker has the Ambush property.
     """
 
+    __slots__ = ()
+
     json_name = 'warning-call'
 
     @staticmethod
@@ -392,3 +430,6 @@ ALL_TRAITS = [
     SymbiosisTrait,
     WarningCallTrait,
 ]
+
+TRAITS_BY_JSON_NAME = {TraitClass.json_name: TraitClass
+                       for TraitClass in ALL_TRAITS}
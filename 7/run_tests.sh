@@ -1,7 +1,7 @@
 #!/bin/sh
 virtualenv -p python3 lvs-vignesh-venv
 . lvs-vignesh-venv/bin/activate
-pip install pytest
+pip install pytest numpy
 py.test feeding/
 # deactivate
 # rm -r ./lvs-vignesh-venv